@@ -0,0 +1,77 @@
+import gc
+import time
+from dataclasses import make_dataclass
+from typing import List, Type, Optional, Dict
+
+from py_typescript_generator.model.model import Model
+from py_typescript_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py_typescript_generator.model_parser.model_parser import (
+    ModelParser,
+    ModelParserSettings,
+)
+from py_typescript_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+)
+
+CLASS_COUNT = 10_000
+CACHE_SIZES = [0, 16, 4096]
+REPETITIONS = 3
+
+# few distinct annotations used by fields with different names, so the fields
+# themselves are not shared between classes
+FIELD_TYPES = [
+    int,
+    str,
+    Optional[str],
+    List[str],
+    Dict[str, Optional[int]],
+    Optional[List[Dict[str, float]]],
+]
+
+
+def create_classes(count: int) -> List[Type]:
+    return [
+        make_dataclass(
+            f"GeneratedClass{i}",
+            [
+                (f"field_{i}_{j}", field_type)
+                for j, field_type in enumerate(FIELD_TYPES)
+            ],
+        )
+        for i in range(count)
+    ]
+
+
+def measure(model: Model, cache_size: int) -> None:
+    # the best of several runs, so garbage of earlier runs does not skew the numbers
+    duration = None
+    for _ in range(REPETITIONS):
+        gc.collect()
+        compiler = TypescriptModelCompiler(
+            TypescriptModelCompilerSettings(compile_cache_size=cache_size)
+        )
+        start = time.perf_counter()
+        compiler.compile(model)
+        run_duration = time.perf_counter() - start
+        duration = run_duration if duration is None else min(duration, run_duration)
+    lookups = compiler.compile_cache_hits + compiler.compile_cache_misses
+    print(
+        f"{cache_size:>10} {duration:>10.3f} "
+        f"{compiler.compile_cache_hits / lookups:>10.1%}"
+    )
+
+
+def main() -> None:
+    model = ModelParser(
+        create_classes(CLASS_COUNT), [DataclassParser()], ModelParserSettings()
+    ).parse()
+    print(f"{'cache size':>10} {'compile [s]':>10} {'hit rate':>10}")
+    for cache_size in CACHE_SIZES:
+        measure(model, cache_size)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import time
+from dataclasses import make_dataclass, dataclass
+from typing import List, Type, Generic, TypeVar, Optional
+
+from py_typescript_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py_typescript_generator.model_parser.model_parser import (
+    ModelParser,
+    ModelParserSettings,
+)
+from py_typescript_generator.typescript_emitter.typescript_emitter import (
+    TypescriptEmitter,
+)
+from py_typescript_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+)
+
+INSTANTIATION_COUNTS = [10, 100, 1_000, 10_000]
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T]
+    total: int
+    next_page: Optional[int]
+
+
+@dataclass
+class Envelope(Generic[T]):
+    payload: T
+    trace_id: str
+
+
+def create_classes(count: int) -> List[Type]:
+    # every holder references its own instantiations of Page and Envelope
+    holders = []
+    for i in range(count):
+        item = make_dataclass(f"Item{i}", [("value", int)])
+        holders.append(
+            make_dataclass(
+                f"Holder{i}",
+                [
+                    ("page", Page[item]),  # type: ignore
+                    ("envelope", Envelope[Page[item]]),  # type: ignore
+                ],
+            )
+        )
+    return holders
+
+
+def main() -> None:
+    print(
+        f"{'instantiations':>15} {'total [s]':>10} {'per use [us]':>13} "
+        f"{'Page declarations':>18} {'bytes per use':>14}"
+    )
+    for count in INSTANTIATION_COUNTS:
+        classes = create_classes(count)
+        start = time.perf_counter()
+        model = ModelParser(classes, [DataclassParser()], ModelParserSettings()).parse()
+        ts_model = TypescriptModelCompiler(TypescriptModelCompilerSettings()).compile(
+            model
+        )
+        output = TypescriptEmitter().emit(ts_model)
+        duration = time.perf_counter() - start
+        uses = count * 3
+        print(
+            f"{uses:>15} {duration:>10.3f} {duration / uses * 1_000_000:>13.1f} "
+            f"{output.count('interface Page<'):>18} {len(output) / uses:>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
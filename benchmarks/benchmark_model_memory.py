@@ -0,0 +1,55 @@
+import tracemalloc
+from typing import List, Optional
+
+from ordered_set import OrderedSet
+
+from py_typescript_generator.model.model import Model
+from py_typescript_generator.model.py_class import PyClass, TaggedUnionInformation
+from py_typescript_generator.model.py_field import PyField
+
+CLASS_COUNT = 10_000
+FIELDS_PER_CLASS = 30
+FIELD_NAMES = [f"field_name_{i}" for i in range(FIELDS_PER_CLASS)]
+
+
+def copy_str(value: str) -> str:
+    # names read from files (like the parse cache) are new string objects
+    return "".join(list(value))
+
+
+def create_model() -> Model:
+    classes: List[PyClass] = []
+    for i in range(CLASS_COUNT):
+        fields = tuple(
+            PyField(name=copy_str(name), type=Optional[int]) for name in FIELD_NAMES
+        )
+        classes.append(
+            PyClass(
+                name=copy_str(f"GeneratedClass{i}"),
+                type=int,
+                fields=fields,
+                tagged_union_information=TaggedUnionInformation(
+                    discriminant_attribute=copy_str("type"),
+                    discriminant_literal=copy_str(f"GENERATED_CLASS_{i}"),
+                ),
+            )
+        )
+    return Model(classes=OrderedSet(classes))
+
+
+def main() -> None:
+    tracemalloc.start()
+    model = create_model()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    field_count = CLASS_COUNT * FIELDS_PER_CLASS
+    print(f"classes: {CLASS_COUNT}, fields: {field_count}")
+    print(f"total: {size / 1024 / 1024:.1f} MiB")
+    print(f"bytes per class (including fields): {size / CLASS_COUNT:.0f}")
+    print(f"bytes per field: {size / field_count:.0f}")
+    assert len(model.classes) == CLASS_COUNT
+
+
+if __name__ == "__main__":
+    main()
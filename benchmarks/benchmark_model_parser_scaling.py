@@ -0,0 +1,52 @@
+import time
+from dataclasses import make_dataclass
+from typing import List, Type, Optional
+
+from py_typescript_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py_typescript_generator.model_parser.model_parser import (
+    ModelParser,
+    ModelParserSettings,
+)
+
+CLASS_COUNTS = [100, 1_000, 10_000, 50_000]
+
+
+def create_classes(count: int) -> List[Type]:
+    classes: List[Type] = []
+    previous: Optional[Type] = None
+    for i in range(count):
+        fields = [("value", int), ("values", List[str])]
+        if previous is not None:
+            fields.append(("previous", previous))
+        previous = make_dataclass(f"GeneratedClass{i}", fields)
+        classes.append(previous)
+    return classes
+
+
+def measure_parse_time(classes: List[Type]) -> float:
+    model_parser = ModelParser(classes, [DataclassParser()], ModelParserSettings())
+    start = time.perf_counter()
+    model = model_parser.parse()
+    duration = time.perf_counter() - start
+    assert len(model.classes) == len(classes)
+    return duration
+
+
+def main() -> None:
+    print(f"{'classes':>10} {'total [s]':>10} {'per class [us]':>15}")
+    per_class_times = []
+    for count in CLASS_COUNTS:
+        duration = measure_parse_time(create_classes(count))
+        per_class = duration / count * 1_000_000
+        per_class_times.append(per_class)
+        print(f"{count:>10} {duration:>10.3f} {per_class:>15.2f}")
+    growth = per_class_times[-1] / per_class_times[0]
+    print(
+        f"per class time grew by factor {growth:.2f} from {CLASS_COUNTS[0]} to {CLASS_COUNTS[-1]} classes"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+import importlib
+import os
+import sys
+import tempfile
+import time
+from typing import List, Type
+
+from py_typescript_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py_typescript_generator.model_parser.model_parser import (
+    ModelParser,
+    ModelParserSettings,
+)
+from py_typescript_generator.model_parser.parallel_model_parser import (
+    ParallelModelParser,
+)
+
+MODULE_COUNT = 32
+CLASSES_PER_MODULE = 500
+
+
+def write_modules(directory: str) -> List[str]:
+    # workers look up classes by name, so the classes are written to modules
+    package = os.path.join(directory, "generated_models")
+    os.makedirs(package)
+    open(os.path.join(package, "__init__.py"), "w").close()
+    module_names = []
+    for module_index in range(MODULE_COUNT):
+        lines = [
+            "from __future__ import annotations",
+            "from dataclasses import dataclass",
+            "from typing import List, Optional, Dict",
+        ]
+        for class_index in range(CLASSES_PER_MODULE):
+            lines.append("@dataclass")
+            lines.append(f"class Model{class_index}:")
+            lines.append("    value: int")
+            lines.append("    values: List[str]")
+            lines.append("    mapping: Dict[str, Optional[int]]")
+            if class_index:
+                lines.append(f"    previous: Optional[Model{class_index - 1}]")
+        module_name = f"module_{module_index}"
+        with open(os.path.join(package, f"{module_name}.py"), "w") as f:
+            f.write("\n".join(lines))
+        module_names.append(f"generated_models.{module_name}")
+    return module_names
+
+
+def load_classes(module_names: List[str]) -> List[Type]:
+    classes = []
+    for module_name in module_names:
+        module = importlib.import_module(module_name)
+        classes.extend(getattr(module, f"Model{i}") for i in range(CLASSES_PER_MODULE))
+    return classes
+
+
+def measure(name: str, parse) -> None:
+    start = time.perf_counter()
+    model = parse()
+    duration = time.perf_counter() - start
+    assert len(model.classes) == MODULE_COUNT * CLASSES_PER_MODULE
+    print(f"{name:>12}: {duration:.3f}s")
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        sys.path.insert(0, directory)
+        classes = load_classes(write_modules(directory))
+        print(
+            f"modules: {MODULE_COUNT}, classes: {len(classes)}, cpus: {os.cpu_count()}"
+        )
+        measure(
+            "sequential",
+            lambda: ModelParser(
+                classes, [DataclassParser()], ModelParserSettings()
+            ).parse(),
+        )
+        measure(
+            "parallel",
+            lambda: ParallelModelParser(classes, ModelParserSettings()).parse(),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+import time
+from dataclasses import make_dataclass
+from enum import Enum
+from typing import List, Type, Optional, Dict, Callable, TypeVar
+
+from py_typescript_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py_typescript_generator.model_parser.model_parser import (
+    ModelParser,
+    ModelParserSettings,
+)
+from py_typescript_generator.typescript_emitter.typescript_emitter import (
+    TypescriptEmitter,
+)
+from py_typescript_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+)
+from py_typescript_generator.typing_utils.type_descriptor import (
+    TypeDescriptor,
+    TypeDescriptorCache,
+)
+
+CLASS_COUNT = 10_000
+REPETITIONS = 5
+
+T = TypeVar("T")
+
+
+class Status(Enum):
+    ACTIVE = "ACTIVE"
+    INACTIVE = "INACTIVE"
+
+
+def create_classes(count: int) -> List[Type]:
+    classes: List[Type] = []
+    previous: Optional[Type] = None
+    for i in range(count):
+        fields = [
+            ("value", int),
+            ("name", str),
+            ("values", List[str]),
+            ("attributes", Dict[str, Optional[int]]),
+            ("status", Optional[Status]),
+        ]
+        if previous is not None:
+            fields.append(("previous", Optional[previous]))
+        previous = make_dataclass(f"GeneratedClass{i}", fields)
+        classes.append(previous)
+    return classes
+
+
+def measure(stage: Callable[[], T]) -> T:
+    # the best of several runs, so the numbers are not skewed by the first run
+    best = None
+    result = None
+    for _ in range(REPETITIONS):
+        start = time.perf_counter()
+        result = stage()
+        duration = time.perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    print(f"{stage.__name__:>20}: {best:.3f}s")  # type: ignore
+    return result  # type: ignore
+
+
+def main() -> None:
+    classes = create_classes(CLASS_COUNT)
+    field_types = [
+        field_type
+        for cls in classes
+        for field_type in cls.__annotations__.values()  # type: ignore
+    ]
+    print(f"{CLASS_COUNT} classes, {len(field_types)} field types")
+
+    def classify_uncached() -> None:
+        for field_type in field_types:
+            TypeDescriptor.of(field_type)
+
+    type_descriptors = TypeDescriptorCache()
+
+    def classify_cached() -> None:
+        for field_type in field_types:
+            type_descriptors.get(field_type)
+
+    def parse():
+        return ModelParser(
+            classes,
+            [DataclassParser()],
+            ModelParserSettings(),
+            type_descriptor_cache=type_descriptors,
+        ).parse()
+
+    def compile():
+        return TypescriptModelCompiler(
+            TypescriptModelCompilerSettings(), type_descriptor_cache=type_descriptors
+        ).compile(model)
+
+    def emit():
+        return TypescriptEmitter().emit(ts_model)
+
+    measure(classify_uncached)
+    measure(classify_cached)
+    model = measure(parse)
+    ts_model = measure(compile)
+    measure(emit)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+import importlib
+import os
+import sys
+import tempfile
+import time
+from typing import List, Type
+
+from py_typescript_generator.model_parser.class_parsers.default_parsers import (
+    create_default_parsers,
+)
+from py_typescript_generator.model_parser.model_parser import (
+    ModelParser,
+    ModelParserSettings,
+)
+from py_typescript_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+    CaseFormat,
+)
+
+MODEL_COUNT = 2_000
+
+HEADERS = {
+    "dataclass": [
+        "from dataclasses import dataclass",
+        "from typing import List, Optional, Dict",
+    ],
+    "pydantic": [
+        "from pydantic import BaseModel, ConfigDict",
+        "from pydantic.alias_generators import to_camel",
+        "from typing import List, Optional, Dict",
+    ],
+}
+
+
+def write_module(directory: str, kind: str) -> str:
+    lines = list(HEADERS[kind])
+    for i in range(MODEL_COUNT):
+        if kind == "dataclass":
+            lines.extend(["@dataclass", f"class Model{i}:"])
+        else:
+            lines.extend(
+                [
+                    f"class Model{i}(BaseModel):",
+                    "    model_config = ConfigDict(alias_generator=to_camel)",
+                ]
+            )
+        lines.extend(
+            [
+                "    item_id: int",
+                "    display_name: str",
+                "    tag_values: List[str]",
+                "    attributes: Dict[str, Optional[int]]",
+            ]
+        )
+        if i:
+            lines.append(f"    previous_model: Optional[Model{i - 1}] = None")
+    module_name = f"generated_{kind}_models"
+    with open(os.path.join(directory, f"{module_name}.py"), "w") as f:
+        f.write("\n".join(lines))
+    return module_name
+
+
+def load_models(module_name: str) -> List[Type]:
+    module = importlib.import_module(module_name)
+    return [getattr(module, f"Model{i}") for i in range(MODEL_COUNT)]
+
+
+def measure(kind: str, models: List[Type]) -> None:
+    start = time.perf_counter()
+    model = ModelParser(models, create_default_parsers(), ModelParserSettings()).parse()
+    parse_duration = time.perf_counter() - start
+
+    compiler = TypescriptModelCompiler(
+        TypescriptModelCompilerSettings(field_case_format=CaseFormat.CAMEL_CASE)
+    )
+    start = time.perf_counter()
+    compiler.compile(model)
+    compile_duration = time.perf_counter() - start
+
+    assert len(model.classes) == MODEL_COUNT
+    print(
+        f"{kind:>10}: parse {parse_duration:.3f}s "
+        f"({parse_duration / MODEL_COUNT * 1_000_000:.0f} us per model), "
+        f"compile {compile_duration:.3f}s"
+    )
+
+
+def main() -> None:
+    with tempfile.TemporaryDirectory() as directory:
+        sys.path.insert(0, directory)
+        for kind in ("dataclass", "pydantic"):
+            models = load_models(write_module(directory, kind))
+            measure(kind, models)
+
+
+if __name__ == "__main__":
+    main()
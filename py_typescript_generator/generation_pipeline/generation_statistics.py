@@ -0,0 +1,18 @@
+from dataclasses import dataclass, field
+from typing import Dict, List, Tuple
+
+
+@dataclass
+class GenerationStatistics:
+    module_import_times: Dict[str, float] = field(default_factory=dict)
+    parse_cache_hits: int = 0
+    parse_cache_misses: int = 0
+    compile_cache_hits: int = 0
+    compile_cache_misses: int = 0
+    # share of lookups which returned an already existing object, by object kind
+    dedup_ratios: Dict[str, float] = field(default_factory=dict)
+
+    def get_slowest_module_imports(self, count: int) -> List[Tuple[str, float]]:
+        return sorted(
+            self.module_import_times.items(), key=lambda item: item[1], reverse=True
+        )[:count]
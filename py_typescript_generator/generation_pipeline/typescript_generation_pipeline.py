@@ -1,24 +1,55 @@
+import hashlib
+import itertools
+import logging
 import os
+import shutil
+import tempfile
 from pathlib import Path
-from typing import List, Type, Dict, Union
+from typing import List, Type, Dict, Union, Optional, Set, Tuple, Iterable
 
-from py_typescript_generator.model.model import Model
-from py_typescript_generator.model_parser.class_parsers.dataclass_parser import (
-    DataclassParser,
+from py_typescript_generator.generation_pipeline.generation_statistics import (
+    GenerationStatistics,
 )
+from py_typescript_generator.model.model_object_table import ModelObjectTable
+from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model.py_enum import PyEnum
+from py_typescript_generator.model_parser.class_parsers.default_parsers import (
+    create_default_parsers,
+)
+from py_typescript_generator.model_parser.class_parsers.abstract_class_parser import (
+    AbstractClassParser,
+)
+from py_typescript_generator.model_parser.class_parsers.static_class_parser import (
+    StaticClassParser,
+)
+from py_typescript_generator.model_parser.parallel_model_parser import (
+    ParallelModelParser,
+)
+from py_typescript_generator.model_parser.parse_cache import ParseCache
 from py_typescript_generator.model_parser.model_parser import (
     ModelParser,
     ModelParserSettings,
 )
+from py_typescript_generator.serialization.type_reference_codec import (
+    TypeReferenceCodec,
+)
+from py_typescript_generator.static_analysis.static_module_loader import (
+    StaticModuleLoader,
+)
+from py_typescript_generator.type_discovery.type_discovery import TypeDiscovery
 from py_typescript_generator.typescript_emitter.typescript_emitter import (
     TypescriptEmitter,
 )
-from py_typescript_generator.typescript_model_compiler.ts_model import TsModel
 from py_typescript_generator.typescript_model_compiler.typescript_model_compiler import (
     CaseFormat,
     TypescriptModelCompiler,
     TypescriptModelCompilerSettings,
+    DEFAULT_COMPILE_CACHE_SIZE,
 )
+from py_typescript_generator.typing_utils.type_descriptor import TypeDescriptorCache
+from py_typescript_generator.typing_utils.type_filter import TypeFilter
+
+logger = logging.getLogger(__name__)
 
 
 class TypeGenerationPipeline:
@@ -28,46 +59,177 @@ class TypeGenerationPipeline:
         type_overrides: Dict[Type, Type],
         case_format: CaseFormat,
         output_file: Union[str, Path],
+        source_modules: Optional[List[str]] = None,
+        static_module_loader: Optional[StaticModuleLoader] = None,
+        packages: Optional[List[str]] = None,
+        search_path: Optional[List[str]] = None,
+        parse_cache_dir: Optional[Union[str, Path]] = None,
+        type_filter: Optional[TypeFilter] = None,
+        parse_in_parallel: bool = False,
+        max_parse_workers: Optional[int] = None,
+        compile_cache_size: int = DEFAULT_COMPILE_CACHE_SIZE,
     ):
         self.types = types
         self.type_overrides = type_overrides
         self.case_format = case_format
         self.output_file = output_file
+        self.source_modules = source_modules or []
+        self.static_module_loader = static_module_loader
+        self.packages = packages or []
+        self.search_path = search_path
+        self.parse_cache_dir = parse_cache_dir
+        self.type_filter = type_filter or TypeFilter()
+        self.parse_in_parallel = parse_in_parallel
+        self.max_parse_workers = max_parse_workers
+        self.compile_cache_size = compile_cache_size
+        self.statistics = GenerationStatistics()
+        self._type_descriptor_cache = TypeDescriptorCache()
 
     def run(self) -> None:
-        model = self._parse_model()
-        ts_model = self._compile_model(model)
-        emitted_model = self._emit_model(ts_model)
-        self._write_model(emitted_model)
+        self.statistics = GenerationStatistics()
+        # shared fields and generic types are only kept for one run
+        model_object_table = ModelObjectTable()
+        parsed_types, parse_cache = self._parse(model_object_table)
+        compiler = self._create_compiler()
+        emitter = TypescriptEmitter()
 
-    def _parse_model(self) -> Model:
-        model_parser = ModelParser(
-            self.types,
-            [DataclassParser()],
-            ModelParserSettings(type_mapping_overrides=self.type_overrides),
+        # enums are emitted before all other types, so types are collected in a
+        # temporary file while parsed classes and enums are streamed through the
+        # compiler and emitter. Equal declarations are only emitted once, like
+        # in the OrderedSets of TsModel
+        self._create_target_folder_if_not_exists()
+        temporary_output_file = f"{self.output_file}.tmp"
+        emitted_declarations: Set[bytes] = set()
+        try:
+            with open(temporary_output_file, "w") as output, tempfile.TemporaryFile(
+                "w+"
+            ) as types_output:
+                for parsed_type in parsed_types:
+                    if isinstance(parsed_type, PyEnum):
+                        declaration = emitter.emit_enum(
+                            compiler.compile_enum(parsed_type)
+                        )
+                        target = output
+                    else:
+                        declaration = emitter.emit_type(
+                            compiler.compile_class(parsed_type)
+                        )
+                        target = types_output
+                    digest = hashlib.sha1(declaration.encode()).digest()
+                    if digest not in emitted_declarations:
+                        emitted_declarations.add(digest)
+                        target.write(declaration)
+                types_output.seek(0)
+                shutil.copyfileobj(types_output, output)
+            os.replace(temporary_output_file, self.output_file)
+        finally:
+            if os.path.exists(temporary_output_file):
+                os.remove(temporary_output_file)
+
+        if parse_cache:
+            parse_cache.save()
+            self.statistics.parse_cache_hits = parse_cache.hits
+            self.statistics.parse_cache_misses = parse_cache.misses
+        self.statistics.compile_cache_hits = compiler.compile_cache_hits
+        self.statistics.compile_cache_misses = compiler.compile_cache_misses
+        self.statistics.dedup_ratios = {
+            "py_fields": model_object_table.field_dedup_ratio,
+            "field_types": model_object_table.type_dedup_ratio,
+            "ts_fields": compiler.ts_field_dedup_ratio,
+        }
+
+    def _parse(
+        self, model_object_table: ModelObjectTable
+    ) -> Tuple[Iterable[Union[PyClass, PyEnum]], Optional[ParseCache]]:
+        # classes loaded from source and cached classes are only available in this
+        # process, so they are always parsed here
+        if (
+            self.parse_in_parallel
+            and not self.static_module_loader
+            and not self.parse_cache_dir
+        ):
+            model = self._create_parallel_model_parser(model_object_table).parse()
+            return itertools.chain(model.enums, model.classes), None
+        model_parser, parse_cache = self._create_model_parser(model_object_table)
+        return model_parser.iter_parse(), parse_cache
+
+    def _create_parallel_model_parser(
+        self, model_object_table: ModelObjectTable
+    ) -> ParallelModelParser:
+        types = list(self.types)
+        if self.packages:
+            types.extend(self._discover_types())
+        return ParallelModelParser(
+            types,
+            ModelParserSettings(
+                type_mapping_overrides=self.type_overrides,
+                type_filter=self.type_filter,
+            ),
+            max_workers=self.max_parse_workers,
+            model_object_table=model_object_table,
         )
-        model = model_parser.parse()
-        return model
 
-    def _compile_model(self, model: Model) -> TsModel:
-        ts_model = TypescriptModelCompiler(
-            TypescriptModelCompilerSettings(
-                field_case_format=self.case_format,
+    def _create_model_parser(
+        self, model_object_table: ModelObjectTable
+    ) -> Tuple[ModelParser, Optional[ParseCache]]:
+        types = list(self.types)
+        if self.packages:
+            types.extend(self._discover_types())
+        parsers: List[AbstractClassParser] = create_default_parsers(model_object_table)
+        if self.static_module_loader:
+            for module_name in self.source_modules:
+                types.extend(self.static_module_loader.load_classes(module_name))
+            parsers.append(
+                StaticClassParser(
+                    self.static_module_loader, model_object_table=model_object_table
+                )
+            )
+        parse_cache = self._create_parse_cache()
+        model_parser = ModelParser(
+            types,
+            parsers,
+            ModelParserSettings(
                 type_mapping_overrides=self.type_overrides,
+                type_filter=self.type_filter,
+            ),
+            type_descriptor_cache=self._type_descriptor_cache,
+            parse_cache=parse_cache,
+        )
+        return model_parser, parse_cache
+
+    def _create_parse_cache(self) -> Optional[ParseCache]:
+        if not self.parse_cache_dir:
+            return None
+        if self.static_module_loader:
+            return ParseCache(
+                self.parse_cache_dir,
+                TypeReferenceCodec(self.static_module_loader.resolve_class),
+                search_path=self.static_module_loader.search_path,
             )
-        ).compile(model)
-        return ts_model
+        return ParseCache(self.parse_cache_dir)
 
-    def _emit_model(self, ts_model: TsModel) -> str:
-        emitted_model = TypescriptEmitter().emit(ts_model)
-        return emitted_model
+    def _discover_types(self) -> List[Type]:
+        discovered_types = TypeDiscovery(
+            static_module_loader=self.static_module_loader,
+            search_path=self.search_path,
+        ).discover(self.packages)
+        self.statistics.module_import_times.update(discovered_types.module_import_times)
+        for module_name, import_time in self.statistics.get_slowest_module_imports(5):
+            logger.info(f"Loading module {module_name} took {import_time:.3f}s")
+        return discovered_types.types
 
-    def _write_model(self, emitted_model: str) -> None:
-        self._create_target_folder_if_not_exists()
-        with open(self.output_file, "w") as f:
-            f.write(emitted_model)
+    def _create_compiler(self) -> TypescriptModelCompiler:
+        return TypescriptModelCompiler(
+            TypescriptModelCompilerSettings(
+                field_case_format=self.case_format,
+                type_mapping_overrides=self.type_overrides,
+                type_filter=self.type_filter,
+                compile_cache_size=self.compile_cache_size,
+            ),
+            type_descriptor_cache=self._type_descriptor_cache,
+        )
 
     def _create_target_folder_if_not_exists(self):
         folder = os.path.dirname(self.output_file)
-        if not os.path.exists(folder):
+        if folder and not os.path.exists(folder):
             os.makedirs(folder)
@@ -4,9 +4,14 @@ from typing import List, Type, Dict, Optional, Union
 from py_typescript_generator.generation_pipeline.typescript_generation_pipeline import (
     TypeGenerationPipeline,
 )
+from py_typescript_generator.static_analysis.static_module_loader import (
+    StaticModuleLoader,
+)
 from py_typescript_generator.typescript_model_compiler.typescript_model_compiler import (
     CaseFormat,
+    DEFAULT_COMPILE_CACHE_SIZE,
 )
+from py_typescript_generator.typing_utils.type_filter import TypeFilter, TypePredicate
 
 
 class NoOutputFileDefined(Exception):
@@ -22,12 +27,39 @@ class TypeGenerationPipelineBuilder:
         self._type_overrides: Dict[Type, Type] = {}
         self._case_format: CaseFormat = CaseFormat.KEEP_CASING
         self._output_file: Optional[Union[str, Path]] = None
+        self._source_modules: List[str] = []
+        self._static_module_loader: Optional[StaticModuleLoader] = None
+        self._packages: List[str] = []
+        self._search_path: Optional[List[str]] = None
+        self._parse_cache_dir: Optional[Union[str, Path]] = None
+        self._include_predicates: List[TypePredicate] = []
+        self._exclude_predicates: List[TypePredicate] = []
+        self._parse_in_parallel = False
+        self._max_parse_workers: Optional[int] = None
+        self._compile_cache_size = DEFAULT_COMPILE_CACHE_SIZE
 
     def for_types(self, types):
         # type: (List[Type])->TypeGenerationPipelineBuilder
         self._types = types
         return self
 
+    def for_source_modules(self, module_names, packages=None, search_path=None):
+        # type: (List[str], Optional[List[str]], Optional[List[str]])->TypeGenerationPipelineBuilder
+        if packages is None:
+            packages = sorted({name.split(".")[0] for name in module_names})
+        self._source_modules = module_names
+        self._static_module_loader = StaticModuleLoader(packages, search_path)
+        self._search_path = search_path
+        return self
+
+    def for_packages(self, packages, without_import=False, search_path=None):
+        # type: (List[str], bool, Optional[List[str]])->TypeGenerationPipelineBuilder
+        self._packages = packages
+        self._search_path = search_path
+        if without_import:
+            self._static_module_loader = StaticModuleLoader(packages, search_path)
+        return self
+
     def with_type_overrides(self, type_overrides):
         # type: (Dict[Type, Type])->TypeGenerationPipelineBuilder
         self._type_overrides = type_overrides
@@ -38,6 +70,32 @@ class TypeGenerationPipelineBuilder:
         self._case_format = CaseFormat.CAMEL_CASE
         return self
 
+    def with_parse_cache(self, cache_dir):
+        # type: (Union[str, Path])->TypeGenerationPipelineBuilder
+        self._parse_cache_dir = cache_dir
+        return self
+
+    def parse_in_parallel(self, max_workers=None):
+        # type: (Optional[int])->TypeGenerationPipelineBuilder
+        self._parse_in_parallel = True
+        self._max_parse_workers = max_workers
+        return self
+
+    def with_compile_cache_size(self, size):
+        # type: (int)->TypeGenerationPipelineBuilder
+        self._compile_cache_size = size
+        return self
+
+    def include_types(self, predicates):
+        # type: (List[TypePredicate])->TypeGenerationPipelineBuilder
+        self._include_predicates.extend(predicates)
+        return self
+
+    def exclude_types(self, predicates):
+        # type: (List[TypePredicate])->TypeGenerationPipelineBuilder
+        self._exclude_predicates.extend(predicates)
+        return self
+
     def to_file(self, path):
         # type: (Union[str, Path])->TypeGenerationPipelineBuilder
         self._output_file = path
@@ -47,5 +105,19 @@ class TypeGenerationPipelineBuilder:
         if not self._output_file:
             raise NoOutputFileDefined()
         return TypeGenerationPipeline(
-            self._types, self._type_overrides, self._case_format, self._output_file
+            self._types,
+            self._type_overrides,
+            self._case_format,
+            self._output_file,
+            source_modules=self._source_modules,
+            static_module_loader=self._static_module_loader,
+            packages=self._packages,
+            search_path=self._search_path,
+            parse_cache_dir=self._parse_cache_dir,
+            type_filter=TypeFilter(
+                include=self._include_predicates, exclude=self._exclude_predicates
+            ),
+            parse_in_parallel=self._parse_in_parallel,
+            max_parse_workers=self._max_parse_workers,
+            compile_cache_size=self._compile_cache_size,
         )
@@ -5,12 +5,16 @@ from ordered_set import OrderedSet
 
 from py_typescript_generator.model.py_class import PyClass
 from py_typescript_generator.model.py_enum import PyEnum
+from py_typescript_generator.model.type_dependency_graph import TypeDependencyGraph
 
 
 @dataclass
 class Model:  # todo rename to PyModel
     classes: OrderedSet[PyClass] = field(default_factory=OrderedSet)
     enums: OrderedSet[PyEnum] = field(default_factory=OrderedSet)
+    dependency_graph: TypeDependencyGraph = field(
+        default_factory=TypeDependencyGraph, compare=False, repr=False
+    )
 
     @staticmethod
     def of_classes(classes):
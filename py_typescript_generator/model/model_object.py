@@ -0,0 +1,32 @@
+import sys
+from dataclasses import fields
+from operator import attrgetter
+from typing import Any, Tuple, Optional, Callable
+
+# helpers for the frozen, slotted dataclasses of the model. They are stored in
+# OrderedSets and hashed often, so the hash is computed once and kept in the
+# _hash slot. The cached hash must not be pickled, since hashes of types differ
+# between processes.
+
+
+def cached_hash(*field_names: str) -> Callable[[Any], int]:
+    get_hashed_values = attrgetter(*field_names)
+
+    def __hash__(self: Any) -> int:
+        hash_value: Optional[int] = self._hash
+        if hash_value is None:
+            hash_value = hash(get_hashed_values(self))
+            object.__setattr__(self, "_hash", hash_value)
+        return hash_value
+
+    return __hash__
+
+
+def reduce_to_init_arguments(self: Any) -> Tuple[Any, Tuple[Any, ...]]:
+    return type(self), tuple(getattr(self, f.name) for f in fields(self) if f.init)
+
+
+def intern_str(value: str) -> str:
+    if type(value) is str:
+        return sys.intern(value)
+    return value
@@ -0,0 +1,51 @@
+from typing import Any, Tuple, Type, Optional
+
+from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.typing_utils.hash_consing_table import HashConsingTable
+
+
+class ModelObjectTable:
+    # shares fields with the same name and type and equal generic types between
+    # all parsed classes. The table keeps the shared objects alive, so it is
+    # meant to be used for one generation run
+    def __init__(self) -> None:
+        self._fields: HashConsingTable[
+            Tuple[str, Any, Any, Optional[str]], PyField
+        ] = HashConsingTable()
+        self._types: HashConsingTable[Tuple[Any, Any], Type] = HashConsingTable()
+
+    def get_field(
+        self, name: str, field_type: Type, alias: Optional[str] = None
+    ) -> PyField:
+        field_type = self.get_type(field_type)
+        key = (name, field_type, getattr(field_type, "__args__", None), alias)
+        py_field = self._fields.get(key)
+        if py_field is None:
+            py_field = self._fields.add(
+                key, PyField(name=name, type=field_type, alias=alias)
+            )
+        return py_field
+
+    def get_type(self, cls: Type) -> Type:
+        # classes are unique already, but generic types like List[str] are created
+        # again whenever an annotation is evaluated. The arguments are part of the
+        # key, since typing treats unions with different member order as equal
+        if isinstance(cls, type):
+            return cls
+        key = (cls, getattr(cls, "__args__", None))
+        canonical_type = self._types.get(key)
+        if canonical_type is None:
+            canonical_type = self._types.add(key, cls)
+        return canonical_type
+
+    @property
+    def field_dedup_ratio(self) -> float:
+        return self._fields.dedup_ratio
+
+    @property
+    def type_dedup_ratio(self) -> float:
+        return self._types.dedup_ratio
+
+    def clear(self) -> None:
+        self._fields.clear()
+        self._types.clear()
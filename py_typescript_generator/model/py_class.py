@@ -1,27 +1,76 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Type, Tuple, Optional, FrozenSet
 
+from py_typescript_generator.model.model_object import (
+    cached_hash,
+    reduce_to_init_arguments,
+    intern_str,
+)
 from py_typescript_generator.model.py_field import PyField
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TaggedUnionInformation:
     discriminant_attribute: str
     discriminant_literal: str
+    # the discriminant attribute is the name in JSON, like the alias of a field
+    discriminant_attribute_is_alias: bool = False
+    _hash: Optional[int] = field(default=None, init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(
+            self, "discriminant_attribute", intern_str(self.discriminant_attribute)
+        )
+        object.__setattr__(
+            self, "discriminant_literal", intern_str(self.discriminant_literal)
+        )
+
+    __hash__ = cached_hash(
+        "discriminant_attribute",
+        "discriminant_literal",
+        "discriminant_attribute_is_alias",
+    )
+    __reduce__ = reduce_to_init_arguments
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RootTaggedUnionInformation(TaggedUnionInformation):
-    discriminant_literals: FrozenSet[str]
-    child_types: FrozenSet[Type]
+    discriminant_literals: FrozenSet[str] = frozenset()
+    child_types: FrozenSet[Type] = frozenset()
 
+    __hash__ = cached_hash(
+        "discriminant_attribute",
+        "discriminant_literal",
+        "discriminant_attribute_is_alias",
+        "discriminant_literals",
+        "child_types",
+    )
+    __reduce__ = reduce_to_init_arguments
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PyClass:
     name: str
     type: Type
     fields: Tuple[PyField, ...]
     tagged_union_information: Optional[TaggedUnionInformation] = None
+    # names of the type variables of generic classes, in declaration order
+    type_parameters: Tuple[str, ...] = ()
+    _hash: Optional[int] = field(default=None, init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name", intern_str(self.name))
+        if self.type_parameters:
+            object.__setattr__(
+                self,
+                "type_parameters",
+                tuple(intern_str(name) for name in self.type_parameters),
+            )
+
+    __hash__ = cached_hash(
+        "name", "type", "fields", "tagged_union_information", "type_parameters"
+    )
+    __reduce__ = reduce_to_init_arguments
 
     def with_tagged_union_information(self, tagged_union_information):
         # type: (TaggedUnionInformation)->PyClass
@@ -30,4 +79,5 @@ class PyClass:
             type=self.type,
             fields=self.fields,
             tagged_union_information=tagged_union_information,
+            type_parameters=self.type_parameters,
         )
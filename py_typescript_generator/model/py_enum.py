@@ -1,15 +1,35 @@
-from dataclasses import dataclass
-from typing import Type, Tuple
+from dataclasses import dataclass, field
+from typing import Type, Tuple, Optional
 
+from py_typescript_generator.model.model_object import (
+    cached_hash,
+    reduce_to_init_arguments,
+    intern_str,
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PyEnumValue:
     name: str
     value: object
+    _hash: Optional[int] = field(default=None, init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name", intern_str(self.name))
+
+    __hash__ = cached_hash("name", "value")
+    __reduce__ = reduce_to_init_arguments
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PyEnum:
     name: str
     type: Type
     values: Tuple[PyEnumValue, ...]
+    _hash: Optional[int] = field(default=None, init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name", intern_str(self.name))
+
+    __hash__ = cached_hash("name", "type", "values")
+    __reduce__ = reduce_to_init_arguments
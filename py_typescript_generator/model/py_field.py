@@ -1,8 +1,25 @@
-from dataclasses import dataclass
-from typing import Type
+from dataclasses import dataclass, field
+from typing import Type, Optional
 
+from py_typescript_generator.model.model_object import (
+    cached_hash,
+    reduce_to_init_arguments,
+    intern_str,
+)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, slots=True)
 class PyField:
     name: str
     type: Type
+    # name of the field in JSON, if it differs from the name of the attribute
+    alias: Optional[str] = None
+    _hash: Optional[int] = field(default=None, init=False, compare=False, repr=False)
+
+    def __post_init__(self) -> None:
+        object.__setattr__(self, "name", intern_str(self.name))
+        if self.alias is not None:
+            object.__setattr__(self, "alias", intern_str(self.alias))
+
+    __hash__ = cached_hash("name", "type", "alias")
+    __reduce__ = reduce_to_init_arguments
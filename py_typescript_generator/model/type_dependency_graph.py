@@ -0,0 +1,79 @@
+from enum import Enum
+from typing import Dict, Type, Set, Optional, List, Iterable, FrozenSet, Iterator, Tuple
+
+
+class DependencyKind(Enum):
+    FIELD = "FIELD"
+    GENERIC_ARGUMENT = "GENERIC_ARGUMENT"
+    TAGGED_UNION_CHILD = "TAGGED_UNION_CHILD"
+    TAGGED_UNION_PARENT = "TAGGED_UNION_PARENT"
+
+
+_Edges = Dict[Type, Dict[Type, Set[DependencyKind]]]
+
+
+class TypeDependencyGraph:
+    def __init__(self) -> None:
+        # edges are stored in both directions and in insertion order, so neighbours
+        # of a type are found without scanning the fields of the model
+        self._dependencies: _Edges = {}
+        self._dependents: _Edges = {}
+
+    def add_dependency(self, source: Type, target: Type, kind: DependencyKind) -> None:
+        self._dependencies.setdefault(source, {}).setdefault(target, set()).add(kind)
+        self._dependents.setdefault(target, {}).setdefault(source, set()).add(kind)
+
+    def get_dependencies(
+        self, cls: Type, kind: Optional[DependencyKind] = None
+    ) -> List[Type]:
+        return _get_neighbours(self._dependencies, cls, kind)
+
+    def get_dependents(
+        self, cls: Type, kind: Optional[DependencyKind] = None
+    ) -> List[Type]:
+        return _get_neighbours(self._dependents, cls, kind)
+
+    def get_dependency_kinds(
+        self, source: Type, target: Type
+    ) -> FrozenSet[DependencyKind]:
+        return frozenset(self._dependencies.get(source, {}).get(target, ()))
+
+    def get_transitive_dependencies(self, types: Iterable[Type]) -> Set[Type]:
+        return _get_reachable(self._dependencies, types)
+
+    def get_transitive_dependents(self, types: Iterable[Type]) -> Set[Type]:
+        return _get_reachable(self._dependents, types)
+
+    def iter_dependencies(
+        self,
+    ) -> Iterator[Tuple[Type, Type, FrozenSet[DependencyKind]]]:
+        for source, targets in self._dependencies.items():
+            for target, kinds in targets.items():
+                yield source, target, frozenset(kinds)
+
+    def __contains__(self, cls: Type) -> bool:
+        return cls in self._dependencies or cls in self._dependents
+
+    def __len__(self) -> int:
+        return sum(len(targets) for targets in self._dependencies.values())
+
+
+def _get_neighbours(
+    edges: _Edges, cls: Type, kind: Optional[DependencyKind]
+) -> List[Type]:
+    neighbours = edges.get(cls, {})
+    if kind is None:
+        return list(neighbours)
+    return [neighbour for neighbour, kinds in neighbours.items() if kind in kinds]
+
+
+def _get_reachable(edges: _Edges, types: Iterable[Type]) -> Set[Type]:
+    # the given types are only part of the result if they are reachable themselves
+    reachable: Set[Type] = set()
+    types_to_visit = list(types)
+    while types_to_visit:
+        for neighbour in edges.get(types_to_visit.pop(), {}):
+            if neighbour not in reachable:
+                reachable.add(neighbour)
+                types_to_visit.append(neighbour)
+    return reachable
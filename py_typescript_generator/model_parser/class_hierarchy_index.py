@@ -0,0 +1,123 @@
+import inspect
+import weakref
+from enum import Enum
+from typing import Type, Tuple, Set, Optional, cast, Iterable
+
+from ordered_set import OrderedSet
+
+from py_typescript_generator.typing_utils.weak_type_cache import WeakTypeCache
+
+DISCRIMINANT_ATTRIBUTE_MARKER = "__json_type_info_attribute__"
+
+_WeakTypes = Tuple["weakref.ref[Type]", ...]
+
+
+class ClassHierarchyIndex:
+    def __init__(self) -> None:
+        # children are only weakly referenced, like in cls.__subclasses__(), so
+        # classes replaced by a module reload are not kept alive by their parents
+        self._direct_children: WeakTypeCache[_WeakTypes] = WeakTypeCache()
+        self._children: WeakTypeCache[_WeakTypes] = WeakTypeCache()
+        self._parents: WeakTypeCache[Set[Type]] = WeakTypeCache()
+        self._is_root: WeakTypeCache[bool] = WeakTypeCache()
+        self._discriminant_attribute_names: WeakTypeCache[
+            Optional[str]
+        ] = WeakTypeCache()
+        self._discriminant_literals: WeakTypeCache[str] = WeakTypeCache()
+
+    def get_parent_classes(self, cls: Type) -> Set[Type]:
+        parents = self._parents.get(cls)
+        if parents is None:
+            parents = {*inspect.getmro(cls)}
+            parents.remove(cls)
+            parents.remove(object)
+            self._parents.set(cls, parents)
+        return parents
+
+    def get_child_classes(self, cls: Type) -> OrderedSet[Type]:
+        weak_children = self._children.get(cls)
+        if weak_children is not None:
+            return OrderedSet(_resolve(weak_children))
+        children: OrderedSet[Type] = OrderedSet()
+        for child in self._get_direct_children(cls):
+            children.add(child)
+            children.update(self.get_child_classes(child))
+        self._children.set(cls, _to_weak_types(children))
+        return children
+
+    def is_tagged_union_class(self, cls: Type) -> bool:
+        return self.get_discriminant_attribute_name(cls) is not None
+
+    def is_tagged_union_root(self, cls: Type) -> bool:
+        is_root = self._is_root.get(cls)
+        if is_root is None:
+            is_root = not any(
+                self.is_tagged_union_class(parent)
+                for parent in self.get_parent_classes(cls)
+            )
+            self._is_root.set(cls, is_root)
+        return is_root
+
+    def get_discriminant_attribute_name(self, cls: Type) -> Optional[str]:
+        if cls in self._discriminant_attribute_names:
+            return self._discriminant_attribute_names.get(cls)
+        attribute_name = cast(
+            Optional[str], getattr(cls, DISCRIMINANT_ATTRIBUTE_MARKER, None)
+        )
+        self._discriminant_attribute_names.set(cls, attribute_name)
+        return attribute_name
+
+    def get_discriminant_literal(self, cls: Type) -> str:
+        literal = self._discriminant_literals.get(cls)
+        if literal is None:
+            literal = self._read_discriminant_literal(cls)
+            self._discriminant_literals.set(cls, literal)
+        return literal
+
+    def refresh(self) -> None:
+        changed_classes = [
+            cls
+            for cls, direct_children in self._direct_children.items()
+            if _to_weak_types(cls.__subclasses__()) != direct_children
+        ]
+        for cls in changed_classes:
+            self._direct_children.pop(cls)
+            for ancestor in inspect.getmro(cls):
+                self._children.pop(ancestor)
+
+    def invalidate(self) -> None:
+        self._direct_children.clear()
+        self._children.clear()
+        self._parents.clear()
+        self._is_root.clear()
+        self._discriminant_attribute_names.clear()
+        self._discriminant_literals.clear()
+
+    def _get_direct_children(self, cls: Type) -> Tuple[Type, ...]:
+        weak_direct_children = self._direct_children.get(cls)
+        if weak_direct_children is not None:
+            return tuple(_resolve(weak_direct_children))
+        direct_children = tuple(cls.__subclasses__())
+        self._direct_children.set(cls, _to_weak_types(direct_children))
+        return direct_children
+
+    def _read_discriminant_literal(self, cls: Type) -> str:
+        attr_name = getattr(cls, DISCRIMINANT_ATTRIBUTE_MARKER)
+        try:
+            attr = getattr(cls, attr_name)
+        except AttributeError:
+            return ""
+        if isinstance(attr, Enum):
+            return attr.name
+        return cast(str, attr)
+
+
+def _to_weak_types(types: Iterable[Type]) -> _WeakTypes:
+    return tuple(weakref.ref(cls) for cls in types)
+
+
+def _resolve(weak_types: _WeakTypes) -> Iterable[Type]:
+    for weak_type in weak_types:
+        cls = weak_type()
+        if cls is not None:
+            yield cls
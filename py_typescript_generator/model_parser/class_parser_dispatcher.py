@@ -0,0 +1,51 @@
+from typing import Type, Optional, Sequence, Iterable
+
+from typing_inspect import get_origin  # type: ignore
+
+from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model_parser.class_parsers.abstract_class_parser import (
+    AbstractClassParser,
+)
+from py_typescript_generator.typing_utils.weak_type_cache import WeakTypeCache
+
+
+class ClassParserDispatcher:
+    def __init__(self, parsers: Sequence[AbstractClassParser]):
+        self._parsers = parsers
+        self._parser_by_type: WeakTypeCache[AbstractClassParser] = WeakTypeCache()
+
+    def try_parse(self, cls: Type) -> Optional[PyClass]:
+        for parser in self._get_candidate_parsers(cls):
+            py_class = parser.try_parse(cls)
+            if py_class is not None:
+                self._parser_by_type.set(cls, parser)
+                return py_class
+        return None
+
+    def invalidate(self, types: Iterable[Type]) -> None:
+        types = list(types)
+        for cls in types:
+            self._parser_by_type.pop(cls)
+        for parser in self._parsers:
+            parser.invalidate(types)
+
+    def _get_candidate_parsers(self, cls: Type) -> Iterable[AbstractClassParser]:
+        # the parser which parsed the class or its closest base class is asked first,
+        # so the order of the parser list does not matter for already known hierarchies
+        cached_parser = self._find_cached_parser(cls)
+        if cached_parser is None:
+            return self._parsers
+        return [
+            cached_parser,
+            *(parser for parser in self._parsers if parser is not cached_parser),
+        ]
+
+    def _find_cached_parser(self, cls: Type) -> Optional[AbstractClassParser]:
+        cached_parser = self._parser_by_type.get(cls)
+        if cached_parser is not None:
+            return cached_parser
+        for base in getattr(get_origin(cls) or cls, "__mro__", ()):
+            cached_parser = self._parser_by_type.get(base)
+            if cached_parser is not None:
+                return cached_parser
+        return None
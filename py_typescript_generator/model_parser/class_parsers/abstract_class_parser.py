@@ -1,6 +1,10 @@
-from typing import Type
+from typing import Type, Optional, Iterable
 
+from py_typescript_generator.model.model_object_table import ModelObjectTable
 from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model_parser.class_parsers.annotation_resolver import (
+    AnnotationResolver,
+)
 
 
 class AbstractClassParser:
@@ -9,3 +13,39 @@ class AbstractClassParser:
 
     def parse(self, cls: Type) -> PyClass:
         raise NotImplementedError()
+
+    def try_parse(self, cls: Type) -> Optional[PyClass]:
+        if not self.accepts_class(cls):
+            return None
+        return self.parse(cls)
+
+    def invalidate(self, types: Iterable[Type]) -> None:
+        pass
+
+
+class AbstractAnnotationClassParser(AbstractClassParser):
+    # parsers resolving the annotations of classes implement accepts_class() and
+    # try_parse(), parse() raises the not_accepted_exception for other classes
+    not_accepted_exception: Type[RuntimeError]
+
+    def __init__(
+        self,
+        annotation_resolver: Optional[AnnotationResolver] = None,
+        model_object_table: Optional[ModelObjectTable] = None,
+    ):
+        self._annotation_resolver = annotation_resolver or AnnotationResolver()
+        self._model_object_table = model_object_table or ModelObjectTable()
+
+    def parse(self, cls: Type) -> PyClass:
+        py_class = self.try_parse(cls)
+        if py_class is None:
+            raise self.not_accepted_exception(cls)
+        return py_class
+
+    def try_parse(self, cls: Type) -> Optional[PyClass]:
+        raise NotImplementedError()
+
+    def invalidate(self, types: Iterable[Type]) -> None:
+        # resolved annotations of unchanged modules may refer to changed types
+        self._annotation_resolver.invalidate()
+        self._model_object_table.clear()
@@ -0,0 +1,89 @@
+import sys
+import weakref
+from typing import Type, Any, Dict, Tuple, Iterable, List, ForwardRef, Mapping
+from typing import _eval_type  # type: ignore
+
+
+class UnresolvableAnnotationException(RuntimeError):
+    def __init__(self, annotation: Any, cls: Type, cause: Exception):
+        super(UnresolvableAnnotationException, self).__init__(
+            f"Could not resolve annotation {annotation!r} of class {cls}: {cause}"
+        )
+
+
+class AnnotationResolver:
+    def __init__(self) -> None:
+        self._namespaces: Dict[str, Mapping[str, Any]] = {}
+        # resolved annotations are only weakly referenced, so classes of reloaded
+        # modules are resolved again once the old version is collected
+        self._resolved_annotations: Dict[Tuple[str, Any], "weakref.ref[Any]"] = {}
+
+    def resolve(self, cls: Type, annotation: Any) -> Any:
+        return self.resolve_all(cls, [annotation])[0]
+
+    def resolve_all(self, cls: Type, annotations: Iterable[Any]) -> List[Any]:
+        namespace = self._get_namespace(cls.__module__)
+        return [
+            self._resolve_annotation(cls, namespace, annotation)
+            for annotation in annotations
+        ]
+
+    def invalidate(self) -> None:
+        self._namespaces.clear()
+        self._resolved_annotations.clear()
+
+    def _resolve_annotation(
+        self, cls: Type, namespace: Mapping[str, Any], annotation: Any
+    ) -> Any:
+        if isinstance(annotation, type):
+            return annotation
+
+        key = (cls.__module__, annotation)
+        try:
+            resolved = self._resolved_annotations[key]()
+            if resolved is not None:
+                return resolved
+            is_hashable = True
+        except KeyError:
+            is_hashable = True
+        except TypeError:
+            is_hashable = False
+
+        forward_ref = (
+            ForwardRef(annotation) if isinstance(annotation, str) else annotation
+        )
+        try:
+            resolved = _eval_type(forward_ref, namespace, None)
+        except NameError:
+            # names defined in the class body are only visible through the class
+            # namespace, results depending on it are not shared with other classes
+            return self._evaluate_in_class_namespace(cls, namespace, forward_ref)
+        except Exception as e:
+            raise UnresolvableAnnotationException(annotation, cls, e)
+
+        if is_hashable:
+            self._remember(key, resolved)
+        return resolved
+
+    def _remember(self, key: Tuple[str, Any], resolved: Any) -> None:
+        try:
+            self._resolved_annotations[key] = weakref.ref(resolved)
+        except TypeError:
+            # e.g. int | None, these are evaluated again on the next lookup
+            pass
+
+    def _evaluate_in_class_namespace(
+        self, cls: Type, namespace: Mapping[str, Any], annotation: Any
+    ) -> Any:
+        try:
+            return _eval_type(annotation, namespace, dict(vars(cls)))
+        except Exception as e:
+            raise UnresolvableAnnotationException(annotation, cls, e)
+
+    def _get_namespace(self, module_name: str) -> Mapping[str, Any]:
+        namespace = self._namespaces.get(module_name)
+        if namespace is None:
+            module = sys.modules.get(module_name)
+            namespace = vars(module) if module else {}
+            self._namespaces[module_name] = namespace
+        return namespace
@@ -0,0 +1,99 @@
+from typing import Type, Optional, Any, Dict, List, Tuple
+
+from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model_parser.class_parsers.abstract_class_parser import (
+    AbstractAnnotationClassParser,
+)
+from py_typescript_generator.typing_utils.typing_utils import (
+    get_type_parameters,
+    get_base_type_arguments,
+    bind_type_arguments,
+)
+
+
+class NotAnAttrsClassException(RuntimeError):
+    def __init__(self, cls: Type):
+        super(NotAnAttrsClassException, self).__init__(
+            f"The class {cls} is not an attrs class."
+        )
+
+
+class UntypedAttrsAttributeException(RuntimeError):
+    def __init__(self, cls: Type, name: str):
+        super(UntypedAttrsAttributeException, self).__init__(
+            f"The attribute {name} of attrs class {cls} has no type."
+        )
+
+
+def is_attrs_class(cls: Type) -> bool:
+    # the same check as attrs.has(), so attrs does not have to be imported
+    return getattr(cls, "__attrs_attrs__", None) is not None
+
+
+class AttrsClassParser(AbstractAnnotationClassParser):
+    # attributes are read from __attrs_attrs__ and string annotations are resolved
+    # with the AnnotationResolver instead of attrs.resolve_types(), which would
+    # evaluate the module globals again for every class and modify the class
+    not_accepted_exception = NotAnAttrsClassException
+
+    def accepts_class(self, cls: Type) -> bool:
+        return is_attrs_class(cls)
+
+    def try_parse(self, cls: Type) -> Optional[PyClass]:
+        if not self.accepts_class(cls):
+            return None
+
+        attributes = cls.__attrs_attrs__
+        for attribute in attributes:
+            if attribute.type is None:
+                raise UntypedAttrsAttributeException(cls, attribute.name)
+
+        # type variables of generic base classes are replaced by the arguments the
+        # class binds them to, like Foo of class FooPage(Page[Foo])
+        base_type_arguments = get_base_type_arguments(cls)
+        field_types: Dict[str, Any] = {}
+        for declaring_class, names, annotations in self._group_by_declaring_class(
+            cls, attributes
+        ):
+            type_arguments = base_type_arguments.get(declaring_class, {})
+            field_types.update(
+                (name, bind_type_arguments(field_type, type_arguments))
+                for name, field_type in zip(
+                    names,
+                    self._annotation_resolver.resolve_all(declaring_class, annotations),
+                )
+            )
+
+        return PyClass(
+            name=cls.__name__,
+            type=cls,
+            fields=tuple(
+                self._model_object_table.get_field(
+                    attribute.name, field_types[attribute.name]
+                )
+                for attribute in attributes
+            ),
+            type_parameters=get_type_parameters(cls),
+        )
+
+    def _group_by_declaring_class(
+        self, cls: Type, attributes: Tuple[Any, ...]
+    ) -> List[Tuple[Type, List[str], List[Any]]]:
+        # annotations of inherited attributes are resolved in the module of the
+        # base class declaring them, all annotations of a class at once
+        declaring_classes = {}
+        for base in reversed(cls.__mro__):
+            for attribute in vars(base).get("__attrs_attrs__", ()):
+                if not attribute.inherited:
+                    declaring_classes[attribute.name] = base
+
+        groups: Dict[Type, Tuple[List[str], List[Any]]] = {}
+        for attribute in attributes:
+            declaring_class = declaring_classes.get(attribute.name, cls)
+            names, annotations = groups.setdefault(declaring_class, ([], []))
+            names.append(attribute.name)
+            annotations.append(attribute.type)
+        return [
+            (declaring_class, names, annotations)
+            for declaring_class, (names, annotations) in groups.items()
+        ]
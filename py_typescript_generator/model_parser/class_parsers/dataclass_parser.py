@@ -1,10 +1,14 @@
-from dataclasses import fields
-from typing import Type
+from dataclasses import fields, Field
+from typing import Type, Optional, Tuple, Any, Dict, List
 
 from py_typescript_generator.model.py_class import PyClass
-from py_typescript_generator.model.py_field import PyField
 from py_typescript_generator.model_parser.class_parsers.abstract_class_parser import (
-    AbstractClassParser,
+    AbstractAnnotationClassParser,
+)
+from py_typescript_generator.typing_utils.typing_utils import (
+    get_type_parameters,
+    get_base_type_arguments,
+    bind_type_arguments,
 )
 
 
@@ -15,19 +19,61 @@ class NotADataclassException(RuntimeError):
         )
 
 
-class DataclassParser(AbstractClassParser):
+class DataclassParser(AbstractAnnotationClassParser):
+    not_accepted_exception = NotADataclassException
+
     def accepts_class(self, cls: Type) -> bool:
-        try:
-            fields(cls)
-            return True
-        except TypeError:
-            return False
+        return self._get_fields(cls) is not None
+
+    def try_parse(self, cls: Type) -> Optional[PyClass]:
+        dataclass_fields = self._get_fields(cls)
+        if dataclass_fields is None:
+            return None
+        # annotations of inherited fields are resolved in the module of the base
+        # dataclass declaring them, all annotations of a class at once. Type
+        # variables of generic base dataclasses are replaced by the arguments the
+        # class binds them to, like Foo of class FooPage(Page[Foo])
+        declaring_classes = self._get_declaring_classes(cls)
+        base_type_arguments = get_base_type_arguments(cls)
+        fields_by_declaring_class: Dict[Type, List[Field[Any]]] = {}
+        for field in dataclass_fields:
+            fields_by_declaring_class.setdefault(
+                declaring_classes.get(field.name, cls), []
+            ).append(field)
+        field_types: Dict[str, Any] = {}
+        for declaring_class, declared_fields in fields_by_declaring_class.items():
+            type_arguments = base_type_arguments.get(declaring_class, {})
+            field_types.update(
+                (field.name, bind_type_arguments(field_type, type_arguments))
+                for field, field_type in zip(
+                    declared_fields,
+                    self._annotation_resolver.resolve_all(
+                        declaring_class, (field.type for field in declared_fields)
+                    ),
+                )
+            )
+        py_fields = tuple(
+            self._model_object_table.get_field(field.name, field_types[field.name])
+            for field in dataclass_fields
+        )
+
+        return PyClass(
+            name=cls.__name__,
+            type=cls,
+            fields=py_fields,
+            type_parameters=get_type_parameters(cls),
+        )
 
-    def parse(self, cls: Type) -> PyClass:
-        if not self.accepts_class(cls):
-            raise NotADataclassException(cls)
-        py_fields = []
-        for field in fields(cls):
-            py_fields.append(PyField(name=field.name, type=field.type))
+    def _get_declaring_classes(self, cls: Type) -> Dict[str, Type]:
+        declaring_classes = {}
+        for base in reversed(cls.__mro__):
+            if "__dataclass_fields__" in vars(base):
+                for name in vars(base).get("__annotations__", {}):
+                    declaring_classes[name] = base
+        return declaring_classes
 
-        return PyClass(name=cls.__name__, type=cls, fields=tuple(py_fields))
+    def _get_fields(self, cls: Type) -> Optional[Tuple[Field[Any], ...]]:
+        try:
+            return fields(cls)
+        except TypeError:
+            return None
@@ -0,0 +1,38 @@
+from typing import List, Optional
+
+from py_typescript_generator.model.model_object_table import ModelObjectTable
+from py_typescript_generator.model_parser.class_parsers.abstract_class_parser import (
+    AbstractClassParser,
+)
+from py_typescript_generator.model_parser.class_parsers.attrs_class_parser import (
+    AttrsClassParser,
+)
+from py_typescript_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py_typescript_generator.model_parser.class_parsers.msgspec_struct_parser import (
+    MsgspecStructParser,
+)
+from py_typescript_generator.model_parser.class_parsers.named_tuple_parser import (
+    NamedTupleParser,
+)
+from py_typescript_generator.model_parser.class_parsers.pydantic_model_parser import (
+    PydanticModelParser,
+)
+from py_typescript_generator.model_parser.class_parsers.typed_dict_parser import (
+    TypedDictParser,
+)
+
+
+def create_default_parsers(
+    model_object_table: Optional[ModelObjectTable] = None,
+) -> List[AbstractClassParser]:
+    model_object_table = model_object_table or ModelObjectTable()
+    return [
+        DataclassParser(model_object_table=model_object_table),
+        MsgspecStructParser(model_object_table=model_object_table),
+        AttrsClassParser(model_object_table=model_object_table),
+        PydanticModelParser(model_object_table=model_object_table),
+        TypedDictParser(model_object_table=model_object_table),
+        NamedTupleParser(model_object_table=model_object_table),
+    ]
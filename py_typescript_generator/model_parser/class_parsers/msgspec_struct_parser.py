@@ -0,0 +1,95 @@
+import sys
+from typing import Type, Optional, Any, Dict, Tuple
+
+from py_typescript_generator.model.py_class import PyClass, TaggedUnionInformation
+from py_typescript_generator.model_parser.class_parsers.abstract_class_parser import (
+    AbstractAnnotationClassParser,
+)
+from py_typescript_generator.typing_utils.typing_utils import (
+    get_type_parameters,
+    get_base_type_arguments,
+    bind_type_arguments,
+)
+
+
+class NotAMsgspecStructException(RuntimeError):
+    def __init__(self, cls: Type):
+        super(NotAMsgspecStructException, self).__init__(
+            f"The class {cls} is not a msgspec Struct."
+        )
+
+
+def is_msgspec_struct(cls: Type) -> bool:
+    # msgspec is never imported here. If it was not imported by the application,
+    # no class can be a Struct, so startup does not pay for the import
+    msgspec = sys.modules.get("msgspec")
+    if msgspec is None:
+        return False
+    try:
+        return issubclass(cls, msgspec.Struct)
+    except TypeError:
+        return False
+
+
+class MsgspecStructParser(AbstractAnnotationClassParser):
+    not_accepted_exception = NotAMsgspecStructException
+
+    def accepts_class(self, cls: Type) -> bool:
+        return is_msgspec_struct(cls)
+
+    def try_parse(self, cls: Type) -> Optional[PyClass]:
+        if not self.accepts_class(cls):
+            return None
+
+        # the encoded names already contain renames like rename="camel", so they
+        # are used as aliases and are not converted again by the compiler
+        annotations = self._get_annotations(cls)
+        # type variables of generic base structs are replaced by the arguments the
+        # struct binds them to, like Foo of class FooPage(Page[Foo])
+        base_type_arguments = get_base_type_arguments(cls)
+        py_fields = []
+        for name, encode_name in zip(
+            cls.__struct_fields__, cls.__struct_encode_fields__
+        ):
+            defining_class, annotation = annotations[name]
+            py_fields.append(
+                self._model_object_table.get_field(
+                    name,
+                    bind_type_arguments(
+                        self._annotation_resolver.resolve(defining_class, annotation),
+                        base_type_arguments.get(defining_class, {}),
+                    ),
+                    alias=encode_name if encode_name != name else None,
+                )
+            )
+
+        return PyClass(
+            name=cls.__name__,
+            type=cls,
+            fields=tuple(py_fields),
+            tagged_union_information=self._get_tagged_union_information(cls),
+            type_parameters=get_type_parameters(cls),
+        )
+
+    def _get_annotations(self, cls: Type) -> Dict[str, Tuple[Type, Any]]:
+        # annotations are resolved in the module of the class declaring them
+        annotations: Dict[str, Tuple[Type, Any]] = {}
+        for defining_class in reversed(cls.__mro__):
+            for name, annotation in (
+                vars(defining_class).get("__annotations__", {}).items()
+            ):
+                annotations[name] = (defining_class, annotation)
+        return annotations
+
+    def _get_tagged_union_information(
+        self, cls: Type
+    ) -> Optional[TaggedUnionInformation]:
+        # integer tags can not be expressed as discriminant literals
+        config = cls.__struct_config__
+        if config.tag_field is None or not isinstance(config.tag, str):
+            return None
+        return TaggedUnionInformation(
+            discriminant_attribute=config.tag_field,
+            discriminant_literal=config.tag,
+            discriminant_attribute_is_alias=True,
+        )
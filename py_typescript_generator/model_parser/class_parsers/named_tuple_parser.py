@@ -0,0 +1,54 @@
+from typing import Type, Optional
+
+from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model_parser.class_parsers.abstract_class_parser import (
+    AbstractAnnotationClassParser,
+)
+from py_typescript_generator.typing_utils.typing_utils import (
+    is_named_tuple,
+    get_type_parameters,
+)
+
+
+class NotANamedTupleException(RuntimeError):
+    def __init__(self, cls: Type):
+        super(NotANamedTupleException, self).__init__(
+            f"The class {cls} is not a NamedTuple."
+        )
+
+
+class UntypedNamedTupleFieldException(RuntimeError):
+    def __init__(self, cls: Type, name: str):
+        super(UntypedNamedTupleFieldException, self).__init__(
+            f"The field {name} of named tuple {cls} has no type."
+        )
+
+
+class NamedTupleParser(AbstractAnnotationClassParser):
+    # fields keep the order of _fields, the compiler maps named tuples to tuples
+    not_accepted_exception = NotANamedTupleException
+
+    def accepts_class(self, cls: Type) -> bool:
+        return is_named_tuple(cls)
+
+    def try_parse(self, cls: Type) -> Optional[PyClass]:
+        if not self.accepts_class(cls):
+            return None
+
+        # collections.namedtuple() creates tuples without annotations
+        annotations = getattr(cls, "__annotations__", {})
+        for name in cls._fields:
+            if name not in annotations:
+                raise UntypedNamedTupleFieldException(cls, name)
+        field_types = self._annotation_resolver.resolve_all(
+            cls, (annotations[name] for name in cls._fields)
+        )
+        return PyClass(
+            name=cls.__name__,
+            type=cls,
+            fields=tuple(
+                self._model_object_table.get_field(name, field_type)
+                for name, field_type in zip(cls._fields, field_types)
+            ),
+            type_parameters=get_type_parameters(cls),
+        )
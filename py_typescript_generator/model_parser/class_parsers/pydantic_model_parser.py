@@ -0,0 +1,159 @@
+import sys
+from typing import Type, Optional, Dict, List, Any, Iterable, Literal, Iterator
+
+from typing_inspect import get_args, get_origin  # type: ignore
+
+from py_typescript_generator.model.model_object_table import ModelObjectTable
+from py_typescript_generator.model.py_class import PyClass, TaggedUnionInformation
+from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.model_parser.class_parsers.abstract_class_parser import (
+    AbstractAnnotationClassParser,
+)
+from py_typescript_generator.model_parser.class_parsers.annotation_resolver import (
+    AnnotationResolver,
+)
+
+
+class NotAPydanticModelException(RuntimeError):
+    def __init__(self, cls: Type):
+        super(NotAPydanticModelException, self).__init__(
+            f"The class {cls} is not a pydantic model."
+        )
+
+
+def is_pydantic_model(cls: Type) -> bool:
+    # pydantic is never imported here. If it was not imported by the application,
+    # no class can be a model
+    pydantic = sys.modules.get("pydantic")
+    if pydantic is None:
+        return False
+    try:
+        return issubclass(cls, pydantic.BaseModel)
+    except TypeError:
+        return False
+
+
+class PydanticModelParser(AbstractAnnotationClassParser):
+    # fields are read from model_fields, which pydantic computes when the class is
+    # created. Models are never instantiated and schemas are never rebuilt, forward
+    # references of incomplete models are resolved with the AnnotationResolver
+    not_accepted_exception = NotAPydanticModelException
+
+    def __init__(
+        self,
+        annotation_resolver: Optional[AnnotationResolver] = None,
+        model_object_table: Optional[ModelObjectTable] = None,
+    ):
+        super(PydanticModelParser, self).__init__(
+            annotation_resolver, model_object_table
+        )
+        self._discriminators: Optional[Dict[Type, str]] = None
+
+    def accepts_class(self, cls: Type) -> bool:
+        return is_pydantic_model(cls)
+
+    def try_parse(self, cls: Type) -> Optional[PyClass]:
+        if not self.accepts_class(cls):
+            return None
+
+        # annotations of complete models are already evaluated by pydantic
+        declaring_classes = (
+            None if cls.__pydantic_complete__ else self._get_declaring_classes(cls)
+        )
+        py_fields: List[PyField] = []
+        tagged_union_information = None
+        discriminator = self._get_discriminators().get(cls)
+        for name, field_info in cls.model_fields.items():
+            if field_info.exclude is True:
+                continue
+            # serialization aliases include the ones of alias generators, so names
+            # are not converted again by the compiler
+            alias = field_info.serialization_alias or field_info.alias
+            field_type = field_info.annotation
+            if declaring_classes is not None:
+                field_type = self._annotation_resolver.resolve(
+                    declaring_classes.get(name, cls), field_type
+                )
+            discriminant_literal = (
+                _get_discriminant_literal(field_type)
+                if discriminator is not None and discriminator in (name, alias)
+                else None
+            )
+            if discriminant_literal is not None:
+                tagged_union_information = TaggedUnionInformation(
+                    discriminant_attribute=alias or name,
+                    discriminant_literal=discriminant_literal,
+                    discriminant_attribute_is_alias=True,
+                )
+                continue
+            py_fields.append(
+                self._model_object_table.get_field(
+                    name, field_type, alias=alias if alias != name else None
+                )
+            )
+
+        return PyClass(
+            name=cls.__name__,
+            type=cls,
+            fields=tuple(py_fields),
+            tagged_union_information=tagged_union_information,
+        )
+
+    def invalidate(self, types: Iterable[Type]) -> None:
+        super(PydanticModelParser, self).invalidate(types)
+        self._discriminators = None
+
+    def _get_discriminators(self) -> Dict[Type, str]:
+        # members of discriminated unions are only known to the models referencing
+        # them, so all loaded models are searched once. Members of unions with
+        # different discriminators are not tagged
+        if self._discriminators is None:
+            discriminators: Dict[Type, Optional[str]] = {}
+            for model in _iter_subclasses(sys.modules["pydantic"].BaseModel):
+                for field_info in vars(model).get("__pydantic_fields__", {}).values():
+                    if not isinstance(field_info.discriminator, str):
+                        continue
+                    for member in _iter_union_members(field_info.annotation):
+                        if (
+                            discriminators.setdefault(member, field_info.discriminator)
+                            != field_info.discriminator
+                        ):
+                            discriminators[member] = None
+            self._discriminators = {
+                member: discriminator
+                for member, discriminator in discriminators.items()
+                if discriminator is not None
+            }
+        return self._discriminators
+
+    def _get_declaring_classes(self, cls: Type) -> Dict[str, Type]:
+        # forward references are resolved in the module of the declaring class
+        declaring_classes = {}
+        for base in reversed(cls.__mro__):
+            for name in vars(base).get("__annotations__", {}):
+                declaring_classes[name] = base
+        return declaring_classes
+
+
+def _iter_subclasses(cls: Type) -> Iterator[Type]:
+    for subclass in cls.__subclasses__():
+        yield subclass
+        yield from _iter_subclasses(subclass)
+
+
+def _iter_union_members(annotation: Any) -> Iterator[Type]:
+    # the members of Optional[Union[...]] and List[Union[...]] are tagged as well
+    for arg in get_args(annotation):
+        if is_pydantic_model(arg):
+            yield arg
+        else:
+            yield from _iter_union_members(arg)
+
+
+def _get_discriminant_literal(field_type: Any) -> Optional[str]:
+    if get_origin(field_type) is not Literal:
+        return None
+    values = get_args(field_type)
+    if len(values) != 1 or not isinstance(values[0], str):
+        return None
+    return values[0]
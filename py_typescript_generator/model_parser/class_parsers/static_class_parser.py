@@ -0,0 +1,106 @@
+from typing import Type, Optional, Dict, Any, Mapping, List, Tuple
+
+from py_typescript_generator.model.model_object_table import ModelObjectTable
+from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.model_parser.class_parsers.abstract_class_parser import (
+    AbstractAnnotationClassParser,
+)
+from py_typescript_generator.model_parser.class_parsers.annotation_resolver import (
+    AnnotationResolver,
+)
+from py_typescript_generator.static_analysis.static_class_definition import (
+    get_static_class_definition,
+    StaticField,
+)
+from py_typescript_generator.static_analysis.static_module_loader import (
+    StaticModuleLoader,
+)
+from py_typescript_generator.typing_utils.typing_utils import (
+    get_type_parameters,
+    get_base_type_arguments,
+    bind_type_arguments,
+)
+
+
+class NotAStaticDataclassException(RuntimeError):
+    def __init__(self, cls: Type):
+        super(NotAStaticDataclassException, self).__init__(
+            f"The class {cls} is not a dataclass loaded from source."
+        )
+
+
+class StaticAnnotationResolver(AnnotationResolver):
+    def __init__(self, static_module_loader: StaticModuleLoader):
+        super(StaticAnnotationResolver, self).__init__()
+        self._static_module_loader = static_module_loader
+
+    def _get_namespace(self, module_name: str) -> Mapping[str, Any]:
+        namespace = self._static_module_loader.get_namespace(module_name)
+        if namespace is None:
+            return super(StaticAnnotationResolver, self)._get_namespace(module_name)
+        return namespace
+
+
+class StaticClassParser(AbstractAnnotationClassParser):
+    not_accepted_exception = NotAStaticDataclassException
+
+    def __init__(
+        self,
+        static_module_loader: StaticModuleLoader,
+        model_object_table: Optional[ModelObjectTable] = None,
+    ):
+        super(StaticClassParser, self).__init__(
+            StaticAnnotationResolver(static_module_loader), model_object_table
+        )
+
+    def accepts_class(self, cls: Type) -> bool:
+        static_class_definition = get_static_class_definition(cls)
+        return (
+            static_class_definition is not None and static_class_definition.is_dataclass
+        )
+
+    def try_parse(self, cls: Type) -> Optional[PyClass]:
+        if not self.accepts_class(cls):
+            return None
+
+        # like dataclasses, fields of base dataclasses come first and keep their
+        # position if they are redeclared
+        base_type_arguments = get_base_type_arguments(cls)
+        fields: Dict[str, PyField] = {}
+        for defining_class in reversed(cls.__mro__):
+            static_class_definition = get_static_class_definition(defining_class)
+            if (
+                static_class_definition is None
+                or not static_class_definition.is_dataclass
+            ):
+                continue
+            for py_field in self._resolve_fields(
+                defining_class,
+                static_class_definition.fields,
+                base_type_arguments.get(defining_class, {}),
+            ):
+                fields[py_field.name] = py_field
+
+        return PyClass(
+            name=cls.__name__,
+            type=cls,
+            fields=tuple(fields.values()),
+            type_parameters=get_type_parameters(cls),
+        )
+
+    def _resolve_fields(
+        self,
+        cls: Type,
+        static_fields: Tuple[StaticField, ...],
+        type_arguments: Mapping[Any, Any],
+    ) -> List[PyField]:
+        field_types = self._annotation_resolver.resolve_all(
+            cls, (static_field.annotation for static_field in static_fields)
+        )
+        return [
+            self._model_object_table.get_field(
+                static_field.name, bind_type_arguments(field_type, type_arguments)
+            )
+            for static_field, field_type in zip(static_fields, field_types)
+        ]
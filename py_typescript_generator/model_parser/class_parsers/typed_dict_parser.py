@@ -0,0 +1,68 @@
+from typing import Type, Optional, Any, Tuple, get_origin, get_args
+
+from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model_parser.class_parsers.abstract_class_parser import (
+    AbstractAnnotationClassParser,
+)
+from py_typescript_generator.typing_utils.typing_utils import (
+    is_typed_dict,
+    get_type_parameters,
+)
+
+# Required and NotRequired only exist in typing since Python 3.11, so they are
+# matched by name to support typing_extensions as well
+_REQUIREMENT_QUALIFIERS = {"Required", "NotRequired"}
+
+
+class NotATypedDictException(RuntimeError):
+    def __init__(self, cls: Type):
+        super(NotATypedDictException, self).__init__(
+            f"The class {cls} is not a TypedDict."
+        )
+
+
+class TypedDictParser(AbstractAnnotationClassParser):
+    # keys are read from __annotations__, which contains the keys of base
+    # TypedDicts as well. Keys which are not required are mapped as optional
+    not_accepted_exception = NotATypedDictException
+
+    def accepts_class(self, cls: Type) -> bool:
+        return is_typed_dict(cls)
+
+    def try_parse(self, cls: Type) -> Optional[PyClass]:
+        if not self.accepts_class(cls):
+            return None
+
+        annotations = cls.__annotations__
+        required_keys = cls.__required_keys__
+        field_types = self._annotation_resolver.resolve_all(cls, annotations.values())
+        py_fields = []
+        for name, field_type in zip(annotations, field_types):
+            field_type, is_required = self._strip_requirement_qualifiers(field_type)
+            if is_required is None:
+                is_required = name in required_keys
+            if not is_required:
+                field_type = Optional[field_type]
+            py_fields.append(self._model_object_table.get_field(name, field_type))
+
+        return PyClass(
+            name=cls.__name__,
+            type=cls,
+            fields=tuple(py_fields),
+            type_parameters=get_type_parameters(cls),
+        )
+
+    def _strip_requirement_qualifiers(
+        self, field_type: Any
+    ) -> Tuple[Any, Optional[bool]]:
+        # with postponed evaluation of annotations, typing can not see the
+        # qualifiers and lists all keys of total TypedDicts as required, so the
+        # outermost qualifier decides
+        is_required = None
+        qualifier = getattr(get_origin(field_type), "_name", None)
+        while qualifier in _REQUIREMENT_QUALIFIERS:
+            if is_required is None:
+                is_required = qualifier == "Required"
+            field_type = get_args(field_type)[0]
+            qualifier = getattr(get_origin(field_type), "_name", None)
+        return field_type, is_required
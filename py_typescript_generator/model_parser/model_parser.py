@@ -1,29 +1,20 @@
-import inspect
 import logging
-from collections import defaultdict
 from dataclasses import dataclass, field as dataclasses_field
-from datetime import datetime
-from enum import Enum
 from typing import (
     List,
     Type,
     TypeVar,
     Any,
-    Generic,
-    Union,
     Dict,
+    Iterable,
     Optional,
-    cast,
+    Iterator,
+    Union,
     Set,
 )
-from typing import _GenericAlias  # type: ignore
-from uuid import UUID
 
 from ordered_set import OrderedSet
 
-# Note: this can be removed once support for Python 3.7 is dropped
-from typing_inspect import get_args, get_origin, is_optional_type  # type: ignore
-
 from py_typescript_generator.model.model import Model
 from py_typescript_generator.model.py_class import (
     PyClass,
@@ -31,17 +22,38 @@ from py_typescript_generator.model.py_class import (
     TaggedUnionInformation,
 )
 from py_typescript_generator.model.py_enum import PyEnum, PyEnumValue
+from py_typescript_generator.model.type_dependency_graph import (
+    DependencyKind,
+    TypeDependencyGraph,
+)
 from py_typescript_generator.model_parser.class_parsers.abstract_class_parser import (
     AbstractClassParser,
 )
-from py_typescript_generator.typing_utils.typing_utils import (
-    get_wrapped_type_from_optional,
-    safe_unwrap,
+from py_typescript_generator.model_parser.class_parser_dispatcher import (
+    ClassParserDispatcher,
+)
+from py_typescript_generator.model_parser.class_hierarchy_index import (
+    ClassHierarchyIndex,
 )
+from py_typescript_generator.model_parser.parse_cache import ParseCache
+from py_typescript_generator.model_parser.parse_worklist import (
+    ParseWorklist,
+    ParseTask,
+    ParseTaskKind,
+)
+from py_typescript_generator.model_parser.parsed_types import ParsedTypes
+from py_typescript_generator.model_parser.reuse_table import ReuseTable, get_type_name
+from py_typescript_generator.typing_utils.type_descriptor import (
+    TypeDescriptorCache,
+    TypeKind,
+)
+from py_typescript_generator.typing_utils.type_filter import TypeFilter
+from py_typescript_generator.typing_utils.typing_utils import safe_unwrap
 
 logger = logging.getLogger(__name__)
 
 P = TypeVar("P", bound=AbstractClassParser)
+M = TypeVar("M", PyClass, PyEnum)
 
 
 class NoParserForClassFoundException(RuntimeError):
@@ -58,28 +70,11 @@ class IsNotAClassException(RuntimeError):
         )
 
 
-TERMINATING_CLASSES = {
-    int,
-    float,
-    complex,
-    str,
-    bytes,
-    bool,
-    datetime,
-    UUID,
-    list,
-    set,
-    dict,
-    frozenset,
-    tuple,
-    defaultdict,
-    Union,
-}
-
-
 @dataclass
 class ModelParserSettings:
     type_mapping_overrides: Dict[Type, Type] = dataclasses_field(default_factory=dict)
+    # traversal stops at excluded types, they are not part of the model
+    type_filter: TypeFilter = dataclasses_field(default_factory=TypeFilter)
 
 
 class ModelParser:
@@ -88,196 +83,406 @@ class ModelParser:
         classes_to_parse: List[Type],
         parsers: List[P],
         settings: ModelParserSettings,
+        type_descriptor_cache: Optional[TypeDescriptorCache] = None,
+        parse_cache: Optional[ParseCache] = None,
+        reuse_table: Optional[ReuseTable] = None,
     ):
         self._classes_to_parse = classes_to_parse
-        self._parsers = parsers
         self._settings = settings
+        self._worklist = ParseWorklist()
+        self._class_hierarchy_index = ClassHierarchyIndex()
+        self._class_parser_dispatcher = ClassParserDispatcher(parsers)
+        self._type_descriptors = type_descriptor_cache or TypeDescriptorCache()
+        self._parse_cache = parse_cache
+        # classes and enums of the reuse table are taken as parsed
+        self._reuse_table = reuse_table if reuse_table is not None else ReuseTable()
 
     def parse(self) -> Model:
-        visited_classes: OrderedSet[PyClass] = OrderedSet()
-        visited_enums: OrderedSet[PyEnum] = OrderedSet()
-        for cls in self._classes_to_parse:
-            self._parse_class(cls, visited_classes, visited_enums)
+        parsed_types = ParsedTypes()
+        for _ in self._iter_parse(parsed_types):
+            pass
+        return parsed_types.to_model()
+
+    def iter_parse(self) -> Iterator[Union[PyClass, PyEnum]]:
+        # classes and enums are yielded in model order, tagged union classes once
+        # all related classes are parsed
+        return self._iter_parse(ParsedTypes(retain_parsed_types=False))
+
+    def _iter_parse(
+        self, parsed_types: ParsedTypes
+    ) -> Iterator[Union[PyClass, PyEnum]]:
+        self._class_hierarchy_index.refresh()
+        self._worklist = ParseWorklist()
+        self._worklist.schedule_types(self._classes_to_parse)
+        while self._worklist:
+            self._process_task(self._worklist.pop(), parsed_types)
+            yield from parsed_types.pop_finalized()
+
+    def update(
+        self,
+        previous_model: Model,
+        changed_types: Iterable[Type],
+        removed_types: Iterable[Type] = (),
+    ) -> Model:
+        changed_types = list(changed_types)
+        removed_types = list(removed_types)
+        self._class_parser_dispatcher.invalidate([*changed_types, *removed_types])
+        self._replace_classes_to_parse(changed_types, removed_types)
+
+        # only the dirty types are traversed again, the clean types of the previous
+        # model are taken over together with their dependencies
+        self._class_hierarchy_index.refresh()
+        dirty_types = self._get_dirty_types(
+            previous_model, changed_types, removed_types
+        )
+        reuse_table = self._reuse_table
+        self._reuse_table = ReuseTable.of_unchanged_types(
+            Model(
+                classes=OrderedSet(
+                    py_class
+                    for py_class in previous_model.classes
+                    if py_class.type in dirty_types
+                ),
+                enums=OrderedSet(
+                    py_enum
+                    for py_enum in previous_model.enums
+                    if py_enum.type in dirty_types
+                ),
+            ),
+            [*changed_types, *removed_types],
+            self._type_descriptors,
+        )
+        try:
+            return self._update(previous_model, dirty_types)
+        finally:
+            self._reuse_table = reuse_table
+
+    def _update(self, previous_model: Model, dirty_types: Set[Type]) -> Model:
+        parsed_types = ParsedTypes()
+        for py_class in previous_model.classes:
+            if py_class.type not in dirty_types:
+                parsed_types.add_class(py_class)
+        for py_enum in previous_model.enums:
+            if py_enum.type not in dirty_types:
+                parsed_types.add_enum(py_enum)
+        previous_graph = previous_model.dependency_graph
+        for source, target, kinds in previous_graph.iter_dependencies():
+            if source not in dirty_types:
+                for kind in kinds:
+                    parsed_types.add_dependency(source, target, kind)
+        parsed_types.pop_finalized()
+
+        # every dependent of a dirty type is dirty as well, so the dirty types still
+        # referenced are reached from the roots, while clean roots are only visited
+        self._worklist = ParseWorklist()
+        self._worklist.schedule_types(self._classes_to_parse)
+        while self._worklist:
+            self._process_task(self._worklist.pop(), parsed_types)
+
+        return self._merge_into_previous_model(
+            previous_model, parsed_types, dirty_types
+        )
 
-        return Model(classes=visited_classes, enums=visited_enums)
+    def _get_dirty_types(
+        self,
+        previous_model: Model,
+        changed_types: List[Type],
+        removed_types: List[Type],
+    ) -> Set[Type]:
+        hierarchy = self._class_hierarchy_index
+        changed_type_names = {
+            get_type_name(cls) for cls in [*changed_types, *removed_types]
+        }
+        # tagged union parents list their children, and children inherit the fields
+        # of their parents
+        parent_names = {
+            get_type_name(parent)
+            for cls in [*changed_types, *removed_types]
+            for parent in hierarchy.get_parent_classes(cls)
+        }
+        dirty_types = {
+            py_enum.type
+            for py_enum in previous_model.enums
+            if get_type_name(py_enum.type) in changed_type_names
+        }
+        for py_class in previous_model.classes:
+            type_name = get_type_name(py_class.type)
+            if (
+                type_name in changed_type_names
+                or type_name in parent_names
+                or any(
+                    get_type_name(parent) in changed_type_names
+                    for parent in hierarchy.get_parent_classes(py_class.type)
+                )
+            ):
+                dirty_types.add(py_class.type)
+        return dirty_types | previous_model.dependency_graph.get_transitive_dependents(
+            dirty_types
+        )
+
+    def _merge_into_previous_model(
+        self,
+        previous_model: Model,
+        parsed_types: ParsedTypes,
+        dirty_types: Set[Type],
+    ) -> Model:
+        # types no longer referenced by any root are dropped
+        parsed_model = parsed_types.to_model()
+        reachable_types = {
+            *parsed_types.root_types,
+            *parsed_model.dependency_graph.get_transitive_dependencies(
+                parsed_types.root_types
+            ),
+        }
+        dependency_graph = TypeDependencyGraph()
+        for source, target, kinds in parsed_model.dependency_graph.iter_dependencies():
+            if source in reachable_types:
+                for kind in kinds:
+                    dependency_graph.add_dependency(source, target, kind)
+        return Model(
+            classes=_merge_in_previous_order(
+                previous_model.classes,
+                parsed_model.classes,
+                dirty_types,
+                reachable_types,
+            ),
+            enums=_merge_in_previous_order(
+                previous_model.enums,
+                parsed_model.enums,
+                dirty_types,
+                reachable_types,
+            ),
+            dependency_graph=dependency_graph,
+        )
 
-    def _parse_class(
+    @property
+    def frontier(self) -> List[Type]:
+        return self._worklist.frontier
+
+    def _replace_classes_to_parse(
+        self, changed_types: List[Type], removed_types: List[Type]
+    ) -> None:
+        changed_types_by_name = {get_type_name(cls): cls for cls in changed_types}
+        removed_type_names = {get_type_name(cls) for cls in removed_types}
+        self._classes_to_parse = [
+            changed_types_by_name.get(get_type_name(cls), cls)
+            for cls in self._classes_to_parse
+            if get_type_name(cls) not in removed_type_names
+        ]
+
+    def _process_task(self, task: ParseTask, parsed_types: ParsedTypes) -> None:
+        if task.kind == ParseTaskKind.VISIT_TYPE:
+            self._visit_type(task, parsed_types)
+        elif task.kind == ParseTaskKind.FINISH_TAGGED_UNION_CLASS:
+            py_class = safe_unwrap(task.py_class)
+            parsed_types.move_class_to_end(py_class)
+            self._schedule_fields(py_class)
+
+    def _visit_type(
         self,
-        cls: Type,
-        visited_classes: OrderedSet[PyClass],
-        visited_enums: OrderedSet[PyEnum],
+        task: ParseTask,
+        parsed_types: ParsedTypes,
     ) -> None:
-        if cls in {x.type for x in visited_classes}:
+        cls = task.type
+        if parsed_types.contains_class(cls):
+            self._add_dependency(task, parsed_types)
             return
-        if not self._is_class(cls):
+        # the kind of a type is classified once and dispatched by a single lookup
+        type_descriptor = self._type_descriptors.get(cls)
+        kind = type_descriptor.kind
+        if kind == TypeKind.INVALID:
             raise IsNotAClassException(cls)
 
+        # wrapping types are not part of the model, so the types they wrap are
+        # recorded as dependencies of the type referencing the wrapping type
         type_override = self._settings.type_mapping_overrides.get(cls)
         if type_override:
-            return self._parse_class(type_override, visited_classes, visited_enums)
-
-        is_enum = self._is_enum(cls)
-        if is_enum:
-            self._parse_enum(cls, visited_enums)
+            self._worklist.schedule_types(
+                [type_override], task.source, task.dependency_kind
+            )
             return
 
-        if is_optional_type(cls):
-            self._parse_class(
-                get_wrapped_type_from_optional(cls), visited_classes, visited_enums
+        if kind == TypeKind.SCALAR or kind == TypeKind.LITERAL:
+            return
+        if kind == TypeKind.OPTIONAL:
+            self._worklist.schedule_types(
+                [type_descriptor.wrapped_type], task.source, task.dependency_kind
             )
             return
-
-        has_generic_args = len(get_args(cls)) > 0
-        if has_generic_args:
-            for arg in get_args(cls):
-                self._parse_class(arg, visited_classes, visited_enums)
-
-        if self._is_terminating_class(cls):
+        if kind == TypeKind.TERMINAL:
+            self._worklist.schedule_types(
+                type_descriptor.args, task.source, task.dependency_kind
+            )
             return
 
-        for parser in self._parsers:
-            if parser.accepts_class(cls):
-                py_class = parser.parse(cls)
-                visited_classes.add(py_class)
-                if self._is_tagged_union_class(cls):
-                    new_py_cls = self._parse_as_tagged_union_class(
-                        py_class, visited_classes, visited_enums
-                    )
-                    visited_classes.remove(py_class)
-                    visited_classes.add(new_py_cls)
-                    py_class = new_py_cls
-                self._parse_fields(py_class, visited_classes, visited_enums)
+        if kind == TypeKind.ENUM:
+            if self._settings.type_filter.is_excluded(cls):
                 return
+            self._add_dependency(task, parsed_types)
+            self._parse_enum(cls, parsed_types)
+            return
 
-        raise NoParserForClassFoundException(cls)
-
-    def _parse_fields(
-        self,
-        py_class: PyClass,
-        visited_classes: OrderedSet[PyClass],
-        visited_enums: OrderedSet[PyEnum],
-    ) -> None:
-        for field in py_class.fields:
-            if field.type not in {x.type for x in visited_classes}:
-                self._parse_class(field.type, visited_classes, visited_enums)
-
-    def _is_class(self, cls: Type) -> bool:
-        if (
-            isinstance(cls, _GenericAlias)
-            or isinstance(cls, Generic)  # type: ignore
-            or isinstance(cls, TypeVar)
-        ):
-            return True
-        return inspect.isclass(cls)
-
-    def _is_terminating_class(self, cls: Type) -> bool:
-        origin = get_origin(cls)
-        if origin:
-            return origin in TERMINATING_CLASSES
-        if isinstance(cls, TypeVar):
-            return True
-        return cls in TERMINATING_CLASSES
-
-    def _parse_enum(self, cls: Type, visited_enums: OrderedSet[PyEnum]) -> None:
-        if cls not in {x.type for x in visited_enums}:
-            visited_enums.add(
-                PyEnum(
-                    name=cls.__name__,
-                    type=cls,
-                    values=tuple([PyEnumValue(e.name, e.value) for e in cls]),
-                )
+        if self._settings.type_filter.is_excluded(type_descriptor.origin or cls):
+            return
+        if kind == TypeKind.GENERIC:
+            # generic classes are parsed once, instantiations like Page[Foo] are not
+            # part of the model. The referencing type depends on the generic class
+            # and on the type arguments
+            self._worklist.schedule(
+                [
+                    *(
+                        ParseTask.visit_type(
+                            arg, task.source, DependencyKind.GENERIC_ARGUMENT
+                        )
+                        for arg in type_descriptor.args
+                    ),
+                    ParseTask.visit_type(
+                        safe_unwrap(type_descriptor.origin),
+                        task.source,
+                        task.dependency_kind,
+                    ),
+                ]
             )
+            return
 
-    def _is_enum(self, cls: Type) -> bool:
-        try:
-            return issubclass(cls, Enum)
-        except TypeError:
-            return False
+        self._add_dependency(task, parsed_types)
+        self._parse_class(cls, parsed_types)
+
+    def _add_dependency(self, task: ParseTask, parsed_types: ParsedTypes) -> None:
+        if task.source is None:
+            parsed_types.add_root_type(task.type)
+        else:
+            parsed_types.add_dependency(task.source, task.type, task.dependency_kind)
+
+    def _parse_class(self, cls: Type, parsed_types: ParsedTypes) -> None:
+        py_class = self._reuse_table.get_class(cls)
+        if py_class is None and self._parse_cache:
+            py_class = self._parse_cache.get_class(cls)
+        if py_class is None:
+            py_class = self._class_parser_dispatcher.try_parse(cls)
+            if py_class is None:
+                raise NoParserForClassFoundException(cls)
+            if self._parse_cache:
+                self._parse_cache.add_class(py_class)
+
+        if self._class_hierarchy_index.is_tagged_union_class(cls):
+            self._parse_as_tagged_union_class(py_class, parsed_types)
+        else:
+            parsed_types.add_class(py_class)
+            self._schedule_fields(py_class)
 
-    def _is_tagged_union_class(self, cls: Type) -> bool:
-        return self._read_discriminant_union_attribute_name(cls) is not None
+    def _schedule_fields(self, py_class: PyClass) -> None:
+        self._worklist.schedule_types(
+            (field.type for field in py_class.fields), py_class.type
+        )
+
+    def _parse_enum(self, cls: Type, parsed_types: ParsedTypes) -> None:
+        if parsed_types.contains_enum(cls):
+            return
+        py_enum = self._reuse_table.get_enum(cls)
+        if py_enum is None and self._parse_cache:
+            py_enum = self._parse_cache.get_enum(cls)
+        if py_enum is None:
+            py_enum = PyEnum(
+                name=cls.__name__,
+                type=cls,
+                values=tuple([PyEnumValue(e.name, e.value) for e in cls]),
+            )
+            if self._parse_cache:
+                self._parse_cache.add_enum(py_enum)
+        parsed_types.add_enum(py_enum)
 
     def _parse_as_tagged_union_class(
         self,
         py_class: PyClass,
-        visited_classes: OrderedSet[PyClass],
-        visited_enums: OrderedSet[PyEnum],
-    ) -> PyClass:
-        if self._is_tagged_union_root(py_class):
-            child_classes = self._get_child_classes(py_class.type)
+        parsed_types: ParsedTypes,
+    ) -> None:
+        related_classes: Iterable[Type]
+        dependency_kind: DependencyKind
+        tagged_union_information: TaggedUnionInformation
+        hierarchy = self._class_hierarchy_index
+        if hierarchy.is_tagged_union_root(py_class.type):
+            child_classes = [
+                child
+                for child in hierarchy.get_child_classes(py_class.type)
+                if not self._settings.type_filter.is_excluded(child)
+            ]
 
             discriminant_literals = set()
 
-            parent_discriminator = self._read_discriminant_union_attribute(
-                py_class.type
-            )
+            parent_discriminator = hierarchy.get_discriminant_literal(py_class.type)
             if parent_discriminator:
                 discriminant_literals.add(parent_discriminator)
 
             for child in child_classes:
-                discriminant_literals.add(
-                    self._read_discriminant_union_attribute(child)
-                )
-                self._parse_class(child, visited_classes, visited_enums)
+                discriminant_literals.add(hierarchy.get_discriminant_literal(child))
 
-            tagged_union_information: TaggedUnionInformation = (
-                RootTaggedUnionInformation(
-                    discriminant_attribute=safe_unwrap(
-                        self._read_discriminant_union_attribute_name(py_class.type)
-                    ),
-                    discriminant_literal=safe_unwrap(
-                        self._read_discriminant_union_attribute(py_class.type)
-                    ),
-                    discriminant_literals=frozenset(discriminant_literals),
-                    child_types=frozenset(child_classes),
-                )
+            related_classes = child_classes
+            dependency_kind = DependencyKind.TAGGED_UNION_CHILD
+            tagged_union_information = RootTaggedUnionInformation(
+                discriminant_attribute=safe_unwrap(
+                    hierarchy.get_discriminant_attribute_name(py_class.type)
+                ),
+                discriminant_literal=safe_unwrap(parent_discriminator),
+                discriminant_literals=frozenset(discriminant_literals),
+                child_types=frozenset(child_classes),
             )
-            return py_class.with_tagged_union_information(tagged_union_information)
         else:
-            parent_classes = self._get_parent_classes(py_class.type)
-            for parent_class in parent_classes:
-                self._parse_class(parent_class, visited_classes, visited_enums)
+            related_classes = hierarchy.get_parent_classes(py_class.type)
+            dependency_kind = DependencyKind.TAGGED_UNION_PARENT
             tagged_union_information = TaggedUnionInformation(
                 discriminant_attribute=safe_unwrap(
-                    self._read_discriminant_union_attribute_name(py_class.type)
-                ),
-                discriminant_literal=safe_unwrap(
-                    self._read_discriminant_union_attribute(py_class.type)
+                    hierarchy.get_discriminant_attribute_name(py_class.type)
                 ),
+                discriminant_literal=hierarchy.get_discriminant_literal(py_class.type),
             )
-            return py_class.with_tagged_union_information(tagged_union_information)
-
-    def _is_tagged_union_root(self, py_class):
-        parents = self._get_parent_classes(py_class.type)
-        if not parents:
-            return True
-        return not any(filter(lambda x: self._is_tagged_union_class(x), parents))
-
-    def _get_parent_classes(self, cls: Type) -> Set[Type]:
-        parents = {*inspect.getmro(cls)}
-        parents.remove(cls)
-        parents.remove(object)
-        return parents
-
-    def _get_child_classes(self, cls: Type) -> OrderedSet[Type]:
-        classes: OrderedSet[Type] = OrderedSet()
-        for cl in cls.__subclasses__():
-            classes.add(cl)
-            classes.update(self._get_child_classes(cl))
-        return classes
-
-    def _read_discriminant_union_attribute_name(self, cls: Type) -> Optional[str]:
-        try:
-            return cast(str, getattr(cls, "__json_type_info_attribute__"))
-        except AttributeError:
-            return None
 
-    def _read_discriminant_union_attribute(self, cls: Type) -> str:
-        attr_name = getattr(cls, "__json_type_info_attribute__")
-        try:
-            attr = getattr(cls, attr_name)
-        except AttributeError:
-            return ""
-        if isinstance(attr, Enum):
-            return attr.name
-        return cast(str, attr)
+        # the tagged union class is moved to the end of the model once all related
+        # classes are parsed, so roots are placed after their children
+        tagged_py_class = py_class.with_tagged_union_information(
+            tagged_union_information
+        )
+        parsed_types.add_class(tagged_py_class, is_final=False)
+        self._worklist.schedule(
+            [
+                *(
+                    ParseTask.visit_type(cls, py_class.type, dependency_kind)
+                    for cls in related_classes
+                ),
+                ParseTask.finish_tagged_union_class(tagged_py_class),
+            ]
+        )
+
+
+def _merge_in_previous_order(
+    previous_types: OrderedSet[M],
+    parsed_types: OrderedSet[M],
+    dirty_types: Set[Type],
+    reachable_types: Set[Type],
+) -> OrderedSet[M]:
+    # clean types keep their position, the reparsed types take the position of the
+    # first dirty type in their parse order
+    parsed_by_type = {parsed_type.type: parsed_type for parsed_type in parsed_types}
+    clean_types = {
+        previous_type.type
+        for previous_type in previous_types
+        if previous_type.type not in dirty_types
+    }
+    reparsed_types = [
+        parsed_type
+        for parsed_type in parsed_types
+        if parsed_type.type not in clean_types
+    ]
+    merged_types: List[M] = []
+    for previous_type in previous_types:
+        if previous_type.type in dirty_types:
+            merged_types.extend(reparsed_types)
+            reparsed_types = []
+        elif previous_type.type in parsed_by_type:
+            merged_types.append(parsed_by_type[previous_type.type])
+    merged_types.extend(reparsed_types)
+    return OrderedSet(
+        merged_type
+        for merged_type in merged_types
+        if merged_type.type in reachable_types
+    )
@@ -0,0 +1,243 @@
+import dataclasses
+import importlib
+import logging
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import List, Type, Callable, Optional, Dict, Tuple, Any, Set, FrozenSet
+
+from ordered_set import OrderedSet
+
+from py_typescript_generator.model.model import Model
+from py_typescript_generator.model.model_object_table import ModelObjectTable
+from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model.py_enum import PyEnum
+from py_typescript_generator.model_parser.class_parsers.abstract_class_parser import (
+    AbstractClassParser,
+)
+from py_typescript_generator.model_parser.class_parsers.default_parsers import (
+    create_default_parsers,
+)
+from py_typescript_generator.model_parser.model_parser import (
+    ModelParser,
+    ModelParserSettings,
+)
+from py_typescript_generator.model_parser.reuse_table import ReuseTable
+from py_typescript_generator.serialization.model_snapshot import (
+    ModelSnapshot,
+    UnsupportedEnumValueException,
+)
+from py_typescript_generator.serialization.type_reference_codec import (
+    TypeReferenceCodec,
+    EncodedTypeReference,
+    UnsupportedTypeReferenceException,
+    import_class,
+)
+
+logger = logging.getLogger(__name__)
+
+ParserFactory = Callable[[], List[AbstractClassParser]]
+
+
+@dataclass
+class _ParseShard:
+    type_references: List[EncodedTypeReference]
+    module: str
+    # names of the types parsed in earlier rounds or by other shards of this round
+    parsed_type_names: FrozenSet[str]
+    # modules of all shards are imported, so subclasses defined in other shards are
+    # found for tagged unions like in a single process
+    modules: List[str]
+    settings: ModelParserSettings
+    parser_factory: ParserFactory
+
+
+class _ShardReuseTable(ReuseTable):
+    # the traversal of a shard stops at types of other modules and at types parsed
+    # already. Types of other modules, which are not parsed yet, are collected for
+    # the next round, so each class is only parsed by one shard
+    def __init__(self, shard: _ParseShard, codec: TypeReferenceCodec):
+        super(_ShardReuseTable, self).__init__()
+        self._module = shard.module
+        self._root_type_names = {
+            reference["ref"]
+            for reference in shard.type_references
+            if "ref" in reference
+        }
+        self._parsed_type_names = shard.parsed_type_names
+        self._codec = codec
+        self.foreign_types: Set[Type] = set()
+        self.foreign_type_references: Dict[str, EncodedTypeReference] = {}
+
+    def get_class(self, cls: Type) -> Optional[PyClass]:
+        try:
+            reference = self._codec.encode(cls)
+        except UnsupportedTypeReferenceException:
+            return None
+        type_name = reference.get("ref")
+        if type_name is None or type_name in self._root_type_names:
+            return None
+        if type_name not in self._parsed_type_names:
+            if cls.__module__ == self._module:
+                return None
+            self.foreign_type_references[type_name] = reference
+        self.foreign_types.add(cls)
+        return PyClass(name=cls.__name__, type=cls, fields=())
+
+
+def _parse_shard(shard: _ParseShard) -> Tuple[bytes, List[EncodedTypeReference]]:
+    for module_name in shard.modules:
+        importlib.import_module(module_name)
+    codec = TypeReferenceCodec()
+    types = [codec.decode(reference) for reference in shard.type_references]
+    reuse_table = _ShardReuseTable(shard, codec)
+    model = ModelParser(
+        types, shard.parser_factory(), shard.settings, reuse_table=reuse_table
+    ).parse()
+    parsed_classes = [
+        py_class
+        for py_class in model.classes
+        if py_class.type not in reuse_table.foreign_types
+    ]
+    return (
+        ModelSnapshot.dump(
+            Model(classes=OrderedSet(parsed_classes), enums=model.enums)
+        ),
+        list(reuse_table.foreign_type_references.values()),
+    )
+
+
+class _CachingClassResolver:
+    # types referenced by several shards are only imported once
+    def __init__(self) -> None:
+        self._classes: Dict[Tuple[str, str], Any] = {}
+
+    def __call__(self, module_name: str, qualname: str) -> Any:
+        key = (module_name, qualname)
+        cls = self._classes.get(key)
+        if cls is None:
+            cls = import_class(module_name, qualname)
+            self._classes[key] = cls
+        return cls
+
+
+class ParallelModelParser:
+    def __init__(
+        self,
+        classes_to_parse: List[Type],
+        settings: ModelParserSettings,
+        parser_factory: ParserFactory = create_default_parsers,
+        max_workers: Optional[int] = None,
+        model_object_table: Optional[ModelObjectTable] = None,
+    ):
+        self._classes_to_parse = classes_to_parse
+        self._settings = settings
+        self._parser_factory = parser_factory
+        self._max_workers = max_workers
+        # fields of classes parsed in workers are shared in this process
+        self._model_object_table = model_object_table
+
+    def parse(self) -> Model:
+        # root types are sharded by module and each shard is parsed in a worker
+        # process. Workers return snapshots, which reference types by qualified
+        # name, and the types of other modules they reached, which are parsed in
+        # the next round. The model is built from the parsed classes in this process
+        # like by a single ModelParser, so it has the same order
+        shards = self._create_root_shards()
+        if len(shards) < 2 or self._max_workers == 1 or not self._is_picklable():
+            return self._parse_locally(ReuseTable())
+
+        codec = TypeReferenceCodec(_CachingClassResolver())
+        modules = sorted(shards)
+        parsed_type_names: Set[str] = set()
+        classes: Dict[Type, PyClass] = {}
+        enums: Dict[Type, PyEnum] = {}
+        with ProcessPoolExecutor(max_workers=self._max_workers) as executor:
+            while shards:
+                parsed_type_names.update(
+                    reference["ref"]
+                    for references in shards.values()
+                    for reference in references
+                    if "ref" in reference
+                )
+                futures = [
+                    executor.submit(
+                        _parse_shard,
+                        _ParseShard(
+                            type_references=shards[module_name],
+                            module=module_name,
+                            parsed_type_names=frozenset(parsed_type_names),
+                            modules=modules,
+                            settings=self._settings,
+                            parser_factory=self._parser_factory,
+                        ),
+                    )
+                    for module_name in sorted(shards)
+                ]
+                foreign_type_references: Dict[str, EncodedTypeReference] = {}
+                for future in futures:
+                    try:
+                        snapshot, references = future.result()
+                        model = ModelSnapshot(snapshot, codec).to_model()
+                    except (
+                        UnsupportedTypeReferenceException,
+                        UnsupportedEnumValueException,
+                    ) as e:
+                        # the types of the shard are parsed in this process
+                        logger.debug(f"Parsing shard in process: {e}")
+                        continue
+                    for py_class in model.classes:
+                        classes.setdefault(py_class.type, self._share_fields(py_class))
+                        parsed_type_names.add(codec.encode(py_class.type)["ref"])
+                    for py_enum in model.enums:
+                        enums.setdefault(py_enum.type, py_enum)
+                    for reference in references:
+                        foreign_type_references.setdefault(reference["ref"], reference)
+                shards = {}
+                for type_name, reference in foreign_type_references.items():
+                    if type_name not in parsed_type_names:
+                        module_name = type_name.split(":")[0]
+                        shards.setdefault(module_name, []).append(reference)
+        return self._parse_locally(ReuseTable(classes, enums))
+
+    def _create_root_shards(self) -> Dict[str, List[EncodedTypeReference]]:
+        # types which can not be referenced by name are parsed in this process
+        codec = TypeReferenceCodec()
+        shards: Dict[str, List[EncodedTypeReference]] = {}
+        for cls in self._classes_to_parse:
+            try:
+                reference = codec.encode(cls)
+            except UnsupportedTypeReferenceException:
+                continue
+            shards.setdefault(cls.__module__, []).append(reference)
+        return shards
+
+    def _is_picklable(self) -> bool:
+        try:
+            pickle.dumps((self._settings, self._parser_factory))
+        except (pickle.PicklingError, AttributeError, TypeError) as e:
+            logger.debug(f"Parsing in process, settings can not be pickled: {e}")
+            return False
+        return True
+
+    def _parse_locally(self, reuse_table: ReuseTable) -> Model:
+        # classes missing in the reuse table are parsed in this process
+        return ModelParser(
+            self._classes_to_parse,
+            self._parser_factory(),
+            self._settings,
+            reuse_table=reuse_table,
+        ).parse()
+
+    def _share_fields(self, py_class: PyClass) -> PyClass:
+        if self._model_object_table is None:
+            return py_class
+        return dataclasses.replace(
+            py_class,
+            fields=tuple(
+                self._model_object_table.get_field(
+                    py_field.name, py_field.type, py_field.alias
+                )
+                for py_field in py_class.fields
+            ),
+        )
@@ -0,0 +1,238 @@
+import hashlib
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Any, Dict, Optional, Type, Union, Iterable, List, Set
+
+from py_typescript_generator.model.py_class import PyClass, TaggedUnionInformation
+from py_typescript_generator.model.py_enum import PyEnum, PyEnumValue
+from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.serialization.type_reference_codec import (
+    TypeReferenceCodec,
+    UnsupportedTypeReferenceException,
+    JSON_LITERAL_TYPES,
+)
+from py_typescript_generator.static_analysis.module_finder import find_module_source
+
+PARSE_CACHE_FILE_NAME = "model_parser_cache.json"
+PARSE_CACHE_VERSION = 4
+BUILTIN_MODULE_HASH = "builtin"
+
+
+class ParseCache:
+    def __init__(
+        self,
+        cache_dir: Union[str, Path],
+        type_reference_codec: Optional[TypeReferenceCodec] = None,
+        search_path: Optional[List[str]] = None,
+    ):
+        self._cache_file = Path(cache_dir) / PARSE_CACHE_FILE_NAME
+        self._codec = type_reference_codec or TypeReferenceCodec()
+        self._search_path = search_path
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._module_hashes: Dict[str, Optional[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get_class(self, cls: Type) -> Optional[PyClass]:
+        entry = self._get_valid_entry(cls, "class")
+        if entry is None:
+            return None
+        return PyClass(
+            name=entry["name"],
+            type=cls,
+            fields=tuple(
+                PyField(
+                    name=field["name"],
+                    type=self._codec.decode(field["type"]),
+                    alias=field.get("alias"),
+                )
+                for field in entry["fields"]
+            ),
+            tagged_union_information=self._decode_tagged_union_information(
+                entry["tagged_union_information"]
+            ),
+            type_parameters=tuple(entry.get("type_parameters", ())),
+        )
+
+    def add_class(self, py_class: PyClass) -> None:
+        try:
+            field_types = [self._codec.encode(field.type) for field in py_class.fields]
+        except UnsupportedTypeReferenceException:
+            return
+        dependencies = self._get_class_modules(py_class.type)
+        for field_type in field_types:
+            dependencies.update(self._codec.get_modules(field_type))
+        entry = {
+            "name": py_class.name,
+            "fields": [
+                self._encode_field(field, field_type)
+                for field, field_type in zip(py_class.fields, field_types)
+            ],
+            "tagged_union_information": self._encode_tagged_union_information(
+                py_class.tagged_union_information
+            ),
+        }
+        if py_class.type_parameters:
+            entry["type_parameters"] = list(py_class.type_parameters)
+        self._add_entry(py_class.type, "class", dependencies, entry)
+
+    def _encode_field(self, field: PyField, field_type: Any) -> Dict[str, Any]:
+        encoded = {"name": field.name, "type": field_type}
+        if field.alias is not None:
+            encoded["alias"] = field.alias
+        return encoded
+
+    def _encode_tagged_union_information(
+        self, information: Optional[TaggedUnionInformation]
+    ) -> Optional[List[Any]]:
+        # only information provided by class parsers is stored, information of
+        # tagged union hierarchies is added by the ModelParser
+        if information is None:
+            return None
+        return [
+            information.discriminant_attribute,
+            information.discriminant_literal,
+            information.discriminant_attribute_is_alias,
+        ]
+
+    def _decode_tagged_union_information(
+        self, encoded: Optional[List[Any]]
+    ) -> Optional[TaggedUnionInformation]:
+        if encoded is None:
+            return None
+        return TaggedUnionInformation(
+            discriminant_attribute=encoded[0],
+            discriminant_literal=encoded[1],
+            discriminant_attribute_is_alias=encoded[2],
+        )
+
+    def get_enum(self, cls: Type) -> Optional[PyEnum]:
+        entry = self._get_valid_entry(cls, "enum")
+        if entry is None:
+            return None
+        return PyEnum(
+            name=entry["name"],
+            type=cls,
+            values=tuple(PyEnumValue(name, value) for name, value in entry["values"]),
+        )
+
+    def add_enum(self, py_enum: PyEnum) -> None:
+        if not all(
+            isinstance(value.value, JSON_LITERAL_TYPES) for value in py_enum.values
+        ):
+            return
+        self._add_entry(
+            py_enum.type,
+            "enum",
+            self._get_class_modules(py_enum.type),
+            {
+                "name": py_enum.name,
+                "values": [[value.name, value.value] for value in py_enum.values],
+            },
+        )
+
+    def save(self) -> None:
+        if self._entries is None:
+            return
+        self._cache_file.parent.mkdir(parents=True, exist_ok=True)
+        temporary_file = self._cache_file.with_suffix(".tmp")
+        with open(temporary_file, "w") as f:
+            json.dump({"version": PARSE_CACHE_VERSION, "entries": self._entries}, f)
+        os.replace(temporary_file, self._cache_file)
+
+    def _get_valid_entry(self, cls: Type, kind: str) -> Optional[Dict[str, Any]]:
+        key = self._get_key(cls)
+        entry = self._get_entries().get(key) if key else None
+        if (
+            entry is None
+            or entry["kind"] != kind
+            or not self._are_dependencies_unchanged(entry["dependencies"])
+        ):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry
+
+    def _add_entry(
+        self,
+        cls: Type,
+        kind: str,
+        dependencies: Iterable[str],
+        values: Dict[str, Any],
+    ) -> None:
+        key = self._get_key(cls)
+        if key is None:
+            return
+        module_hashes = {}
+        for module_name in sorted(dependencies):
+            module_hash = self._get_module_hash(module_name)
+            if module_hash is None:
+                return
+            module_hashes[module_name] = module_hash
+        self._get_entries()[key] = {
+            "kind": kind,
+            "dependencies": module_hashes,
+            **values,
+        }
+
+    def _are_dependencies_unchanged(self, dependencies: Dict[str, str]) -> bool:
+        return all(
+            self._get_module_hash(module_name) == module_hash
+            for module_name, module_hash in dependencies.items()
+        )
+
+    def _get_key(self, cls: Type) -> Optional[str]:
+        try:
+            return str(self._codec.encode(cls)["ref"])
+        except (UnsupportedTypeReferenceException, KeyError):
+            return None
+
+    def _get_class_modules(self, cls: Type) -> Set[str]:
+        # fields of base classes are part of the parsed class as well
+        return {
+            base.__module__
+            for base in getattr(cls, "__mro__", (cls,))
+            if base is not object
+        }
+
+    def _get_entries(self) -> Dict[str, Dict[str, Any]]:
+        if self._entries is None:
+            self._entries = self._load_entries()
+        return self._entries
+
+    def _load_entries(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self._cache_file, "r") as f:
+                content = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if (
+            not isinstance(content, dict)
+            or content.get("version") != PARSE_CACHE_VERSION
+        ):
+            return {}
+        return dict(content["entries"])
+
+    def _get_module_hash(self, module_name: str) -> Optional[str]:
+        if module_name not in self._module_hashes:
+            self._module_hashes[module_name] = self._compute_module_hash(module_name)
+        return self._module_hashes[module_name]
+
+    def _compute_module_hash(self, module_name: str) -> Optional[str]:
+        module = sys.modules.get(module_name)
+        if module is not None:
+            path = getattr(module, "__file__", None)
+            if path is None:
+                return BUILTIN_MODULE_HASH
+        else:
+            module_source = find_module_source(module_name, self._search_path)
+            if module_source is None or module_source.path is None:
+                return None
+            path = module_source.path
+        try:
+            with open(path, "rb") as f:
+                return hashlib.sha256(f.read()).hexdigest()
+        except OSError:
+            return None
@@ -0,0 +1,77 @@
+from dataclasses import dataclass
+from enum import Enum
+from typing import Type, Optional, List, Iterable
+
+from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model.type_dependency_graph import DependencyKind
+
+
+class ParseTaskKind(Enum):
+    VISIT_TYPE = "VISIT_TYPE"
+    FINISH_TAGGED_UNION_CLASS = "FINISH_TAGGED_UNION_CLASS"
+
+
+@dataclass(frozen=True)
+class ParseTask:
+    kind: ParseTaskKind
+    type: Type
+    py_class: Optional[PyClass] = None
+    # the type which references the visited type, None for types to parse
+    source: Optional[Type] = None
+    dependency_kind: DependencyKind = DependencyKind.FIELD
+
+    @staticmethod
+    def visit_type(cls, source=None, dependency_kind=DependencyKind.FIELD):
+        # type: (Type, Optional[Type], DependencyKind)->ParseTask
+        return ParseTask(
+            kind=ParseTaskKind.VISIT_TYPE,
+            type=cls,
+            source=source,
+            dependency_kind=dependency_kind,
+        )
+
+    @staticmethod
+    def finish_tagged_union_class(py_class):
+        # type: (PyClass)->ParseTask
+        return ParseTask(
+            kind=ParseTaskKind.FINISH_TAGGED_UNION_CLASS,
+            type=py_class.type,
+            py_class=py_class,
+        )
+
+
+class ParseWorklist:
+    def __init__(self) -> None:
+        self._stack: List[ParseTask] = []
+
+    def schedule(self, tasks: Iterable[ParseTask]) -> None:
+        # tasks are processed in the given order before any task scheduled earlier,
+        # which matches the order of a depth first traversal
+        self._stack.extend(reversed(list(tasks)))
+
+    def schedule_types(
+        self,
+        types: Iterable[Type],
+        source: Optional[Type] = None,
+        dependency_kind: DependencyKind = DependencyKind.FIELD,
+    ) -> None:
+        self.schedule(
+            ParseTask.visit_type(cls, source, dependency_kind) for cls in types
+        )
+
+    def pop(self) -> ParseTask:
+        return self._stack.pop()
+
+    @property
+    def frontier(self) -> List[Type]:
+        return [
+            task.type
+            for task in reversed(self._stack)
+            if task.kind == ParseTaskKind.VISIT_TYPE
+        ]
+
+    def __bool__(self) -> bool:
+        return bool(self._stack)
+
+    def __len__(self) -> int:
+        return len(self._stack)
@@ -0,0 +1,83 @@
+from typing import Dict, Type, Optional, List, Union, TypeVar, Set
+
+from ordered_set import OrderedSet
+
+from py_typescript_generator.model.model import Model
+from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model.py_enum import PyEnum
+from py_typescript_generator.model.type_dependency_graph import (
+    TypeDependencyGraph,
+    DependencyKind,
+)
+from py_typescript_generator.typing_utils.typing_utils import safe_unwrap
+
+T = TypeVar("T")
+
+
+class ModelNotRetainedException(RuntimeError):
+    def __init__(self) -> None:
+        super(ModelNotRetainedException, self).__init__(
+            "Parsed types were not retained, so no model can be created."
+        )
+
+
+class ParsedTypes:
+    def __init__(self, retain_parsed_types: bool = True) -> None:
+        # without retaining, only the parsed types are remembered to avoid parsing
+        # them twice, the parsed classes and enums are only handed out once finalized
+        self._retain_parsed_types = retain_parsed_types
+        self._classes: Dict[Type, Optional[PyClass]] = {}
+        self._enums: Dict[Type, Optional[PyEnum]] = {}
+        self._finalized: List[Union[PyClass, PyEnum]] = []
+        self._dependency_graph = TypeDependencyGraph()
+        # types reached from the classes to parse without a referencing type
+        self._root_types: Set[Type] = set()
+
+    def contains_class(self, cls: Type) -> bool:
+        return cls in self._classes
+
+    def contains_enum(self, cls: Type) -> bool:
+        return cls in self._enums
+
+    def add_class(self, py_class: PyClass, is_final: bool = True) -> None:
+        self._classes[py_class.type] = self._retained(py_class)
+        if is_final:
+            self._finalized.append(py_class)
+
+    def move_class_to_end(self, py_class: PyClass) -> None:
+        del self._classes[py_class.type]
+        self._classes[py_class.type] = self._retained(py_class)
+        self._finalized.append(py_class)
+
+    def add_enum(self, py_enum: PyEnum) -> None:
+        self._enums[py_enum.type] = self._retained(py_enum)
+        self._finalized.append(py_enum)
+
+    def add_dependency(self, source: Type, target: Type, kind: DependencyKind) -> None:
+        if self._retain_parsed_types:
+            self._dependency_graph.add_dependency(source, target, kind)
+
+    def add_root_type(self, cls: Type) -> None:
+        if self._retain_parsed_types:
+            self._root_types.add(cls)
+
+    @property
+    def root_types(self) -> Set[Type]:
+        return self._root_types
+
+    def pop_finalized(self) -> List[Union[PyClass, PyEnum]]:
+        finalized = self._finalized
+        self._finalized = []
+        return finalized
+
+    def to_model(self) -> Model:
+        if not self._retain_parsed_types:
+            raise ModelNotRetainedException()
+        return Model(
+            classes=OrderedSet(map(safe_unwrap, self._classes.values())),
+            enums=OrderedSet(map(safe_unwrap, self._enums.values())),
+            dependency_graph=self._dependency_graph,
+        )
+
+    def _retained(self, value: T) -> Optional[T]:
+        return value if self._retain_parsed_types else None
@@ -0,0 +1,88 @@
+import inspect
+from typing import Dict, Type, Optional, Iterable, Set, Any, Tuple, List
+
+from py_typescript_generator.model.model import Model
+from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model.py_enum import PyEnum
+from py_typescript_generator.typing_utils.type_descriptor import (
+    TypeDescriptorCache,
+    TypeKind,
+)
+
+TypeName = Tuple[Any, Any]
+
+
+def get_type_name(cls: Type) -> TypeName:
+    # reloaded classes are new objects, so changed types are matched by name
+    return getattr(cls, "__module__", None), getattr(cls, "__qualname__", cls)
+
+
+class ReuseTable:
+    def __init__(
+        self,
+        classes: Optional[Dict[Type, PyClass]] = None,
+        enums: Optional[Dict[Type, PyEnum]] = None,
+    ):
+        self._classes: Dict[Type, PyClass] = classes or {}
+        self._enums: Dict[Type, PyEnum] = enums or {}
+
+    def get_class(self, cls: Type) -> Optional[PyClass]:
+        return self._classes.get(cls)
+
+    def get_enum(self, cls: Type) -> Optional[PyEnum]:
+        return self._enums.get(cls)
+
+    def __len__(self) -> int:
+        return len(self._classes) + len(self._enums)
+
+    @staticmethod
+    def of_unchanged_types(
+        previous_model: Model,
+        changed_types: Iterable[Type],
+        type_descriptors: TypeDescriptorCache,
+    ) -> "ReuseTable":
+        changed_type_names = {get_type_name(cls) for cls in changed_types}
+        classes = {}
+        for py_class in previous_model.classes:
+            if get_type_name(py_class.type) in changed_type_names:
+                continue
+            referenced_type_names = {
+                get_type_name(cls)
+                for cls in _get_referenced_classes(py_class, type_descriptors)
+            }
+            if referenced_type_names & changed_type_names:
+                # field annotations may resolve to the new version of a changed type
+                continue
+            if _get_base_class_names(py_class.type) & changed_type_names:
+                # inherited fields and tagged union information depend on base classes
+                continue
+            classes[py_class.type] = py_class
+        enums = {
+            py_enum.type: py_enum
+            for py_enum in previous_model.enums
+            if get_type_name(py_enum.type) not in changed_type_names
+        }
+        return ReuseTable(classes, enums)
+
+
+def _get_base_class_names(cls: Type) -> Set[TypeName]:
+    return {get_type_name(base) for base in inspect.getmro(cls)[1:]}
+
+
+def _get_referenced_classes(
+    py_class: PyClass, type_descriptors: TypeDescriptorCache
+) -> Set[Type]:
+    referenced_classes = set()
+    types_to_visit: List[Type] = [field.type for field in py_class.fields]
+    while types_to_visit:
+        cls = types_to_visit.pop()
+        type_descriptor = type_descriptors.get(cls)
+        if type_descriptor.kind == TypeKind.LITERAL:
+            continue
+        if type_descriptor.args:
+            types_to_visit.extend(type_descriptor.args)
+            if type_descriptor.origin is not None:
+                types_to_visit.append(type_descriptor.origin)
+        else:
+            referenced_classes.add(cls)
+    return referenced_classes
@@ -0,0 +1,260 @@
+from typing import Any, Dict, List, Optional, Type, Tuple
+
+from ordered_set import OrderedSet
+
+from py_typescript_generator.model.model import Model
+from py_typescript_generator.model.py_class import (
+    PyClass,
+    TaggedUnionInformation,
+    RootTaggedUnionInformation,
+)
+from py_typescript_generator.model.py_enum import PyEnum, PyEnumValue
+from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.model.type_dependency_graph import (
+    TypeDependencyGraph,
+    DependencyKind,
+)
+from py_typescript_generator.serialization.snapshot_format import (
+    SnapshotWriter,
+    SnapshotReader,
+)
+from py_typescript_generator.serialization.type_reference_codec import (
+    TypeReferenceCodec,
+    JSON_LITERAL_TYPES,
+)
+
+MODEL_SNAPSHOT_KIND = "Model"
+
+
+class UnsupportedEnumValueException(RuntimeError):
+    def __init__(self, py_enum: PyEnum, value: Any):
+        super(UnsupportedEnumValueException, self).__init__(
+            f"The value {value!r} of enum {py_enum.name} can not be stored in a snapshot."
+        )
+
+
+class _ModelSnapshotWriter:
+    def __init__(self, codec: TypeReferenceCodec):
+        self._codec = codec
+        self._writer = SnapshotWriter(MODEL_SNAPSHOT_KIND)
+        self._types: List[Dict[str, Any]] = []
+        self._type_indices: Dict[Tuple[Type, Any], int] = {}
+
+    def write(self, model: Model) -> bytes:
+        classes = [self._encode_class(py_class) for py_class in model.classes]
+        enums = [self._encode_enum(py_enum) for py_enum in model.enums]
+        dependencies = [
+            [
+                self._add_type(source),
+                self._add_type(target),
+                sorted(kind.value for kind in kinds),
+            ]
+            for source, target, kinds in model.dependency_graph.iter_dependencies()
+        ]
+        self._writer.add_section("types", self._types)
+        self._writer.add_section("classes", classes)
+        self._writer.add_section("enums", enums)
+        self._writer.add_section("dependencies", dependencies)
+        return self._writer.to_bytes()
+
+    def _encode_class(self, py_class: PyClass) -> List[Any]:
+        encoded = [
+            self._writer.add_string(py_class.name),
+            self._add_type(py_class.type),
+            [self._encode_field(field) for field in py_class.fields],
+            self._encode_tagged_union_information(py_class.tagged_union_information),
+        ]
+        if py_class.type_parameters:
+            encoded.append(
+                [self._writer.add_string(name) for name in py_class.type_parameters]
+            )
+        return encoded
+
+    def _encode_field(self, field: PyField) -> List[int]:
+        encoded = [self._writer.add_string(field.name), self._add_type(field.type)]
+        if field.alias is not None:
+            encoded.append(self._writer.add_string(field.alias))
+        return encoded
+
+    def _encode_tagged_union_information(
+        self, information: Optional[TaggedUnionInformation]
+    ) -> Optional[List[Any]]:
+        if information is None:
+            return None
+        encoded: List[Any] = [
+            self._writer.add_string(information.discriminant_attribute),
+            self._writer.add_string(information.discriminant_literal),
+            information.discriminant_attribute_is_alias,
+        ]
+        if isinstance(information, RootTaggedUnionInformation):
+            encoded.append(
+                [
+                    self._writer.add_string(literal)
+                    for literal in sorted(information.discriminant_literals)
+                ]
+            )
+            encoded.append([self._add_type(cls) for cls in information.child_types])
+        return encoded
+
+    def _encode_enum(self, py_enum: PyEnum) -> List[Any]:
+        values = []
+        for value in py_enum.values:
+            if not isinstance(value.value, JSON_LITERAL_TYPES):
+                raise UnsupportedEnumValueException(py_enum, value.value)
+            values.append([self._writer.add_string(value.name), value.value])
+        return [
+            self._writer.add_string(py_enum.name),
+            self._add_type(py_enum.type),
+            values,
+        ]
+
+    def _add_type(self, cls: Type) -> int:
+        # type references are stored once in the type table, so frequently used
+        # field types like str only take an index per field. Unions with a
+        # different member order are equal, so the arguments are part of the key
+        key = (cls, getattr(cls, "__args__", None))
+        try:
+            return self._type_indices[key]
+        except KeyError:
+            is_hashable = True
+        except TypeError:
+            is_hashable = False
+        index = len(self._types)
+        self._types.append(self._codec.encode(cls))
+        if is_hashable:
+            self._type_indices[key] = index
+        return index
+
+
+class ModelSnapshot:
+    def __init__(
+        self, data: bytes, type_reference_codec: Optional[TypeReferenceCodec] = None
+    ):
+        # sections are decoded on first access and types are only resolved when a
+        # model object referencing them is decoded
+        self._reader = SnapshotReader(data, MODEL_SNAPSHOT_KIND)
+        self._codec = type_reference_codec or TypeReferenceCodec()
+        self._types: Dict[int, Type] = {}
+        self._fields: Dict[Tuple[int, int, Optional[int]], PyField] = {}
+        self._classes: Optional[OrderedSet[PyClass]] = None
+        self._enums: Optional[OrderedSet[PyEnum]] = None
+        self._dependency_graph: Optional[TypeDependencyGraph] = None
+
+    @staticmethod
+    def dump(model, type_reference_codec=None):
+        # type: (Model, Optional[TypeReferenceCodec])->bytes
+        return _ModelSnapshotWriter(type_reference_codec or TypeReferenceCodec()).write(
+            model
+        )
+
+    @property
+    def classes(self) -> OrderedSet[PyClass]:
+        if self._classes is None:
+            self._classes = OrderedSet(
+                self._decode_class(encoded)
+                for encoded in self._reader.get_section("classes")
+            )
+        return self._classes
+
+    @property
+    def enums(self) -> OrderedSet[PyEnum]:
+        if self._enums is None:
+            self._enums = OrderedSet(
+                self._decode_enum(encoded)
+                for encoded in self._reader.get_section("enums")
+            )
+        return self._enums
+
+    @property
+    def dependency_graph(self) -> TypeDependencyGraph:
+        if self._dependency_graph is None:
+            dependency_graph = TypeDependencyGraph()
+            for source, target, kinds in self._reader.get_section("dependencies"):
+                for kind in kinds:
+                    dependency_graph.add_dependency(
+                        self._get_type(source),
+                        self._get_type(target),
+                        DependencyKind(kind),
+                    )
+            self._dependency_graph = dependency_graph
+        return self._dependency_graph
+
+    def to_model(self) -> Model:
+        return Model(
+            classes=self.classes,
+            enums=self.enums,
+            dependency_graph=self.dependency_graph,
+        )
+
+    def _decode_class(self, encoded: List[Any]) -> PyClass:
+        name, cls, fields, tagged_union_information = encoded[:4]
+        type_parameters = encoded[4] if len(encoded) > 4 else ()
+        return PyClass(
+            name=self._reader.get_string(name),
+            type=self._get_type(cls),
+            fields=tuple(self._get_field(*field) for field in fields),
+            tagged_union_information=self._decode_tagged_union_information(
+                tagged_union_information
+            ),
+            type_parameters=tuple(
+                self._reader.get_string(type_parameter)
+                for type_parameter in type_parameters
+            ),
+        )
+
+    def _decode_tagged_union_information(
+        self, encoded: Optional[List[Any]]
+    ) -> Optional[TaggedUnionInformation]:
+        if encoded is None:
+            return None
+        discriminant_attribute = self._reader.get_string(encoded[0])
+        discriminant_literal = self._reader.get_string(encoded[1])
+        discriminant_attribute_is_alias = encoded[2]
+        if len(encoded) == 3:
+            return TaggedUnionInformation(
+                discriminant_attribute=discriminant_attribute,
+                discriminant_literal=discriminant_literal,
+                discriminant_attribute_is_alias=discriminant_attribute_is_alias,
+            )
+        return RootTaggedUnionInformation(
+            discriminant_attribute=discriminant_attribute,
+            discriminant_literal=discriminant_literal,
+            discriminant_attribute_is_alias=discriminant_attribute_is_alias,
+            discriminant_literals=frozenset(
+                self._reader.get_string(literal) for literal in encoded[3]
+            ),
+            child_types=frozenset(self._get_type(cls) for cls in encoded[4]),
+        )
+
+    def _decode_enum(self, encoded: List[Any]) -> PyEnum:
+        name, cls, values = encoded
+        return PyEnum(
+            name=self._reader.get_string(name),
+            type=self._get_type(cls),
+            values=tuple(
+                PyEnumValue(name=self._reader.get_string(value_name), value=value)
+                for value_name, value in values
+            ),
+        )
+
+    def _get_field(
+        self, name: int, field_type: int, alias: Optional[int] = None
+    ) -> PyField:
+        # fields with the same name and type are shared between classes
+        key = (name, field_type, alias)
+        py_field = self._fields.get(key)
+        if py_field is None:
+            py_field = PyField(
+                name=self._reader.get_string(name),
+                type=self._get_type(field_type),
+                alias=None if alias is None else self._reader.get_string(alias),
+            )
+            self._fields[key] = py_field
+        return py_field
+
+    def _get_type(self, index: int) -> Type:
+        cls = self._types.get(index)
+        if cls is None:
+            cls = self._codec.decode(self._reader.get_section("types")[index])
+            self._types[index] = cls
+        return cls
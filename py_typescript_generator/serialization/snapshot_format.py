@@ -0,0 +1,124 @@
+import json
+import struct
+import zlib
+from typing import Dict, Any, List, Tuple
+
+SNAPSHOT_MAGIC = b"PYTSSNAP"
+SNAPSHOT_VERSION = 2
+STRINGS_SECTION = "strings"
+
+# magic, format version and snapshot kind, followed by the number of sections
+_HEADER = struct.Struct("<8sH8sH")
+# name length and payload length of a section, followed by the name
+_SECTION_HEADER = struct.Struct("<BI")
+
+
+class InvalidSnapshotException(RuntimeError):
+    def __init__(self, message: str):
+        super(InvalidSnapshotException, self).__init__(message)
+
+
+class SnapshotWriter:
+    def __init__(self, kind: str):
+        self._kind = kind
+        self._strings: List[str] = []
+        self._string_indices: Dict[str, int] = {}
+        self._sections: List[Tuple[str, Any]] = []
+
+    def add_string(self, value: str) -> int:
+        # repeated names are stored once and referenced by their index
+        index = self._string_indices.get(value)
+        if index is None:
+            index = len(self._strings)
+            self._strings.append(value)
+            self._string_indices[value] = index
+        return index
+
+    def add_section(self, name: str, value: Any) -> None:
+        self._sections.append((name, value))
+
+    def to_bytes(self) -> bytes:
+        sections = [(STRINGS_SECTION, self._strings), *self._sections]
+        chunks = [
+            _HEADER.pack(
+                SNAPSHOT_MAGIC,
+                SNAPSHOT_VERSION,
+                self._kind.encode("ascii"),
+                len(sections),
+            )
+        ]
+        for name, value in sections:
+            encoded_name = name.encode("ascii")
+            payload = zlib.compress(
+                json.dumps(value, separators=(",", ":")).encode("utf-8")
+            )
+            chunks.append(_SECTION_HEADER.pack(len(encoded_name), len(payload)))
+            chunks.append(encoded_name)
+            chunks.append(payload)
+        return b"".join(chunks)
+
+
+class SnapshotReader:
+    def __init__(self, data: bytes, kind: str):
+        # only the section table is read upfront, sections are decompressed and
+        # decoded on first access
+        self._data = memoryview(data)
+        self._sections: Dict[str, Tuple[int, int]] = {}
+        self._decoded_sections: Dict[str, Any] = {}
+        self._strings: List[str] = []
+        self._read_section_table(kind)
+
+    def get_section(self, name: str) -> Any:
+        if name not in self._decoded_sections:
+            try:
+                offset, length = self._sections[name]
+            except KeyError:
+                raise InvalidSnapshotException(f"Snapshot has no section {name}.")
+            end = offset + length
+            try:
+                self._decoded_sections[name] = json.loads(
+                    zlib.decompress(self._data[offset:end])
+                )
+            except (zlib.error, ValueError) as e:
+                raise InvalidSnapshotException(
+                    f"Section {name} of snapshot is corrupted: {e}"
+                )
+        return self._decoded_sections[name]
+
+    def get_string(self, index: int) -> str:
+        if not self._strings:
+            self._strings = self.get_section(STRINGS_SECTION)
+        return self._strings[index]
+
+    def _read_section_table(self, kind: str) -> None:
+        if len(self._data) < _HEADER.size:
+            raise InvalidSnapshotException("Snapshot is truncated.")
+        magic, version, snapshot_kind, section_count = _HEADER.unpack_from(
+            self._data, 0
+        )
+        if magic != SNAPSHOT_MAGIC:
+            raise InvalidSnapshotException("Data is not a snapshot.")
+        if version != SNAPSHOT_VERSION:
+            raise InvalidSnapshotException(
+                f"Snapshot version {version} is not supported, expected version {SNAPSHOT_VERSION}."
+            )
+        snapshot_kind = snapshot_kind.rstrip(b"\0").decode("ascii")
+        if snapshot_kind != kind:
+            raise InvalidSnapshotException(
+                f"Snapshot contains a {snapshot_kind}, expected a {kind}."
+            )
+        offset = _HEADER.size
+        for _ in range(section_count):
+            if offset + _SECTION_HEADER.size > len(self._data):
+                raise InvalidSnapshotException("Snapshot is truncated.")
+            name_length, payload_length = _SECTION_HEADER.unpack_from(
+                self._data, offset
+            )
+            offset += _SECTION_HEADER.size
+            name_end = offset + name_length
+            name = bytes(self._data[offset:name_end]).decode("ascii")
+            offset = name_end
+            if offset + payload_length > len(self._data):
+                raise InvalidSnapshotException("Snapshot is truncated.")
+            self._sections[name] = (offset, payload_length)
+            offset += payload_length
@@ -0,0 +1,278 @@
+from typing import Any, Dict, List, Optional, Tuple
+
+from ordered_set import OrderedSet
+
+from py_typescript_generator.serialization.snapshot_format import (
+    SnapshotWriter,
+    SnapshotReader,
+    InvalidSnapshotException,
+)
+from py_typescript_generator.typescript_model_compiler.ts_array import TsArray
+from py_typescript_generator.typescript_model_compiler.ts_enum import (
+    TsEnum,
+    TsEnumValue,
+)
+from py_typescript_generator.typescript_model_compiler.ts_field import TsField
+from py_typescript_generator.typescript_model_compiler.ts_generic_type import (
+    TsGenericType,
+)
+from py_typescript_generator.typescript_model_compiler.ts_interface import (
+    TsInterface,
+)
+from py_typescript_generator.typescript_model_compiler.ts_mapped_type import (
+    TsMappedType,
+)
+from py_typescript_generator.typescript_model_compiler.ts_model import TsModel
+from py_typescript_generator.typescript_model_compiler.ts_object_type import (
+    TsBaseType,
+    TsObjectType,
+    TsUnionType,
+    TsDiscriminator,
+    TsTupleType,
+)
+from py_typescript_generator.typescript_model_compiler.ts_type import TsType
+from py_typescript_generator.typescript_model_compiler.ts_union_reference import (
+    TsUnionReference,
+)
+
+TS_MODEL_SNAPSHOT_KIND = "TsModel"
+
+_TS_TYPE = 0
+_TS_ARRAY = 1
+_TS_MAPPED_TYPE = 2
+_TS_INTERFACE = 3
+_TS_GENERIC_TYPE = 4
+_TS_UNION_REFERENCE = 5
+
+_TS_OBJECT_TYPE = 0
+_TS_UNION_TYPE = 1
+_TS_TUPLE_TYPE = 2
+
+
+class UnsupportedTsTypeException(RuntimeError):
+    def __init__(self, value: Any):
+        super(UnsupportedTsTypeException, self).__init__(
+            f"The type {value} can not be stored in a snapshot."
+        )
+
+
+class _TsModelSnapshotWriter:
+    def __init__(self) -> None:
+        self._writer = SnapshotWriter(TS_MODEL_SNAPSHOT_KIND)
+        self._ts_types: List[List[Any]] = []
+        self._ts_type_indices: Dict[Tuple[type, TsType], int] = {}
+
+    def write(self, ts_model: TsModel) -> bytes:
+        types = [self._encode_base_type(base_type) for base_type in ts_model.types]
+        enums = [
+            [
+                self._writer.add_string(ts_enum.name),
+                [
+                    [self._writer.add_string(value.name), value.value]
+                    for value in ts_enum.values
+                ],
+            ]
+            for ts_enum in ts_model.enums
+        ]
+        self._writer.add_section("ts_types", self._ts_types)
+        self._writer.add_section("types", types)
+        self._writer.add_section("enums", enums)
+        return self._writer.to_bytes()
+
+    def _encode_base_type(self, base_type: TsBaseType) -> List[Any]:
+        name = self._writer.add_string(base_type.name)
+        if isinstance(base_type, TsObjectType):
+            discriminator = base_type.discriminator
+            encoded = [
+                _TS_OBJECT_TYPE,
+                name,
+                self._encode_fields(base_type.fields),
+                [
+                    self._writer.add_string(discriminator.name),
+                    self._writer.add_string(discriminator.value),
+                ]
+                if discriminator
+                else None,
+            ]
+            if base_type.type_parameters:
+                encoded.append(
+                    [
+                        self._writer.add_string(type_parameter)
+                        for type_parameter in base_type.type_parameters
+                    ]
+                )
+            return encoded
+        if isinstance(base_type, TsTupleType):
+            return [_TS_TUPLE_TYPE, name, self._encode_fields(base_type.elements)]
+        if isinstance(base_type, TsUnionType):
+            return [
+                _TS_UNION_TYPE,
+                name,
+                [self._writer.add_string(member) for member in base_type.union_members],
+            ]
+        raise UnsupportedTsTypeException(base_type)
+
+    def _encode_fields(self, fields: Tuple[TsField, ...]) -> List[List[int]]:
+        return [
+            [self._writer.add_string(field.name), self._add_ts_type(field.type)]
+            for field in fields
+        ]
+
+    def _add_ts_type(self, ts_type: TsType) -> int:
+        # subclasses of TsType compare equal to plain types with the same name, so
+        # the class is part of the key
+        key = (type(ts_type), ts_type)
+        index = self._ts_type_indices.get(key)
+        if index is None:
+            encoded = self._encode_ts_type(ts_type)
+            index = len(self._ts_types)
+            self._ts_types.append(encoded)
+            self._ts_type_indices[key] = index
+        return index
+
+    def _encode_ts_type(self, ts_type: TsType) -> List[Any]:
+        ts_type_class = type(ts_type)
+        if ts_type_class is TsArray or ts_type_class is TsMappedType:
+            return [
+                _TS_ARRAY if ts_type_class is TsArray else _TS_MAPPED_TYPE,
+                self._add_ts_type(ts_type.wrapped_type),  # type: ignore
+                ts_type.is_optional,
+            ]
+        if ts_type_class is TsGenericType:
+            return [
+                _TS_GENERIC_TYPE,
+                [
+                    self._writer.add_string(ts_type.name),
+                    [
+                        self._add_ts_type(type_argument)
+                        for type_argument in ts_type.type_arguments  # type: ignore
+                    ],
+                ],
+                ts_type.is_optional,
+            ]
+        if ts_type_class is TsUnionReference:
+            return [
+                _TS_UNION_REFERENCE,
+                [self._add_ts_type(member) for member in ts_type.members],  # type: ignore
+                ts_type.is_optional,
+            ]
+        if ts_type_class is TsType or ts_type_class is TsInterface:
+            return [
+                _TS_TYPE if ts_type_class is TsType else _TS_INTERFACE,
+                self._writer.add_string(ts_type.name),
+                ts_type.is_optional,
+            ]
+        raise UnsupportedTsTypeException(ts_type)
+
+
+class TsModelSnapshot:
+    def __init__(self, data: bytes):
+        self._reader = SnapshotReader(data, TS_MODEL_SNAPSHOT_KIND)
+        self._ts_types: Dict[int, TsType] = {}
+        self._types: Optional[OrderedSet[TsBaseType]] = None
+        self._enums: Optional[OrderedSet[TsEnum]] = None
+
+    @staticmethod
+    def dump(ts_model):
+        # type: (TsModel)->bytes
+        return _TsModelSnapshotWriter().write(ts_model)
+
+    @property
+    def types(self) -> OrderedSet[TsBaseType]:
+        if self._types is None:
+            self._types = OrderedSet(
+                self._decode_base_type(encoded)
+                for encoded in self._reader.get_section("types")
+            )
+        return self._types
+
+    @property
+    def enums(self) -> OrderedSet[TsEnum]:
+        if self._enums is None:
+            self._enums = OrderedSet(
+                TsEnum(
+                    name=self._reader.get_string(name),
+                    values=tuple(
+                        TsEnumValue(
+                            name=self._reader.get_string(value_name), value=value
+                        )
+                        for value_name, value in values
+                    ),
+                )
+                for name, values in self._reader.get_section("enums")
+            )
+        return self._enums
+
+    def to_ts_model(self) -> TsModel:
+        return TsModel(types=self.types, enums=self.enums)
+
+    def _decode_base_type(self, encoded: List[Any]) -> TsBaseType:
+        kind, name = encoded[0], self._reader.get_string(encoded[1])
+        if kind == _TS_OBJECT_TYPE:
+            fields, discriminator = encoded[2], encoded[3]
+            type_parameters = encoded[4] if len(encoded) > 4 else ()
+            return TsObjectType(
+                name=name,
+                fields=self._decode_fields(fields),
+                discriminator=TsDiscriminator(
+                    name=self._reader.get_string(discriminator[0]),
+                    value=self._reader.get_string(discriminator[1]),
+                )
+                if discriminator
+                else None,
+                type_parameters=tuple(
+                    self._reader.get_string(type_parameter)
+                    for type_parameter in type_parameters
+                ),
+            )
+        if kind == _TS_TUPLE_TYPE:
+            return TsTupleType(name=name, elements=self._decode_fields(encoded[2]))
+        if kind == _TS_UNION_TYPE:
+            return TsUnionType(
+                name=name,
+                union_members=tuple(
+                    self._reader.get_string(member) for member in encoded[2]
+                ),
+            )
+        raise InvalidSnapshotException(f"Unknown kind {kind} of type {name}.")
+
+    def _decode_fields(self, fields: List[List[int]]) -> Tuple[TsField, ...]:
+        return tuple(
+            TsField(
+                name=self._reader.get_string(field_name),
+                type=self._get_ts_type(field_type),
+            )
+            for field_name, field_type in fields
+        )
+
+    def _get_ts_type(self, index: int) -> TsType:
+        ts_type = self._ts_types.get(index)
+        if ts_type is None:
+            ts_type = self._decode_ts_type(self._reader.get_section("ts_types")[index])
+            self._ts_types[index] = ts_type
+        return ts_type
+
+    def _decode_ts_type(self, encoded: List[Any]) -> TsType:
+        kind, value, is_optional = encoded
+        if kind == _TS_ARRAY:
+            return TsArray(self._get_ts_type(value), is_optional)
+        if kind == _TS_MAPPED_TYPE:
+            return TsMappedType(self._get_ts_type(value), is_optional)
+        if kind == _TS_GENERIC_TYPE:
+            name, type_arguments = value
+            return TsGenericType(
+                self._reader.get_string(name),
+                tuple(
+                    self._get_ts_type(type_argument) for type_argument in type_arguments
+                ),
+                is_optional,
+            )
+        if kind == _TS_UNION_REFERENCE:
+            return TsUnionReference(
+                tuple(self._get_ts_type(member) for member in value), is_optional
+            )
+        if kind == _TS_INTERFACE:
+            return TsInterface(self._reader.get_string(value), is_optional)
+        if kind == _TS_TYPE:
+            return TsType(self._reader.get_string(value), is_optional)
+        raise InvalidSnapshotException(f"Unknown kind {kind} of TypeScript type.")
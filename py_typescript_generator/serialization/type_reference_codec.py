@@ -0,0 +1,113 @@
+import functools
+import importlib
+import operator
+import types
+import typing
+from typing import Any, Callable, Dict, List, TypeVar, Union, Set
+
+# Note: this can be removed once support for Python 3.7 is dropped
+from typing_inspect import get_args, get_origin  # type: ignore
+
+EncodedTypeReference = Dict[str, Any]
+ClassResolver = Callable[[str, str], Any]
+
+JSON_LITERAL_TYPES = (str, int, bool, type(None))
+
+
+class UnsupportedTypeReferenceException(RuntimeError):
+    def __init__(self, cls: Any):
+        super(UnsupportedTypeReferenceException, self).__init__(
+            f"The type {cls} can not be encoded as a type reference."
+        )
+
+
+def import_class(module_name: str, qualname: str) -> Any:
+    value: Any = importlib.import_module(module_name)
+    for name in qualname.split("."):
+        value = getattr(value, name)
+    return value
+
+
+class TypeReferenceCodec:
+    def __init__(self, class_resolver: ClassResolver = import_class):
+        self._class_resolver = class_resolver
+
+    def encode(self, cls: Any) -> EncodedTypeReference:
+        if cls is type(None):
+            return {"kind": "none"}
+        if cls is Ellipsis:
+            return {"kind": "ellipsis"}
+        if isinstance(cls, TypeVar):
+            return {"kind": "type_var", "ref": self._encode_name(cls, cls.__name__)}
+
+        if isinstance(cls, types.UnionType):
+            return {
+                "kind": "union_type",
+                "args": [self.encode(arg) for arg in get_args(cls)],
+            }
+
+        origin = get_origin(cls)
+        if origin is None:
+            if isinstance(cls, type):
+                return {
+                    "kind": "class",
+                    "ref": self._encode_name(cls, cls.__qualname__),
+                }
+            raise UnsupportedTypeReferenceException(cls)
+
+        if origin is typing.Literal:
+            values = list(get_args(cls))
+            if not all(isinstance(value, JSON_LITERAL_TYPES) for value in values):
+                raise UnsupportedTypeReferenceException(cls)
+            return {"kind": "literal", "values": values}
+
+        args = [self.encode(arg) for arg in get_args(cls)]
+        if origin is Union:
+            return {"kind": "union", "args": args}
+        if isinstance(cls, types.GenericAlias):
+            return {"kind": "generic", "origin": self.encode(origin), "args": args}
+
+        typing_name = getattr(cls, "_name", None)
+        if typing_name and getattr(typing, typing_name, None) is not None:
+            return {"kind": "typing", "name": typing_name, "args": args}
+        return {"kind": "generic", "origin": self.encode(origin), "args": args}
+
+    def decode(self, encoded: EncodedTypeReference) -> Any:
+        kind = encoded["kind"]
+        if kind == "none":
+            return type(None)
+        if kind == "ellipsis":
+            return Ellipsis
+        if kind in ("class", "type_var"):
+            module_name, qualname = encoded["ref"].split(":")
+            return self._class_resolver(module_name, qualname)
+        if kind == "literal":
+            return typing.Literal[tuple(encoded["values"])]
+
+        args = tuple(self.decode(arg) for arg in encoded["args"])
+        if kind == "union":
+            return Union[args]
+        if kind == "union_type":
+            return functools.reduce(operator.or_, args)
+        if kind == "typing":
+            typing_alias = getattr(typing, encoded["name"])
+            return typing_alias[args] if args else typing_alias
+        return self.decode(encoded["origin"])[args]
+
+    def get_modules(self, encoded: EncodedTypeReference) -> Set[str]:
+        modules = set()
+        references: List[EncodedTypeReference] = [encoded]
+        while references:
+            reference = references.pop()
+            if "ref" in reference:
+                modules.add(reference["ref"].split(":")[0])
+            if "origin" in reference:
+                references.append(reference["origin"])
+            references.extend(reference.get("args", ()))
+        return modules
+
+    def _encode_name(self, cls: Any, qualname: str) -> str:
+        if "<locals>" in qualname:
+            # classes defined in functions can not be looked up again
+            raise UnsupportedTypeReferenceException(cls)
+        return f"{cls.__module__}:{qualname}"
@@ -0,0 +1,74 @@
+import pkgutil
+import sys
+from dataclasses import dataclass
+from importlib.machinery import PathFinder
+from typing import Optional, List, Tuple
+
+
+@dataclass(frozen=True)
+class ModuleSource:
+    name: str
+    path: Optional[str]
+    is_package: bool
+    search_locations: Tuple[str, ...] = ()
+
+
+def find_module_source(
+    module_name: str, search_path: Optional[List[str]] = None
+) -> Optional[ModuleSource]:
+    # PathFinder is used directly instead of importlib.util.find_spec, since
+    # find_spec imports the parent packages of the module
+    path: Optional[List[str]] = search_path or sys.path
+    spec = None
+    parts = module_name.split(".")
+    for i in range(len(parts)):
+        if path is None:
+            return None
+        spec = PathFinder.find_spec(".".join(parts[: i + 1]), path)
+        if spec is None:
+            return None
+        locations = spec.submodule_search_locations
+        path = list(locations) if locations is not None else None
+
+    if spec is None:
+        return None
+    is_package = spec.submodule_search_locations is not None
+    search_locations = tuple(path or ())
+    if spec.origin is None or spec.origin == "namespace":
+        if is_package:
+            return ModuleSource(
+                name=module_name,
+                path=None,
+                is_package=True,
+                search_locations=search_locations,
+            )
+        return None
+    if not spec.origin.endswith(".py"):
+        return None
+    return ModuleSource(
+        name=module_name,
+        path=spec.origin,
+        is_package=is_package,
+        search_locations=search_locations,
+    )
+
+
+def walk_module_names(
+    package_name: str, search_path: Optional[List[str]] = None
+) -> List[str]:
+    # in contrast to pkgutil.walk_packages, no package is imported to find its
+    # submodules
+    package_source = find_module_source(package_name, search_path)
+    if package_source is None:
+        return []
+    module_names = [package_name]
+    if not package_source.is_package:
+        return module_names
+    for module_info in pkgutil.iter_modules(
+        list(package_source.search_locations), f"{package_name}."
+    ):
+        if module_info.ispkg:
+            module_names.extend(walk_module_names(module_info.name, search_path))
+        else:
+            module_names.append(module_info.name)
+    return module_names
@@ -0,0 +1,28 @@
+from dataclasses import dataclass
+from typing import Tuple, Type, Optional, cast
+
+STATIC_CLASS_DEFINITION_ATTRIBUTE = "__static_class_definition__"
+
+
+@dataclass(frozen=True)
+class StaticField:
+    name: str
+    annotation: str
+
+
+@dataclass(frozen=True)
+class StaticClassDefinition:
+    module: str
+    qualname: str
+    is_dataclass: bool
+    fields: Tuple[StaticField, ...]
+
+
+def get_static_class_definition(cls: Type) -> Optional[StaticClassDefinition]:
+    # only the own namespace is checked, subclasses of a static class which were
+    # defined at runtime are no static classes
+    class_namespace = getattr(cls, "__dict__", {})
+    return cast(
+        Optional[StaticClassDefinition],
+        class_namespace.get(STATIC_CLASS_DEFINITION_ATTRIBUTE),
+    )
@@ -0,0 +1,407 @@
+import ast
+import builtins
+import enum
+import importlib
+import types
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Type, Set, Union, Tuple, cast
+
+from py_typescript_generator.static_analysis.module_finder import (
+    find_module_source,
+    ModuleSource,
+)
+from py_typescript_generator.static_analysis.static_class_definition import (
+    StaticClassDefinition,
+    StaticField,
+    STATIC_CLASS_DEFINITION_ATTRIBUTE,
+)
+
+NON_FIELD_ANNOTATIONS = {"ClassVar", "InitVar", "KW_ONLY"}
+
+
+class StaticAnalysisException(RuntimeError):
+    def __init__(self, message: str):
+        super(StaticAnalysisException, self).__init__(message)
+
+
+@dataclass(frozen=True)
+class _ImportedName:
+    module: str
+    attribute: Optional[str]
+
+
+_Binding = Union[ast.ClassDef, ast.expr, _ImportedName]
+
+
+class StaticNamespace(dict):
+    # names are resolved on first access, so imports of a module are only followed
+    # if a class definition or annotation actually uses them
+    def __init__(self, module: "StaticModule"):
+        super(StaticNamespace, self).__init__()
+        self._module = module
+
+    def __missing__(self, name: str) -> Any:
+        value = self._module.resolve_name(name)
+        self[name] = value
+        return value
+
+
+class StaticModuleProxy:
+    def __init__(self, module: "StaticModule"):
+        self.__static_module__ = module
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self.__static_module__.namespace[name]
+        except KeyError:
+            pass
+        return self.__static_module__.loader.get_module(
+            f"{self.__static_module__.name}.{name}"
+        )
+
+    def __repr__(self) -> str:
+        return f"<static module '{self.__static_module__.name}'>"
+
+
+class StaticModule:
+    def __init__(self, source: ModuleSource, loader: "StaticModuleLoader"):
+        self.name = source.name
+        self.loader = loader
+        self.namespace = StaticNamespace(self)
+        self.namespace["__name__"] = self.name
+        self._package = self.name if source.is_package else self.name.rpartition(".")[0]
+        self._bindings: Dict[str, _Binding] = {}
+        self._class_definitions: List[ast.ClassDef] = []
+        self._classes_being_built: Set[str] = set()
+        self._is_loaded = False
+        if source.path is not None:
+            with open(source.path, "rb") as f:
+                tree = ast.parse(f.read(), filename=source.path)
+            self._collect_bindings(tree.body)
+
+    def load(self) -> List[Type]:
+        if not self._is_loaded:
+            self._is_loaded = True
+            for class_definition in self._class_definitions:
+                self.namespace[class_definition.name]
+        return [
+            self.namespace[class_definition.name]
+            for class_definition in self._class_definitions
+            if self._bindings.get(class_definition.name) is class_definition
+        ]
+
+    def resolve_name(self, name: str) -> Any:
+        binding = self._bindings.get(name)
+        if binding is None:
+            raise KeyError(name)
+        if isinstance(binding, ast.ClassDef):
+            return self._build_class(binding, binding.name)
+        if isinstance(binding, _ImportedName):
+            return self.loader.resolve_import(binding.module, binding.attribute)
+        return self.evaluate(binding)
+
+    def evaluate(self, expression: ast.expr) -> Any:
+        # module level assignments like Base = declarative_base() would run
+        # application code, so only literals, names, attribute access and
+        # subscripts like Generic[T] are evaluated. TypeVar() is the only call
+        try:
+            return ast.literal_eval(expression)
+        except (ValueError, TypeError, SyntaxError):
+            pass
+        if isinstance(expression, ast.Name):
+            return self._resolve_global(expression.id)
+        if isinstance(expression, ast.Attribute):
+            return getattr(self.evaluate(expression.value), expression.attr)
+        if isinstance(expression, ast.Subscript):
+            return self.evaluate(expression.value)[self.evaluate(expression.slice)]
+        if isinstance(expression, ast.Tuple):
+            return tuple(self.evaluate(element) for element in expression.elts)
+        if isinstance(expression, ast.List):
+            return [self.evaluate(element) for element in expression.elts]
+        if _is_type_var_call(expression):
+            call = cast(ast.Call, expression)
+            return self.evaluate(call.func)(
+                *(self.evaluate(argument) for argument in call.args),
+                **{
+                    keyword.arg: self.evaluate(keyword.value)
+                    for keyword in call.keywords
+                    if keyword.arg is not None
+                },
+            )
+        raise StaticAnalysisException(
+            f"Can not evaluate {ast.unparse(expression)} in module {self.name} "
+            f"without running it."
+        )
+
+    def _resolve_global(self, name: str) -> Any:
+        try:
+            return self.namespace[name]
+        except KeyError:
+            pass
+        try:
+            return getattr(builtins, name)
+        except AttributeError:
+            raise NameError(f"name '{name}' is not defined")
+
+    def _collect_bindings(self, statements: List[ast.stmt]) -> None:
+        # later bindings replace earlier ones, like they would at runtime. Both
+        # branches of conditionals are collected, which covers TYPE_CHECKING imports
+        for statement in statements:
+            if isinstance(statement, ast.ClassDef):
+                self._bindings[statement.name] = statement
+                self._class_definitions.append(statement)
+            elif isinstance(statement, ast.Import):
+                for alias in statement.names:
+                    if alias.asname:
+                        self._bindings[alias.asname] = _ImportedName(alias.name, None)
+                    else:
+                        top_level_name = alias.name.split(".")[0]
+                        self._bindings[top_level_name] = _ImportedName(
+                            top_level_name, None
+                        )
+            elif isinstance(statement, ast.ImportFrom):
+                module = self._get_imported_module_name(statement)
+                for alias in statement.names:
+                    if alias.name != "*":
+                        self._bindings[alias.asname or alias.name] = _ImportedName(
+                            module, alias.name
+                        )
+            elif isinstance(statement, ast.Assign):
+                for target in statement.targets:
+                    if isinstance(target, ast.Name):
+                        self._bindings[target.id] = statement.value
+            elif isinstance(statement, ast.AnnAssign):
+                if isinstance(statement.target, ast.Name) and statement.value:
+                    self._bindings[statement.target.id] = statement.value
+            elif isinstance(statement, ast.If):
+                self._collect_bindings(statement.body)
+                self._collect_bindings(statement.orelse)
+            elif isinstance(statement, ast.Try):
+                self._collect_bindings(statement.body)
+                for handler in statement.handlers:
+                    self._collect_bindings(handler.body)
+
+    def _get_imported_module_name(self, statement: ast.ImportFrom) -> str:
+        if not statement.level:
+            return statement.module or ""
+        package_parts = self._package.split(".")
+        if statement.level > 1:
+            package_parts = package_parts[: -(statement.level - 1)]
+        if statement.module:
+            package_parts.append(statement.module)
+        return ".".join(package_parts)
+
+    def _build_class(self, class_definition: ast.ClassDef, qualname: str) -> Type:
+        if qualname in self._classes_being_built:
+            raise StaticAnalysisException(
+                f"Cyclic base classes for class {qualname} in module {self.name}."
+            )
+        self._classes_being_built.add(qualname)
+        try:
+            bases = tuple(self._evaluate_base(base) for base in class_definition.bases)
+            is_enum = any(
+                isinstance(base, type) and issubclass(base, enum.Enum) for base in bases
+            )
+            class_namespace = self._collect_class_attributes(
+                class_definition, qualname, is_enum
+            )
+            if not is_enum:
+                class_namespace[
+                    STATIC_CLASS_DEFINITION_ATTRIBUTE
+                ] = StaticClassDefinition(
+                    module=self.name,
+                    qualname=qualname,
+                    is_dataclass=self._is_dataclass(class_definition),
+                    fields=self._collect_fields(class_definition),
+                )
+
+            def exec_body(namespace: Dict[str, Any]) -> None:
+                # enum namespaces only register members through __setitem__
+                for name, value in class_namespace.items():
+                    namespace[name] = value
+
+            return types.new_class(class_definition.name, bases, exec_body=exec_body)
+        finally:
+            self._classes_being_built.remove(qualname)
+
+    def _evaluate_base(self, base: ast.expr) -> Any:
+        try:
+            return self.evaluate(base)
+        except Exception as e:
+            raise StaticAnalysisException(
+                f"Could not resolve base class {ast.unparse(base)} in module {self.name}: {e}"
+            )
+
+    def _collect_class_attributes(
+        self, class_definition: ast.ClassDef, qualname: str, is_enum: bool
+    ) -> Dict[str, Any]:
+        class_namespace: Dict[str, Any] = {
+            "__module__": self.name,
+            "__qualname__": qualname,
+        }
+        for statement in class_definition.body:
+            if isinstance(statement, ast.ClassDef):
+                class_namespace[statement.name] = self._build_class(
+                    statement, f"{qualname}.{statement.name}"
+                )
+                continue
+            if isinstance(statement, ast.Assign):
+                targets = statement.targets
+                value = statement.value
+            elif isinstance(statement, ast.AnnAssign) and statement.value:
+                targets = [statement.target]
+                value = statement.value
+            else:
+                continue
+            found, attribute_value = self._try_evaluate_attribute(value, is_enum)
+            if not found:
+                continue
+            for target in targets:
+                if isinstance(target, ast.Name):
+                    class_namespace[target.id] = attribute_value
+        return class_namespace
+
+    def _try_evaluate_attribute(
+        self, value: ast.expr, is_enum: bool
+    ) -> Tuple[bool, Any]:
+        # only values which can be computed without running application code are
+        # evaluated: literals, references to other names and enum.auto()
+        try:
+            return True, ast.literal_eval(value)
+        except (ValueError, TypeError, SyntaxError):
+            pass
+        if is_enum and _is_auto_call(value):
+            return True, enum.auto()
+        if isinstance(value, (ast.Name, ast.Attribute)):
+            try:
+                return True, self.evaluate(value)
+            except Exception:
+                return False, None
+        return False, None
+
+    def _is_dataclass(self, class_definition: ast.ClassDef) -> bool:
+        for decorator in class_definition.decorator_list:
+            if isinstance(decorator, ast.Call):
+                decorator = decorator.func
+            if isinstance(decorator, ast.Name) and decorator.id == "dataclass":
+                return True
+            if isinstance(decorator, ast.Attribute) and decorator.attr == "dataclass":
+                return True
+        return False
+
+    def _collect_fields(
+        self, class_definition: ast.ClassDef
+    ) -> Tuple[StaticField, ...]:
+        fields = []
+        for statement in class_definition.body:
+            if not isinstance(statement, ast.AnnAssign) or not isinstance(
+                statement.target, ast.Name
+            ):
+                continue
+            annotation = statement.annotation
+            if isinstance(annotation, ast.Constant) and isinstance(
+                annotation.value, str
+            ):
+                annotation_source = annotation.value
+            else:
+                annotation_source = ast.unparse(annotation)
+            if _is_non_field_annotation(annotation_source):
+                continue
+            fields.append(
+                StaticField(name=statement.target.id, annotation=annotation_source)
+            )
+        return tuple(fields)
+
+
+class StaticModuleLoader:
+    def __init__(self, packages: List[str], search_path: Optional[List[str]] = None):
+        self._packages = packages
+        self._search_path = search_path
+        self._modules: Dict[str, Optional[StaticModule]] = {}
+
+    def load_classes(self, module_name: str) -> List[Type]:
+        module = self._get_static_module(module_name)
+        if module is None:
+            raise StaticAnalysisException(
+                f"No source file found for module {module_name}."
+            )
+        return module.load()
+
+    def get_namespace(self, module_name: str) -> Optional[Dict[str, Any]]:
+        module = self._get_static_module(module_name)
+        if module is None:
+            return None
+        return module.namespace
+
+    def get_module(self, module_name: str) -> Any:
+        module = self._get_static_module(module_name)
+        if module is None:
+            return importlib.import_module(module_name)
+        module.load()
+        return StaticModuleProxy(module)
+
+    def resolve_import(self, module_name: str, attribute: Optional[str]) -> Any:
+        if attribute is None:
+            return self.get_module(module_name)
+        module = self._get_static_module(module_name)
+        if module is None:
+            imported_module = importlib.import_module(module_name)
+            try:
+                return getattr(imported_module, attribute)
+            except AttributeError:
+                return importlib.import_module(f"{module_name}.{attribute}")
+        module.load()
+        try:
+            return module.namespace[attribute]
+        except KeyError:
+            return self.get_module(f"{module_name}.{attribute}")
+
+    def resolve_class(self, module_name: str, qualname: str) -> Any:
+        value = self.get_module(module_name)
+        for name in qualname.split("."):
+            value = getattr(value, name)
+        return value
+
+    @property
+    def search_path(self) -> Optional[List[str]]:
+        return self._search_path
+
+    def is_static_module(self, module_name: str) -> bool:
+        return any(
+            module_name == package or module_name.startswith(f"{package}.")
+            for package in self._packages
+        )
+
+    def _get_static_module(self, module_name: str) -> Optional[StaticModule]:
+        if module_name in self._modules:
+            return self._modules[module_name]
+        module = None
+        if self.is_static_module(module_name):
+            source = find_module_source(module_name, self._search_path)
+            if source is not None:
+                module = StaticModule(source, self)
+        self._modules[module_name] = module
+        return module
+
+
+def _is_auto_call(value: ast.expr) -> bool:
+    if not isinstance(value, ast.Call):
+        return False
+    function = value.func
+    return (isinstance(function, ast.Name) and function.id == "auto") or (
+        isinstance(function, ast.Attribute) and function.attr == "auto"
+    )
+
+
+def _is_type_var_call(value: ast.expr) -> bool:
+    if not isinstance(value, ast.Call):
+        return False
+    function = value.func
+    return (isinstance(function, ast.Name) and function.id == "TypeVar") or (
+        isinstance(function, ast.Attribute) and function.attr == "TypeVar"
+    )
+
+
+def _is_non_field_annotation(annotation: str) -> bool:
+    annotation_name = annotation.split("[")[0].rsplit(".", 1)[-1]
+    return annotation_name in NON_FIELD_ANNOTATIONS
@@ -0,0 +1,126 @@
+import dataclasses
+import importlib
+import inspect
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import List, Type, Dict, Optional, Tuple
+
+from py_typescript_generator.model_parser.class_hierarchy_index import (
+    ClassHierarchyIndex,
+)
+from py_typescript_generator.model_parser.class_parsers.attrs_class_parser import (
+    is_attrs_class,
+)
+from py_typescript_generator.model_parser.class_parsers.msgspec_struct_parser import (
+    is_msgspec_struct,
+)
+from py_typescript_generator.model_parser.class_parsers.pydantic_model_parser import (
+    is_pydantic_model,
+)
+from py_typescript_generator.static_analysis.module_finder import walk_module_names
+from py_typescript_generator.static_analysis.static_class_definition import (
+    get_static_class_definition,
+)
+from py_typescript_generator.static_analysis.static_module_loader import (
+    StaticModuleLoader,
+)
+from py_typescript_generator.typing_utils.typing_utils import (
+    safe_unwrap,
+    is_typed_dict,
+    is_named_tuple,
+)
+
+
+class PackageNotFoundException(RuntimeError):
+    def __init__(self, package: str):
+        super(PackageNotFoundException, self).__init__(
+            f"The package {package} could not be found."
+        )
+
+
+@dataclass
+class DiscoveredTypes:
+    types: List[Type] = field(default_factory=list)
+    module_import_times: Dict[str, float] = field(default_factory=dict)
+
+
+class TypeDiscovery:
+    def __init__(
+        self,
+        static_module_loader: Optional[StaticModuleLoader] = None,
+        max_workers: Optional[int] = None,
+        search_path: Optional[List[str]] = None,
+    ):
+        self._static_module_loader = static_module_loader
+        self._max_workers = max_workers
+        self._search_path = search_path
+        self._class_hierarchy_index = ClassHierarchyIndex()
+
+    def discover(self, packages: List[str]) -> DiscoveredTypes:
+        module_names = []
+        for package in packages:
+            package_module_names = walk_module_names(package, self._search_path)
+            if not package_module_names:
+                raise PackageNotFoundException(package)
+            module_names.extend(package_module_names)
+
+        if self._static_module_loader:
+            loaded_modules = [
+                self._load_module_statically(module_name)
+                for module_name in module_names
+            ]
+        else:
+            # imports mostly wait for file system access, so they are spread across
+            # threads. Results are collected in module order to stay deterministic
+            with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+                loaded_modules = list(executor.map(self._import_module, module_names))
+
+        discovered_types = DiscoveredTypes()
+        for module_name, classes, import_time in loaded_modules:
+            discovered_types.module_import_times[module_name] = import_time
+            discovered_types.types.extend(
+                cls for cls in classes if self._is_generated_type(cls)
+            )
+        return discovered_types
+
+    def _import_module(self, module_name: str) -> Tuple[str, List[Type], float]:
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        import_time = time.perf_counter() - start
+        classes = [
+            cls
+            for cls in vars(module).values()
+            if inspect.isclass(cls) and cls.__module__ == module_name
+        ]
+        return module_name, classes, import_time
+
+    def _load_module_statically(
+        self, module_name: str
+    ) -> Tuple[str, List[Type], float]:
+        static_module_loader = safe_unwrap(self._static_module_loader)
+        start = time.perf_counter()
+        classes = static_module_loader.load_classes(module_name)
+        return module_name, classes, time.perf_counter() - start
+
+    def _is_generated_type(self, cls: Type) -> bool:
+        if issubclass(cls, Enum):
+            return True
+        static_class_definition = get_static_class_definition(cls)
+        if static_class_definition is not None:
+            is_dataclass = static_class_definition.is_dataclass
+        else:
+            is_dataclass = dataclasses.is_dataclass(cls)
+        if (
+            is_dataclass
+            or is_msgspec_struct(cls)
+            or is_attrs_class(cls)
+            or is_pydantic_model(cls)
+            or is_typed_dict(cls)
+            or is_named_tuple(cls)
+        ):
+            return True
+        return self._class_hierarchy_index.is_tagged_union_class(
+            cls
+        ) and self._class_hierarchy_index.is_tagged_union_root(cls)
@@ -1,9 +1,11 @@
+from py_typescript_generator.typescript_model_compiler.ts_enum import TsEnum
 from py_typescript_generator.typescript_model_compiler.ts_field import TsField
 from py_typescript_generator.typescript_model_compiler.ts_model import TsModel
 from py_typescript_generator.typescript_model_compiler.ts_object_type import (
     TsObjectType,
     TsBaseType,
     TsUnionType,
+    TsTupleType,
 )
 
 
@@ -11,12 +13,12 @@ class TypescriptEmitter:
     def emit(self, ts_model: TsModel) -> str:
         typescript_str = ""
         for ts_enum in ts_model.enums:
-            typescript_str += self._emit_enum(ts_enum)
+            typescript_str += self.emit_enum(ts_enum)
         for ts_type in ts_model.types:
-            typescript_str += self._emit_type(ts_type)
+            typescript_str += self.emit_type(ts_type)
         return typescript_str
 
-    def _emit_enum(self, ts_enum):
+    def emit_enum(self, ts_enum: TsEnum) -> str:
         enum_template = "export enum "
         enum_template += ts_enum.name
         enum_template += " {\n"
@@ -28,16 +30,20 @@ class TypescriptEmitter:
 
         return enum_template
 
-    def _emit_type(self, ts_type: TsBaseType) -> str:
+    def emit_type(self, ts_type: TsBaseType) -> str:
         if isinstance(ts_type, TsObjectType):
             return self._compile_object_type(ts_type)
         if isinstance(ts_type, TsUnionType):
             return self._compile_union_type(ts_type)
+        if isinstance(ts_type, TsTupleType):
+            return self._compile_tuple_type(ts_type)
         raise NotImplementedError()
 
     def _compile_object_type(self, ts_type: TsObjectType) -> str:
         type_template = "export interface "
         type_template += ts_type.name
+        if ts_type.type_parameters:
+            type_template += f"<{', '.join(ts_type.type_parameters)}>"
         type_template += " {\n"
         for field in ts_type.fields:
             field_optional_specifier = self._emit_field_optional_specifier(field)
@@ -72,3 +78,12 @@ class TypescriptEmitter:
         type_template += " | ".join(ts_type.union_members)
         type_template += ";\n"
         return type_template
+
+    def _compile_tuple_type(self, ts_type: TsTupleType) -> str:
+        # optional elements are emitted as T | undefined, since elements marked
+        # with ? are only allowed at the end of a tuple
+        elements = ", ".join(
+            f"{element.name}: {element.type.format_as_type_reference()}"
+            for element in ts_type.elements
+        )
+        return f"export type {ts_type.name} = [{elements}];\n"
@@ -1,4 +1,7 @@
 from py_typescript_generator.typescript_model_compiler.ts_type import TsType
+from py_typescript_generator.typescript_model_compiler.ts_union_reference import (
+    TsUnionReference,
+)
 
 
 class TsArray(TsType):
@@ -38,4 +41,10 @@ class TsArray(TsType):
 
     def format_as_type_reference(self):
         formatted_wrapped_type = f"{self.wrapped_type.format_as_type_reference()}"
+        if (
+            isinstance(self.wrapped_type, TsUnionReference)
+            and not self.wrapped_type.is_optional
+        ):
+            # the array suffix binds stronger than the union
+            formatted_wrapped_type = f"({formatted_wrapped_type})"
         return self._format_as_optional(f"{formatted_wrapped_type}[]")
@@ -0,0 +1,48 @@
+from typing import Tuple
+
+from py_typescript_generator.typescript_model_compiler.ts_type import TsType
+
+
+class TsGenericType(TsType):
+    def __init__(
+        self, name: str, type_arguments: Tuple[TsType, ...], is_optional: bool = False
+    ):
+        super(TsGenericType, self).__init__(name, is_optional)
+        self._type_arguments = type_arguments
+
+    def as_optional_type(self):
+        # type: ()->TsGenericType
+        return TsGenericType(self.name, self._type_arguments, is_optional=True)
+
+    def as_non_optional_type(self):
+        # type: ()->TsGenericType
+        return TsGenericType(self.name, self._type_arguments, is_optional=False)
+
+    def with_is_optional(self, is_optional):
+        # type: (bool)->TsGenericType
+        return TsGenericType(self.name, self._type_arguments, is_optional=is_optional)
+
+    @property
+    def type_arguments(self) -> Tuple[TsType, ...]:
+        return self._type_arguments
+
+    def __str__(self):
+        return f"TsGenericType(name='{self.name}', type_arguments={self.type_arguments}, is_optional='{self.is_optional}')"
+
+    def __hash__(self):
+        return hash((self.name, self.type_arguments, self.is_optional))
+
+    def __eq__(self, other):
+        return (
+            other
+            and self.name == other.name
+            and self.type_arguments == getattr(other, "type_arguments", None)
+            and self.is_optional == other.is_optional
+        )
+
+    def format_as_type_reference(self):
+        type_arguments = ", ".join(
+            type_argument.format_as_type_reference()
+            for type_argument in self.type_arguments
+        )
+        return self._format_as_optional(f"{self.name}<{type_arguments}>")
@@ -19,8 +19,15 @@ class TsBaseType:
 class TsObjectType(TsBaseType):
     fields: Tuple[TsField, ...]
     discriminator: Optional[TsDiscriminator] = None
+    type_parameters: Tuple[str, ...] = ()
 
 
 @dataclass(frozen=True)
 class TsUnionType(TsBaseType):
     union_members: Tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class TsTupleType(TsBaseType):
+    # the field names are emitted as labels of the tuple elements
+    elements: Tuple[TsField, ...]
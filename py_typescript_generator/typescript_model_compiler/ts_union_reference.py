@@ -0,0 +1,47 @@
+from typing import Tuple
+
+from py_typescript_generator.typescript_model_compiler.ts_type import TsType
+
+
+class TsUnionReference(TsType):
+    def __init__(self, members: Tuple[TsType, ...], is_optional: bool = False):
+        super(TsUnionReference, self).__init__(
+            " | ".join(member.name for member in members), is_optional
+        )
+        self._members = members
+
+    def as_optional_type(self):
+        # type: ()->TsUnionReference
+        return TsUnionReference(self._members, is_optional=True)
+
+    def as_non_optional_type(self):
+        # type: ()->TsUnionReference
+        return TsUnionReference(self._members, is_optional=False)
+
+    def with_is_optional(self, is_optional):
+        # type: (bool)->TsUnionReference
+        return TsUnionReference(self._members, is_optional=is_optional)
+
+    @property
+    def members(self) -> Tuple[TsType, ...]:
+        return self._members
+
+    def __str__(self):
+        return f"TsUnionReference(name='{self.name}', members={self.members}, is_optional='{self.is_optional}')"
+
+    def __hash__(self):
+        return hash((self.name, self.members, self.is_optional))
+
+    def __eq__(self, other):
+        return (
+            other
+            and self.name == other.name
+            and self.members == getattr(other, "members", None)
+            and self.is_optional == other.is_optional
+        )
+
+    def format_as_type_reference(self):
+        members = " | ".join(
+            member.format_as_type_reference() for member in self.members
+        )
+        return self._format_as_optional(members)
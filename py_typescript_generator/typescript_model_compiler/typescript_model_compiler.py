@@ -1,23 +1,26 @@
+import json
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Type, Optional, Tuple, cast, Dict
+from typing import Type, Optional, Tuple, cast, Dict, Any, Union
 from uuid import UUID
 
 from caseconverter import camelcase  # type: ignore
 from ordered_set import OrderedSet
-from typing_extensions import get_args
-from typing_inspect import is_optional_type, get_origin  # type: ignore
 
 from py_typescript_generator.model.model import Model
 from py_typescript_generator.model.py_class import PyClass, RootTaggedUnionInformation
 from py_typescript_generator.model.py_enum import PyEnum
+from py_typescript_generator.model.py_field import PyField
 from py_typescript_generator.typescript_model_compiler.ts_array import TsArray
 from py_typescript_generator.typescript_model_compiler.ts_enum import (
     TsEnum,
     TsEnumValue,
 )
 from py_typescript_generator.typescript_model_compiler.ts_field import TsField
+from py_typescript_generator.typescript_model_compiler.ts_generic_type import (
+    TsGenericType,
+)
 from py_typescript_generator.typescript_model_compiler.ts_mapped_type import (
     TsMappedType,
 )
@@ -27,13 +30,27 @@ from py_typescript_generator.typescript_model_compiler.ts_object_type import (
     TsDiscriminator,
     TsBaseType,
     TsUnionType,
+    TsTupleType,
 )
 from py_typescript_generator.typescript_model_compiler.ts_type import TsType
+from py_typescript_generator.typescript_model_compiler.ts_union_reference import (
+    TsUnionReference,
+)
 from py_typescript_generator.typescript_model_compiler.well_known_types import (
     TS_NUMBER,
     TS_STRING,
     TS_BOOLEAN,
+    TS_ANY,
+)
+from py_typescript_generator.typing_utils.type_descriptor import (
+    TypeDescriptorCache,
+    TypeDescriptor,
+    TypeKind,
 )
+from py_typescript_generator.typing_utils.hash_consing_table import HashConsingTable
+from py_typescript_generator.typing_utils.lru_cache import LruCache
+from py_typescript_generator.typing_utils.type_filter import TypeFilter
+from py_typescript_generator.typing_utils.typing_utils import is_named_tuple
 
 
 class UnsupportedGenericParameterCount(RuntimeError):
@@ -55,6 +72,27 @@ class UnsupportedEnumValue(RuntimeError):
         )
 
 
+class UnsupportedLiteralValue(RuntimeError):
+    def __init__(self, value: Any) -> None:
+        super().__init__(
+            f"Typescript literal types only support int, bool and string values, provided value was {value!r}."
+        )
+
+
+SCALAR_TYPE_MAPPING: Dict[Type, TsType] = {
+    str: TS_STRING,
+    float: TS_NUMBER,
+    int: TS_NUMBER,
+    bool: TS_BOOLEAN,
+    datetime: TS_STRING,
+    bytes: TS_STRING,
+    UUID: TS_STRING,
+}
+
+
+DEFAULT_COMPILE_CACHE_SIZE = 4096
+
+
 class CaseFormat(Enum):
     KEEP_CASING = "KEEP_CASING"
     CAMEL_CASE = "CAMEL_CASE"
@@ -64,24 +102,54 @@ class CaseFormat(Enum):
 class TypescriptModelCompilerSettings:
     field_case_format: CaseFormat = CaseFormat.KEEP_CASING
     type_mapping_overrides: Dict[Type, Type] = field(default_factory=dict)
+    # references to excluded types are emitted as any
+    type_filter: TypeFilter = field(default_factory=TypeFilter)
+    # number of compiled annotations kept by the compiler, 0 disables the cache
+    compile_cache_size: int = DEFAULT_COMPILE_CACHE_SIZE
 
 
 class TypescriptModelCompiler:
-    def __init__(self, typescript_compiler_settings: TypescriptModelCompilerSettings):
+    def __init__(
+        self,
+        typescript_compiler_settings: TypescriptModelCompilerSettings,
+        type_descriptor_cache: Optional[TypeDescriptorCache] = None,
+    ):
         self.typescript_compiler_settings = typescript_compiler_settings
+        self._type_descriptors = type_descriptor_cache or TypeDescriptorCache()
+        self._ts_fields: HashConsingTable[
+            Tuple[PyField, Any], TsField
+        ] = HashConsingTable()
+        self._camel_case_names: Dict[str, str] = {}
+        # the cache belongs to one compiler, so the overrides and the type filter of
+        # its settings are the same for all entries
+        self._compiled_types: LruCache[Tuple[Any, Any, bool], TsType] = LruCache(
+            typescript_compiler_settings.compile_cache_size
+        )
+
+    @property
+    def ts_field_dedup_ratio(self) -> float:
+        return self._ts_fields.dedup_ratio
+
+    @property
+    def compile_cache_hits(self) -> int:
+        return self._compiled_types.hits
+
+    @property
+    def compile_cache_misses(self) -> int:
+        return self._compiled_types.misses
 
     def compile(self, model: Model) -> TsModel:
         types: OrderedSet[TsBaseType] = OrderedSet()
         for py_class in model.classes:
-            types.append(self._compile_class(py_class))
+            types.append(self.compile_class(py_class))
 
         enums: OrderedSet[TsEnum] = OrderedSet()
         for py_enum in model.enums:
-            enums.append(self._compile_enum(py_enum))
+            enums.append(self.compile_enum(py_enum))
 
         return TsModel(types=types, enums=enums)
 
-    def _compile_class(self, py_class: PyClass) -> TsBaseType:
+    def compile_class(self, py_class: PyClass) -> TsBaseType:
         if py_class.tagged_union_information and isinstance(
             py_class.tagged_union_information, RootTaggedUnionInformation
         ):
@@ -91,79 +159,143 @@ class TypescriptModelCompiler:
                     x.__name__ for x in py_class.tagged_union_information.child_types
                 ),
             )
-        fields = []
-        for py_field in py_class.fields:
-            fields.append(
-                TsField(
-                    name=self._adjust_casing(py_field.name),
-                    type=self._compile_type(py_field.type),
-                )
-            )
+        fields = [self._compile_field(py_field) for py_field in py_class.fields]
+        if is_named_tuple(py_class.type):
+            return TsTupleType(name=py_class.name, elements=tuple(fields))
         if not py_class.tagged_union_information:
-            return TsObjectType(name=py_class.name, fields=tuple(fields))
+            return TsObjectType(
+                name=py_class.name,
+                fields=tuple(fields),
+                type_parameters=py_class.type_parameters,
+            )
+        tagged_union_information = py_class.tagged_union_information
         return TsObjectType(
             name=py_class.name,
             fields=tuple(fields),
             discriminator=TsDiscriminator(
-                name=self._adjust_casing(
-                    py_class.tagged_union_information.discriminant_attribute
+                name=tagged_union_information.discriminant_attribute
+                if tagged_union_information.discriminant_attribute_is_alias
+                else self._adjust_casing(
+                    tagged_union_information.discriminant_attribute
                 ),
-                value=py_class.tagged_union_information.discriminant_literal,
+                value=tagged_union_information.discriminant_literal,
             ),
+            type_parameters=py_class.type_parameters,
         )
 
+    def _compile_field(self, py_field: PyField) -> TsField:
+        # equal fields of different classes share their TsField. Unions with a
+        # different member order are equal, so the arguments are part of the key
+        key = (py_field, getattr(py_field.type, "__args__", None))
+        ts_field = self._ts_fields.get(key)
+        if ts_field is None:
+            ts_field = self._ts_fields.add(
+                key,
+                TsField(
+                    name=py_field.alias
+                    if py_field.alias is not None
+                    else self._adjust_casing(py_field.name),
+                    type=self._compile_type(py_field.type),
+                ),
+            )
+        return ts_field
+
     def _compile_type(self, cls: Type, optional: bool = False) -> TsType:
+        # Unions with a different member order are equal, so the arguments are part
+        # of the key
+        key = (cls, getattr(cls, "__args__", None), optional)
+        ts_type = self._compiled_types.get(key)
+        if ts_type is None:
+            ts_type = self._compiled_types.add(
+                key, self._compile_uncached_type(cls, optional)
+            )
+        return ts_type
+
+    def _compile_uncached_type(self, cls: Type, optional: bool) -> TsType:
         type_override = self.typescript_compiler_settings.type_mapping_overrides.get(
             cls
         )
         if type_override:
             return self._compile_type(type_override, optional)
-        mapped_type = self._map_scalar_type(cls)
-        if mapped_type:
-            return mapped_type.with_is_optional(optional)
+        type_descriptor = self._type_descriptors.get(cls)
+        if type_descriptor.is_scalar:
+            return SCALAR_TYPE_MAPPING[cls].with_is_optional(optional)
+        if type_descriptor.kind == TypeKind.LITERAL:
+            return self._compile_literal(type_descriptor, optional)
+
+        if type_descriptor.is_optional:
+            return self._compile_type(type_descriptor.wrapped_type, optional=True)
+
+        if not type_descriptor.is_terminal and self._is_excluded(cls, type_descriptor):
+            return TS_ANY.with_is_optional(optional)
 
-        if is_optional_type(cls):
-            return self._compile_type(get_args(cls)[0], optional=True)
+        if type_descriptor.kind == TypeKind.GENERIC:
+            return self._compile_generic_reference(type_descriptor, optional)
 
-        has_generic_args = len(get_args(cls)) > 0
+        has_generic_args = len(type_descriptor.args) > 0
         if has_generic_args:
-            return self._map_generic_type(cls, optional)
+            return self._map_generic_type(type_descriptor, optional)
 
         return TsType(name=cls.__name__, is_optional=optional)
 
-    def _map_scalar_type(self, cls: Type) -> Optional[TsType]:
-        if cls == str:
-            return TS_STRING
-        elif cls == float:
-            return TS_NUMBER
-        elif cls == int:
-            return TS_NUMBER
-        elif cls == bool:
-            return TS_BOOLEAN
-        elif cls == datetime:
-            return TS_STRING
-        elif cls == bytes:
-            return TS_STRING
-        elif cls == UUID:
-            return TS_STRING
-        return None
-
-    def _map_generic_type(self, cls: Type, is_optional: bool) -> TsType:
-        generic_origin_type = get_origin(cls)
+    def _compile_generic_reference(
+        self, type_descriptor: TypeDescriptor, is_optional: bool
+    ) -> TsType:
+        # instantiations like Page[Foo] reference the generic interface Page<T>
+        return TsGenericType(
+            name=cast(Type, type_descriptor.origin).__name__,
+            type_arguments=tuple(
+                self._compile_type(arg) for arg in type_descriptor.args
+            ),
+            is_optional=is_optional,
+        )
+
+    def _compile_literal(
+        self, type_descriptor: TypeDescriptor, is_optional: bool
+    ) -> TsType:
+        for value in type_descriptor.args:
+            if type(value) not in {int, bool, str}:
+                raise UnsupportedLiteralValue(value)
+        if len(type_descriptor.args) == 1:
+            return TsType(
+                name=json.dumps(type_descriptor.args[0]), is_optional=is_optional
+            )
+        return TsUnionReference(
+            members=tuple(
+                TsType(name=json.dumps(value)) for value in type_descriptor.args
+            ),
+            is_optional=is_optional,
+        )
+
+    def _is_excluded(self, cls: Type, type_descriptor: TypeDescriptor) -> bool:
+        return self.typescript_compiler_settings.type_filter.is_excluded(
+            type_descriptor.origin or cls
+        )
+
+    def _map_generic_type(
+        self, type_descriptor: TypeDescriptor, is_optional: bool
+    ) -> TsType:
+        generic_origin_type = type_descriptor.origin
         is_mapped_to_array = generic_origin_type in {list, set, frozenset, OrderedSet}
         if is_mapped_to_array:
-            if len(get_args(cls)) != 1:
+            if len(type_descriptor.args) != 1:
                 raise UnsupportedGenericParameterCount(
                     "A type which is mapped to an array can only have one generic parameter."
                 )
             return TsArray(
-                wrapped_type=self._compile_type(get_args(cls)[0]),
+                wrapped_type=self._compile_type(type_descriptor.args[0]),
+                is_optional=is_optional,
+            )
+
+        if generic_origin_type is Union:
+            return TsUnionReference(
+                members=tuple(self._compile_type(arg) for arg in type_descriptor.args),
                 is_optional=is_optional,
             )
 
-        is_mapped_to_mapped_type = issubclass(generic_origin_type, dict)
+        is_mapped_to_mapped_type = issubclass(generic_origin_type, dict)  # type: ignore
         if is_mapped_to_mapped_type:
-            key_cls = get_args(cls)[0]
+            key_cls = type_descriptor.args[0]
             has_str_key = key_cls == str
             if not has_str_key:
                 raise UnsupportedKeyTypeForMappedType(key_cls)
@@ -174,7 +306,7 @@ class TypescriptModelCompiler:
 
         raise ValueError("not supported")
 
-    def _compile_enum(self, enum: PyEnum) -> TsEnum:
+    def compile_enum(self, enum: PyEnum) -> TsEnum:
         for py_enum_value in enum.values:
             if type(py_enum_value.value) not in {int, str}:
                 raise UnsupportedEnumValue(type(py_enum_value.value))
@@ -183,5 +315,11 @@ class TypescriptModelCompiler:
 
     def _adjust_casing(self, name: str) -> str:
         if self.typescript_compiler_settings.field_case_format == CaseFormat.CAMEL_CASE:
-            return cast(str, camelcase(name))
+            # field names repeat across classes, camelcase() is slow compared to
+            # the lookup
+            adjusted_name = self._camel_case_names.get(name)
+            if adjusted_name is None:
+                adjusted_name = cast(str, camelcase(name))
+                self._camel_case_names[name] = adjusted_name
+            return adjusted_name
         return name
@@ -0,0 +1,42 @@
+from typing import Dict, Generic, TypeVar, Optional, Hashable
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class HashConsingTable(Generic[K, V]):
+    # maps structurally equal values to one canonical instance, which is shared
+    # by all users of the table
+    def __init__(self) -> None:
+        self._values: Dict[K, V] = {}
+        self.lookups = 0
+        self.hits = 0
+
+    def get(self, key: K) -> Optional[V]:
+        self.lookups += 1
+        try:
+            value = self._values.get(key)
+        except TypeError:
+            return None
+        if value is not None:
+            self.hits += 1
+        return value
+
+    def add(self, key: K, value: V) -> V:
+        try:
+            self._values[key] = value
+        except TypeError:
+            pass
+        return value
+
+    @property
+    def dedup_ratio(self) -> float:
+        if not self.lookups:
+            return 0.0
+        return self.hits / self.lookups
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
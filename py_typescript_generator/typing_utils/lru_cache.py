@@ -0,0 +1,48 @@
+from collections import OrderedDict
+from typing import Generic, TypeVar, Optional, Hashable
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LruCache(Generic[K, V]):
+    # keeps at most max_size values and evicts the least recently used one. A
+    # max_size of 0 disables the cache, unhashable keys are never cached
+    def __init__(self, max_size: int) -> None:
+        self._values: "OrderedDict[K, V]" = OrderedDict()
+        self._max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: K) -> Optional[V]:
+        try:
+            value = self._values.get(key)
+        except TypeError:
+            value = None
+        if value is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self._values.move_to_end(key)
+        return value
+
+    def add(self, key: K, value: V) -> V:
+        if self._max_size <= 0:
+            return value
+        try:
+            self._values[key] = value
+        except TypeError:
+            return value
+        if len(self._values) > self._max_size:
+            self._values.popitem(last=False)
+        return value
+
+    @property
+    def max_size(self) -> int:
+        return self._max_size
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def __len__(self) -> int:
+        return len(self._values)
@@ -0,0 +1,199 @@
+import inspect
+import types
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+from typing import (
+    Type,
+    Tuple,
+    Optional,
+    TypeVar,
+    Union,
+    Generic,
+    Literal,
+    Dict,
+    Any,
+    cast,
+)
+from typing import _GenericAlias  # type: ignore
+from uuid import UUID
+
+# Note: this can be removed once support for Python 3.7 is dropped
+from typing_inspect import get_args, get_origin, is_optional_type  # type: ignore
+
+from py_typescript_generator.typing_utils.weak_type_cache import WeakTypeCache
+
+TERMINATING_CLASSES = {
+    int,
+    float,
+    complex,
+    str,
+    bytes,
+    bool,
+    datetime,
+    UUID,
+    list,
+    set,
+    dict,
+    frozenset,
+    tuple,
+    defaultdict,
+    Union,
+}
+
+SCALAR_CLASSES = {
+    int,
+    float,
+    str,
+    bytes,
+    bool,
+    datetime,
+    UUID,
+}
+
+
+class TypeKind(Enum):
+    # objects which are neither classes nor generic aliases
+    INVALID = "INVALID"
+    SCALAR = "SCALAR"
+    # containers and other types which are not part of the model, but whose
+    # generic arguments are
+    TERMINAL = "TERMINAL"
+    ENUM = "ENUM"
+    # literal types like Literal["active"], their arguments are values
+    LITERAL = "LITERAL"
+    OPTIONAL = "OPTIONAL"
+    GENERIC = "GENERIC"
+    CLASS = "CLASS"
+
+
+@dataclass(frozen=True)
+class TypeDescriptor:
+    origin: Optional[Type]
+    args: Tuple[Type, ...]
+    is_optional: bool
+    is_terminal: bool
+    is_scalar: bool
+    kind: TypeKind
+
+    @property
+    def wrapped_type(self) -> Type:
+        # Optional[Union[A, B]] wraps the Union of all members except None
+        members = tuple(arg for arg in self.args if arg is not type(None))
+        if len(members) == 1:
+            return members[0]
+        return Union[members]  # type: ignore
+
+    @staticmethod
+    def of(cls):
+        # type: (Type)->TypeDescriptor
+        origin = _get_origin(cls)
+        args = tuple(get_args(cls))
+        is_optional = is_optional_type(cls)
+        is_terminal = _is_terminal(cls, origin)
+        is_scalar = _is_scalar(cls)
+        return TypeDescriptor(
+            origin=origin,
+            args=args,
+            is_optional=is_optional,
+            is_terminal=is_terminal,
+            is_scalar=is_scalar,
+            kind=_classify(cls, origin, args, is_optional, is_terminal, is_scalar),
+        )
+
+
+def _classify(
+    cls: Type,
+    origin: Optional[Type],
+    args: Tuple[Type, ...],
+    is_optional: bool,
+    is_terminal: bool,
+    is_scalar: bool,
+) -> TypeKind:
+    # the order matters: Optional[T] is terminal and has generic arguments, scalars
+    # are terminal as well
+    if not _is_class(cls):
+        return TypeKind.INVALID
+    if _is_enum(cls):
+        return TypeKind.ENUM
+    if origin is Literal:
+        return TypeKind.LITERAL
+    if is_optional:
+        return TypeKind.OPTIONAL
+    if is_scalar:
+        return TypeKind.SCALAR
+    if is_terminal:
+        return TypeKind.TERMINAL
+    if args:
+        return TypeKind.GENERIC
+    return TypeKind.CLASS
+
+
+def _get_origin(cls: Type) -> Optional[Type]:
+    # unions written as int | str are described like Union[int, str]
+    if isinstance(cls, types.UnionType):
+        return cast(Type, Union)
+    return cast(Optional[Type], get_origin(cls))
+
+
+def _is_class(cls: Type) -> bool:
+    if (
+        isinstance(cls, _GenericAlias)
+        or isinstance(cls, types.UnionType)
+        or isinstance(cls, Generic)  # type: ignore
+        or isinstance(cls, TypeVar)
+    ):
+        return True
+    return inspect.isclass(cls)
+
+
+def _is_enum(cls: Type) -> bool:
+    try:
+        return issubclass(cls, Enum)
+    except TypeError:
+        return False
+
+
+def _is_terminal(cls: Type, origin: Optional[Type]) -> bool:
+    if origin:
+        return origin in TERMINATING_CLASSES
+    if isinstance(cls, TypeVar):
+        return True
+    return _safe_contains(TERMINATING_CLASSES, cls)
+
+
+def _is_scalar(cls: Type) -> bool:
+    return _safe_contains(SCALAR_CLASSES, cls)
+
+
+def _safe_contains(classes: set, cls: Type) -> bool:
+    try:
+        return cls in classes
+    except TypeError:
+        return False
+
+
+class TypeDescriptorCache:
+    def __init__(self) -> None:
+        # typing treats Unions with the same members as equal, so the descriptors of
+        # a type are kept per argument tuple, which keeps the member order
+        self._descriptors: WeakTypeCache[Dict[Any, TypeDescriptor]] = WeakTypeCache()
+
+    def get(self, cls: Type) -> TypeDescriptor:
+        args = getattr(cls, "__args__", None)
+        descriptors = self._descriptors.get(cls)
+        if descriptors is None:
+            descriptors = {}
+            self._descriptors.set(cls, descriptors)
+        try:
+            descriptor = descriptors.get(args)
+        except TypeError:
+            return TypeDescriptor.of(cls)
+        if descriptor is None:
+            descriptor = TypeDescriptor.of(cls)
+            descriptors[args] = descriptor
+        return descriptor
+
+    def __len__(self) -> int:
+        return sum(len(descriptors) for _, descriptors in self._descriptors.items())
@@ -0,0 +1,77 @@
+import fnmatch
+import functools
+import re
+from typing import Type, Callable, Iterable, Pattern
+
+from py_typescript_generator.typing_utils.weak_type_cache import WeakTypeCache
+
+TypePredicate = Callable[[Type], bool]
+
+
+# predicates are partials of module level functions, so filters can be passed to
+# worker processes
+
+
+def module_prefix(prefix: str) -> TypePredicate:
+    return functools.partial(_matches_module_prefix, prefix)
+
+
+def _matches_module_prefix(prefix: str, cls: Type) -> bool:
+    module = getattr(cls, "__module__", "")
+    return module == prefix or module.startswith(f"{prefix}.")
+
+
+def name_pattern(pattern: str) -> TypePredicate:
+    # the pattern is matched against the qualified name, e.g. "my_app.internal.*"
+    return functools.partial(
+        _matches_name_pattern, re.compile(fnmatch.translate(pattern))
+    )
+
+
+def _matches_name_pattern(regex: Pattern, cls: Type) -> bool:
+    qualified_name = (
+        f"{getattr(cls, '__module__', '')}.{getattr(cls, '__qualname__', '')}"
+    )
+    return regex.match(qualified_name) is not None
+
+
+def has_marker(marker: str) -> TypePredicate:
+    return functools.partial(_has_marker, marker)
+
+
+def _has_marker(marker: str, cls: Type) -> bool:
+    return bool(getattr(cls, marker, False))
+
+
+class TypeFilter:
+    def __init__(
+        self,
+        include: Iterable[TypePredicate] = (),
+        exclude: Iterable[TypePredicate] = (),
+    ):
+        self._include = list(include)
+        self._exclude = list(exclude)
+        self._is_excluded: WeakTypeCache[bool] = WeakTypeCache()
+
+    def is_excluded(self, cls: Type) -> bool:
+        # a type is excluded if it matches an exclude rule, or if there are include
+        # rules and it matches none of them
+        is_excluded = self._is_excluded.get(cls)
+        if is_excluded is None:
+            is_excluded = self._evaluate(cls)
+            self._is_excluded.set(cls, is_excluded)
+        return is_excluded
+
+    def _evaluate(self, cls: Type) -> bool:
+        if any(predicate(cls) for predicate in self._exclude):
+            return True
+        return bool(self._include) and not any(
+            predicate(cls) for predicate in self._include
+        )
+
+    def __reduce__(self):
+        # the cache is not pickled, it only holds weak references to types
+        return TypeFilter, (self._include, self._exclude)
+
+    def __bool__(self) -> bool:
+        return bool(self._include or self._exclude)
@@ -1,6 +1,6 @@
-from typing import Type, Optional, TypeVar
+from typing import Type, Optional, TypeVar, Any, Tuple, Dict, Mapping, Generic, List
 
-from typing_inspect import get_args  # type: ignore
+from typing_inspect import get_args, get_origin  # type: ignore
 
 T = TypeVar("T")
 
@@ -14,3 +14,59 @@ def safe_unwrap(optional: Optional[T]) -> T:
     if optional is None:
         raise ValueError("Tried to unwrap an optional, but it was None.")
     return optional
+
+
+def is_typed_dict(cls: Any) -> bool:
+    # also matches TypedDicts of typing_extensions, which typing.is_typeddict()
+    # does not recognize
+    return (
+        isinstance(cls, type)
+        and issubclass(cls, dict)
+        and hasattr(cls, "__required_keys__")
+    )
+
+
+def is_named_tuple(cls: Any) -> bool:
+    return isinstance(cls, type) and issubclass(cls, tuple) and hasattr(cls, "_fields")
+
+
+def get_type_parameters(cls: Type) -> Tuple[str, ...]:
+    # __parameters__ only contains the type variables which are not bound by a
+    # parameterized base class, so class Page(Base[int], Generic[T]) has only T
+    return tuple(parameter.__name__ for parameter in getattr(cls, "__parameters__", ()))
+
+
+def get_base_type_arguments(cls: Type) -> Dict[Type, Dict[Any, Any]]:
+    # the type arguments bound by parameterized base classes, like Foo of
+    # class FooPage(Page[Foo]), by the generic base class declaring the type
+    # variables. Bases of bases are bound through the arguments of their children
+    type_arguments: Dict[Type, Dict[Any, Any]] = {}
+    bases_to_visit: List[Tuple[Type, Dict[Any, Any]]] = [(cls, {})]
+    while bases_to_visit:
+        base, arguments = bases_to_visit.pop()
+        for parameterized_base in vars(base).get("__orig_bases__", ()):
+            origin = get_origin(parameterized_base)
+            if origin is None or origin is Generic:
+                continue
+            base_arguments = {
+                parameter: bind_type_arguments(argument, arguments)
+                for parameter, argument in zip(
+                    getattr(origin, "__parameters__", ()), get_args(parameterized_base)
+                )
+            }
+            type_arguments[origin] = base_arguments
+            bases_to_visit.append((origin, base_arguments))
+    return type_arguments
+
+
+def bind_type_arguments(cls: Any, type_arguments: Mapping[Any, Any]) -> Any:
+    if not type_arguments:
+        return cls
+    if isinstance(cls, TypeVar):
+        return type_arguments.get(cls, cls)
+    parameters = getattr(cls, "__parameters__", ())
+    if not parameters or isinstance(cls, type):
+        return cls
+    return cls[
+        tuple(type_arguments.get(parameter, parameter) for parameter in parameters)
+    ]
@@ -0,0 +1,47 @@
+import weakref
+from typing import Type, TypeVar, Generic, Optional, Iterator, Tuple
+
+V = TypeVar("V")
+
+
+class WeakTypeCache(Generic[V]):
+    # values are kept as long as their type is alive, so caches of long running
+    # processes do not keep old versions of reloaded classes alive. Types which
+    # can not be weakly referenced, like int | None, are created again whenever an
+    # annotation is evaluated and would keep their arguments alive, so they are
+    # not cached, like unhashable types
+    def __init__(self) -> None:
+        self._values: "weakref.WeakKeyDictionary[Type, V]" = weakref.WeakKeyDictionary()
+
+    def get(self, cls: Type) -> Optional[V]:
+        try:
+            return self._values.get(cls)
+        except TypeError:
+            return None
+
+    def set(self, cls: Type, value: V) -> None:
+        try:
+            self._values[cls] = value
+        except TypeError:
+            pass
+
+    def pop(self, cls: Type) -> Optional[V]:
+        try:
+            return self._values.pop(cls, None)
+        except TypeError:
+            return None
+
+    def items(self) -> Iterator[Tuple[Type, V]]:
+        return iter(list(self._values.items()))
+
+    def clear(self) -> None:
+        self._values.clear()
+
+    def __contains__(self, cls: Type) -> bool:
+        try:
+            return cls in self._values
+        except TypeError:
+            return False
+
+    def __len__(self) -> int:
+        return len(self._values)
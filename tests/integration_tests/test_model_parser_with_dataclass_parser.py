@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import List, Dict
+import sys
+from dataclasses import dataclass, make_dataclass
+from typing import List, Dict, Optional, Generic, TypeVar
 
 from ordered_set import OrderedSet
 
@@ -13,6 +14,10 @@ from py_typescript_generator.model_parser.model_parser import (
     ModelParser,
     ModelParserSettings,
 )
+from tests.unittests.class_parsers.postponed_annotation_classes import (
+    FirstPostponedClassInCycle,
+    SecondPostponedClassInCycle,
+)
 
 
 @dataclass
@@ -157,3 +162,71 @@ def test_should_parse_dataclass_with_nested_generics_correctly():
             ]
         )
     )
+
+
+def test_should_parse_deeply_nested_dataclasses_without_recursion_error():
+    depth = sys.getrecursionlimit() * 2
+    nested_class = make_dataclass("NestedClass0", [("value", int)])
+    for i in range(1, depth):
+        nested_class = make_dataclass(f"NestedClass{i}", [("nested", nested_class)])
+    model_parser = ModelParser(
+        [nested_class], [DataclassParser()], ModelParserSettings()
+    )
+
+    model = model_parser.parse()
+
+    assert len(model.classes) == depth
+    assert model.classes[0].type == nested_class
+    assert model.classes[-1].name == "NestedClass0"
+    assert model_parser.frontier == []
+
+
+def test_should_parse_cycle_with_postponed_annotations():
+    model_parser = ModelParser(
+        [FirstPostponedClassInCycle], [DataclassParser()], ModelParserSettings()
+    )
+
+    model = model_parser.parse()
+
+    assert model == Model.of_classes(
+        [
+            PyClass(
+                name="FirstPostponedClassInCycle",
+                type=FirstPostponedClassInCycle,
+                fields=(
+                    PyField(name="second", type=Optional[SecondPostponedClassInCycle]),
+                ),
+            ),
+            PyClass(
+                name="SecondPostponedClassInCycle",
+                type=SecondPostponedClassInCycle,
+                fields=(
+                    PyField(name="first", type=FirstPostponedClassInCycle),
+                    PyField(name="values", type=List[int]),
+                ),
+            ),
+        ]
+    )
+
+
+def test_should_parse_generic_dataclass_once_for_all_instantiations():
+    T = TypeVar("T")
+
+    @dataclass
+    class Page(Generic[T]):
+        items: List[T]
+
+    @dataclass
+    class Item:
+        value: int
+
+    @dataclass
+    class Pages:
+        items: Page[Item]
+        numbers: Page[int]
+        optional_items: Optional[Page[Item]]
+
+    model = ModelParser([Pages], [DataclassParser()], ModelParserSettings()).parse()
+
+    assert [py_class.type for py_class in model.classes] == [Pages, Item, Page]
+    assert model.classes[2].type_parameters == ("T",)
@@ -0,0 +1,87 @@
+import gc
+import importlib
+import textwrap
+import weakref
+
+from py_typescript_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py_typescript_generator.model_parser.model_parser import (
+    ModelParser,
+    ModelParserSettings,
+)
+from py_typescript_generator.typing_utils.type_descriptor import TypeDescriptorCache
+
+RELOAD_CYCLES = 1000
+CHECKPOINT_CYCLES = 250
+
+
+def test_reloaded_classes_should_not_be_kept_alive(tmp_path, monkeypatch):
+    (tmp_path / "reloaded_model_fixture.py").write_text(
+        textwrap.dedent(
+            """
+            from __future__ import annotations
+
+            from dataclasses import dataclass
+            from enum import Enum
+            from typing import List, Optional
+
+            class Color(Enum):
+                RED = "RED"
+
+            @dataclass
+            class Item:
+                name: str
+                color: Color
+
+            @dataclass
+            class TaggedUnionRoot:
+                __json_type_info_attribute__ = "type"
+
+            @dataclass
+            class TaggedUnionChild(TaggedUnionRoot):
+                type = "CHILD"
+                item: Item
+
+            @dataclass
+            class Container:
+                items: List[Item]
+                optional_item: Optional[Item]
+                union_item: Item | Color | None
+                root: TaggedUnionRoot
+            """
+        )
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    module = importlib.import_module("reloaded_model_fixture")
+    model_parser = ModelParser(
+        [module.Container],
+        [DataclassParser()],
+        ModelParserSettings(),
+        type_descriptor_cache=TypeDescriptorCache(),
+    )
+    model = model_parser.parse()
+
+    old_items = []
+    alive_old_items = []
+    for cycle in range(1, RELOAD_CYCLES + 1):
+        old_items.append(weakref.ref(module.Item))
+        module = importlib.reload(module)
+        model = model_parser.update(
+            model,
+            [
+                module.Color,
+                module.Item,
+                module.TaggedUnionRoot,
+                module.TaggedUnionChild,
+                module.Container,
+            ],
+        )
+        if cycle % CHECKPOINT_CYCLES == 0:
+            gc.collect()
+            alive_old_items.append(sum(1 for item in old_items if item()))
+
+    # typing keeps a bounded cache of parametrized aliases like List[Item], which
+    # keeps the most recent old versions alive
+    assert alive_old_items[-1] <= alive_old_items[0] < CHECKPOINT_CYCLES
+    assert [py_class.type for py_class in model.classes][-1] is module.TaggedUnionRoot
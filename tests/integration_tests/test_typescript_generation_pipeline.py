@@ -1,8 +1,17 @@
+import sys
+import textwrap
 from dataclasses import dataclass
+from typing import List, Literal, NamedTuple, Optional, Generic, TypeVar, Union
+
+import pytest
+from typing_extensions import TypedDict, NotRequired
 
 from py_typescript_generator.generation_pipeline.typescript_generation_pipeline_builder import (
     TypeGenerationPipelineBuilder,
 )
+from py_typescript_generator.typing_utils.type_filter import has_marker
+from tests.unittests.model_parser.shard_fixtures.first_shard import FirstRootClass
+from tests.unittests.model_parser.shard_fixtures.second_shard import SecondRootClass
 
 
 def test_build_pipeline(tmp_path):
@@ -39,3 +48,389 @@ export interface TaggedUnionChild {
 export type TaggedUnionRoot = TaggedUnionChild;
 """
     )
+
+
+def test_build_pipeline_for_source_modules(tmp_path):
+    source_folder = tmp_path / "src"
+    source_folder.mkdir()
+    (source_folder / "static_pipeline_fixture.py").write_text(
+        textwrap.dedent(
+            """
+            from dataclasses import dataclass
+            from enum import Enum
+            from typing import List, Literal
+
+            class Color(Enum):
+                RED = "RED"
+
+            @dataclass
+            class TaggedUnionRoot:
+                __json_type_info_attribute__ = "type"
+
+            @dataclass
+            class TaggedUnionChild(TaggedUnionRoot):
+                type = "CHILD"
+                colors: List[Color]
+            """
+        )
+    )
+
+    output_file = tmp_path / "test.ts"
+    TypeGenerationPipelineBuilder().for_source_modules(
+        ["static_pipeline_fixture"], search_path=[str(source_folder)]
+    ).to_file(output_file).build().run()
+
+    with open(output_file, "r") as f:
+        content = f.read()
+
+    assert "static_pipeline_fixture" not in sys.modules
+    assert (
+        content
+        == """export enum Color {
+    RED = "RED",
+}
+export interface TaggedUnionChild {
+    colors: Color[]
+    type: "CHILD"
+}
+export type TaggedUnionRoot = TaggedUnionChild;
+"""
+    )
+
+
+def test_build_pipeline_for_packages_without_import(tmp_path):
+    package_folder = tmp_path / "src" / "static_discovery_pipeline_fixture"
+    package_folder.mkdir(parents=True)
+    (package_folder / "__init__.py").write_text("")
+    (package_folder / "models.py").write_text(
+        textwrap.dedent(
+            """
+            from dataclasses import dataclass
+
+            @dataclass
+            class MyExampleClass:
+                value: int
+            """
+        )
+    )
+
+    output_file = tmp_path / "test.ts"
+    pipeline = (
+        TypeGenerationPipelineBuilder()
+        .for_packages(
+            ["static_discovery_pipeline_fixture"],
+            without_import=True,
+            search_path=[str(tmp_path / "src")],
+        )
+        .to_file(output_file)
+        .build()
+    )
+    pipeline.run()
+
+    with open(output_file, "r") as f:
+        content = f.read()
+
+    assert content == "export interface MyExampleClass {\n    value: number\n}\n"
+    assert list(pipeline.statistics.module_import_times) == [
+        "static_discovery_pipeline_fixture",
+        "static_discovery_pipeline_fixture.models",
+    ]
+
+
+@dataclass
+class CachedExampleClass:
+    value: int
+
+
+def test_build_pipeline_with_parse_cache(tmp_path):
+    pipeline = (
+        TypeGenerationPipelineBuilder()
+        .for_types([CachedExampleClass])
+        .with_parse_cache(tmp_path / "cache")
+        .to_file(tmp_path / "test.ts")
+        .build()
+    )
+
+    pipeline.run()
+    assert pipeline.statistics.parse_cache_misses == 1
+    pipeline.run()
+
+    assert pipeline.statistics.parse_cache_hits == 1
+    assert pipeline.statistics.parse_cache_misses == 0
+    with open(tmp_path / "test.ts", "r") as f:
+        assert (
+            f.read() == "export interface CachedExampleClass {\n    value: number\n}\n"
+        )
+
+
+@dataclass
+class FirstClassWithSharedFields:
+    name: str
+    tags: List[str]
+
+
+@dataclass
+class SecondClassWithSharedFields:
+    name: str
+    tags: List[str]
+
+
+def test_build_pipeline_should_report_dedup_ratios(tmp_path):
+    pipeline = (
+        TypeGenerationPipelineBuilder()
+        .for_types([FirstClassWithSharedFields, SecondClassWithSharedFields])
+        .to_file(tmp_path / "test.ts")
+        .build()
+    )
+
+    pipeline.run()
+
+    assert pipeline.statistics.dedup_ratios == {
+        "py_fields": 0.5,
+        "field_types": 0.5,
+        "ts_fields": 0.5,
+    }
+
+
+def test_build_pipeline_should_report_compile_cache_statistics(tmp_path):
+    pipeline = (
+        TypeGenerationPipelineBuilder()
+        .for_types([FirstClassWithSharedFields, SecondClassWithSharedFields])
+        .with_compile_cache_size(16)
+        .to_file(tmp_path / "test.ts")
+        .build()
+    )
+
+    pipeline.run()
+
+    # str and List[str] are compiled once, the str of List[str] is a hit. Fields of
+    # the second class are shared with the first one and are not compiled again
+    assert pipeline.statistics.compile_cache_misses == 2
+    assert pipeline.statistics.compile_cache_hits == 1
+
+
+def test_build_pipeline_with_excluded_types(tmp_path):
+    @dataclass
+    class InternalHelper:
+        __internal__ = True
+        value: int
+
+    @dataclass
+    class MyExampleClass:
+        helper: InternalHelper
+
+    output_file = tmp_path / "test.ts"
+    TypeGenerationPipelineBuilder().for_types([MyExampleClass]).exclude_types(
+        [has_marker("__internal__")]
+    ).to_file(output_file).build().run()
+
+    with open(output_file, "r") as f:
+        content = f.read()
+
+    assert (
+        content
+        == """export interface MyExampleClass {
+    helper: any
+}
+"""
+    )
+
+
+def test_build_pipeline_with_parallel_parsing(tmp_path):
+    def generate(output_file, parse_in_parallel):
+        builder = TypeGenerationPipelineBuilder().for_types(
+            [SecondRootClass, FirstRootClass]
+        )
+        if parse_in_parallel:
+            builder.parse_in_parallel(max_workers=2)
+        builder.to_file(output_file).build().run()
+        with open(output_file, "r") as f:
+            return f.read()
+
+    content = generate(tmp_path / "parallel.ts", True)
+
+    assert content.startswith("export enum SharedEnum {")
+    assert content == generate(tmp_path / "sequential.ts", False)
+
+
+def test_build_pipeline_with_msgspec_structs(tmp_path):
+    msgspec = pytest.importorskip("msgspec")
+
+    class Address(msgspec.Struct, rename="camel"):
+        street_name: str
+
+    class Customer(msgspec.Struct, tag_field="kind", tag="customer"):
+        address: Address
+
+    output_file = tmp_path / "test.ts"
+    TypeGenerationPipelineBuilder().for_types([Customer]).to_file(
+        output_file
+    ).build().run()
+
+    with open(output_file, "r") as f:
+        content = f.read()
+
+    assert (
+        content
+        == """export interface Customer {
+    address: Address
+    kind: "customer"
+}
+export interface Address {
+    streetName: string
+}
+"""
+    )
+
+
+def test_build_pipeline_with_pydantic_models(tmp_path):
+    pydantic = pytest.importorskip("pydantic", minversion="2")
+
+    class Address(pydantic.BaseModel):
+        street_name: str = pydantic.Field(serialization_alias="street")
+
+    class Cat(pydantic.BaseModel):
+        kind: Literal["cat"]
+        home_address: Address
+
+    class Dog(pydantic.BaseModel):
+        kind: Literal["dog"]
+        status: Literal["awake", "asleep"]
+
+    class Owner(pydantic.BaseModel):
+        pet: Union[Cat, Dog] = pydantic.Field(discriminator="kind")
+
+    output_file = tmp_path / "test.ts"
+    TypeGenerationPipelineBuilder().for_types(
+        [Owner]
+    ).convert_field_names_to_camel_case().to_file(output_file).build().run()
+
+    with open(output_file, "r") as f:
+        content = f.read()
+
+    assert (
+        content
+        == """export interface Owner {
+    pet: Cat | Dog
+}
+export interface Cat {
+    homeAddress: Address
+    kind: "cat"
+}
+export interface Address {
+    street: string
+}
+export interface Dog {
+    status: "awake" | "asleep"
+    kind: "dog"
+}
+"""
+    )
+
+
+def test_build_pipeline_with_typed_dicts_and_named_tuples(tmp_path):
+    class Point(NamedTuple):
+        x: int
+        y: int
+        label: Optional[str]
+
+    class Shape(TypedDict):
+        shape_name: str
+        origin: Point
+        color: NotRequired[str]
+
+    output_file = tmp_path / "test.ts"
+    TypeGenerationPipelineBuilder().for_types(
+        [Shape]
+    ).convert_field_names_to_camel_case().to_file(output_file).build().run()
+
+    with open(output_file, "r") as f:
+        content = f.read()
+
+    assert (
+        content
+        == """export interface Shape {
+    shapeName: string
+    origin: Point
+    color?: string
+}
+export type Point = [x: number, y: number, label: (string | undefined)];
+"""
+    )
+
+
+T = TypeVar("T")
+
+
+@dataclass
+class Page(Generic[T]):
+    items: List[T]
+    next_page: Optional["Page[T]"]
+
+
+@dataclass
+class Item:
+    value: int
+
+
+@dataclass
+class Catalog:
+    items: Page[Item]
+    names: Page[str]
+
+
+def test_build_pipeline_with_generic_dataclasses(tmp_path):
+    output_file = tmp_path / "test.ts"
+    TypeGenerationPipelineBuilder().for_types([Catalog]).to_file(
+        output_file
+    ).build().run()
+
+    with open(output_file, "r") as f:
+        content = f.read()
+
+    assert (
+        content
+        == """export interface Catalog {
+    items: Page<Item>
+    names: Page<string>
+}
+export interface Item {
+    value: number
+}
+export interface Page<T> {
+    items: T[]
+    next_page?: Page<T>
+}
+"""
+    )
+
+
+@dataclass
+class ItemPage(Page[Item]):
+    pass
+
+
+def test_build_pipeline_with_subclass_of_parameterized_generic(tmp_path):
+    output_file = tmp_path / "test.ts"
+    TypeGenerationPipelineBuilder().for_types([ItemPage]).to_file(
+        output_file
+    ).build().run()
+
+    with open(output_file, "r") as f:
+        content = f.read()
+
+    assert (
+        content
+        == """export interface ItemPage {
+    items: Item[]
+    next_page?: Page<Item>
+}
+export interface Item {
+    value: number
+}
+export interface Page<T> {
+    items: T[]
+    next_page?: Page<T>
+}
+"""
+    )
@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from typing import List, Optional, Generic, TypeVar
+
+import attr
+import attrs
+
+
+@attrs.define
+class AttrsBase:
+    values: List[AttrsChild]
+
+
+@attrs.define
+class AttrsChild(AttrsBase):
+    parent: Optional[AttrsBase] = None
+
+
+T = TypeVar("T")
+
+
+@attrs.define
+class AttrsPage(Generic[T]):
+    items: List[T]
+
+
+@attrs.define
+class AttrsIntPage(AttrsPage[int]):
+    total: int
+
+
+@attr.s(auto_attribs=True)
+class AttrsTaggedUnionRoot:
+    __json_type_info_attribute__ = "type"
+    value: int
+
+
+@attr.s(auto_attribs=True)
+class AttrsTaggedUnionChild(AttrsTaggedUnionRoot):
+    type = "CHILD"
+    child_value: str
+
+
+@attr.s
+class AttrsClassWithUntypedAttribute:
+    value = attr.ib()
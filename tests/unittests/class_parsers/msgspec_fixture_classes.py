@@ -0,0 +1,25 @@
+from typing import List, Optional
+
+import msgspec
+
+
+class SimpleStruct(msgspec.Struct):
+    value: int
+    values: List[str]
+
+
+class RenamedStruct(msgspec.Struct, rename="camel"):  # type: ignore
+    some_value: int
+    other: Optional["SimpleStruct"] = None
+
+
+class TaggedBase(msgspec.Struct, tag_field="kind"):  # type: ignore
+    base_value: int
+
+
+class TaggedChild(TaggedBase, tag="child"):  # type: ignore
+    child_value: str
+
+
+class IntTaggedStruct(msgspec.Struct, tag=1):  # type: ignore
+    value: int
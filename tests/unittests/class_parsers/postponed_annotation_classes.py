@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Optional
+
+from typing_extensions import TypedDict, NotRequired, Required
+
+
+@dataclass
+class FirstPostponedClassInCycle:
+    second: Optional[SecondPostponedClassInCycle]
+
+
+@dataclass
+class SecondPostponedClassInCycle:
+    first: FirstPostponedClassInCycle
+    values: List[int]
+
+
+@dataclass
+class PostponedAuthor:
+    name: str
+
+
+@dataclass
+class PostponedBook:
+    # PostponedAuthor is only known in this module
+    author: PostponedAuthor
+
+
+@dataclass
+class PostponedClassWithUnknownName:
+    value: UnknownName  # type: ignore # noqa: F821
+
+
+class PostponedMovie(TypedDict):
+    title: str
+    year: NotRequired[int]
+
+
+class PostponedPartialMovie(TypedDict, total=False):
+    title: Required[str]
+    year: int
@@ -0,0 +1,49 @@
+from typing import Optional, Literal, Union, List
+
+from pydantic import BaseModel, ConfigDict, Field
+from pydantic.alias_generators import to_camel
+
+
+class Address(BaseModel):
+    street_name: str
+
+
+class Customer(BaseModel):
+    model_config = ConfigDict(alias_generator=to_camel)
+
+    customer_id: int
+    address: Address
+    previous: Optional["Customer"] = None
+    legacy_id: int = Field(serialization_alias="LEGACY_ID")
+    internal_note: str = Field(exclude=True, default="")
+
+
+class IncompleteModel(BaseModel):
+    values: List["DefinedLater"]
+
+
+class DefinedLater(BaseModel):
+    value: int
+
+
+class Cat(BaseModel):
+    kind: Literal["cat"]
+    lives: int
+
+
+class Dog(BaseModel):
+    kind: Literal["dog"] = "dog"
+    good: bool
+
+
+class Owner(BaseModel):
+    pet: Union[Cat, Dog] = Field(discriminator="kind")
+
+
+class Account(BaseModel):
+    status: Literal["active"]
+
+
+class Contact(BaseModel):
+    email: str | None = None
+    address: Address | None = None
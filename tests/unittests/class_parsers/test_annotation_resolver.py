@@ -0,0 +1,67 @@
+from typing import List, Optional, Dict
+
+import pytest
+
+from py_typescript_generator.model_parser.class_parsers.annotation_resolver import (
+    AnnotationResolver,
+    UnresolvableAnnotationException,
+)
+from tests.unittests.class_parsers.postponed_annotation_classes import (
+    FirstPostponedClassInCycle,
+    SecondPostponedClassInCycle,
+    PostponedClassWithUnknownName,
+)
+
+
+class ClassWithNestedClass:
+    class NestedClass:
+        pass
+
+
+def test_should_keep_class_annotation():
+    assert AnnotationResolver().resolve(FirstPostponedClassInCycle, int) == int
+
+
+def test_should_resolve_string_annotations_in_module_namespace():
+    resolver = AnnotationResolver()
+
+    assert resolver.resolve_all(
+        FirstPostponedClassInCycle,
+        ["Optional[SecondPostponedClassInCycle]", "List[int]"],
+    ) == [Optional[SecondPostponedClassInCycle], List[int]]
+
+
+def test_should_resolve_nested_forward_references():
+    resolver = AnnotationResolver()
+
+    assert (
+        resolver.resolve(
+            FirstPostponedClassInCycle, Dict[str, "SecondPostponedClassInCycle"]
+        )
+        == Dict[str, SecondPostponedClassInCycle]
+    )
+
+
+def test_should_memoize_resolved_annotations_per_module():
+    resolver = AnnotationResolver()
+
+    first = resolver.resolve(FirstPostponedClassInCycle, "List[int]")
+    second = resolver.resolve(SecondPostponedClassInCycle, "List[int]")
+
+    assert first is second
+
+
+def test_should_resolve_names_from_class_namespace():
+    resolver = AnnotationResolver()
+
+    assert (
+        resolver.resolve(ClassWithNestedClass, "NestedClass")
+        == ClassWithNestedClass.NestedClass
+    )
+
+
+def test_should_raise_exception_for_unknown_name():
+    resolver = AnnotationResolver()
+
+    with pytest.raises(UnresolvableAnnotationException):
+        resolver.resolve(PostponedClassWithUnknownName, "UnknownName")
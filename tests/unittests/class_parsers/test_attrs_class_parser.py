@@ -0,0 +1,140 @@
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+
+from py_typescript_generator.model.py_class import (
+    PyClass,
+    TaggedUnionInformation,
+    RootTaggedUnionInformation,
+)
+from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.model_parser.class_parsers.attrs_class_parser import (
+    AttrsClassParser,
+    NotAnAttrsClassException,
+    UntypedAttrsAttributeException,
+)
+from py_typescript_generator.model_parser.model_parser import (
+    ModelParser,
+    ModelParserSettings,
+)
+
+pytest.importorskip("attrs")
+
+from tests.unittests.class_parsers.attrs_fixture_classes import (  # noqa: E402
+    AttrsBase,
+    AttrsChild,
+    AttrsTaggedUnionRoot,
+    AttrsTaggedUnionChild,
+    AttrsClassWithUntypedAttribute,
+    AttrsIntPage,
+)
+
+
+def test_should_accept_attrs_class():
+    assert AttrsClassParser().accepts_class(AttrsBase)
+
+
+def test_should_not_accept_non_attrs_class():
+    @dataclass
+    class MyDataclass:
+        value: int
+
+    assert not AttrsClassParser().accepts_class(MyDataclass)
+
+
+def test_should_raise_exception_for_non_attrs_class():
+    class NotAnAttrsClass:
+        pass
+
+    with pytest.raises(NotAnAttrsClassException):
+        AttrsClassParser().parse(NotAnAttrsClass)
+
+
+def test_should_resolve_postponed_annotations():
+    assert AttrsClassParser().parse(AttrsBase) == PyClass(
+        name="AttrsBase",
+        type=AttrsBase,
+        fields=(PyField(name="values", type=List[AttrsChild]),),
+    )
+
+
+def test_should_parse_inherited_attributes():
+    assert AttrsClassParser().parse(AttrsChild) == PyClass(
+        name="AttrsChild",
+        type=AttrsChild,
+        fields=(
+            PyField(name="values", type=List[AttrsChild]),
+            PyField(name="parent", type=Optional[AttrsBase]),
+        ),
+    )
+
+
+def test_should_bind_type_arguments_of_parameterized_base_class():
+    py_class = AttrsClassParser().parse(AttrsIntPage)
+
+    assert py_class.fields == (
+        PyField(name="items", type=List[int]),
+        PyField(name="total", type=int),
+    )
+    assert py_class.type_parameters == ()
+
+
+def test_should_not_modify_attribute_types():
+    AttrsClassParser().parse(AttrsBase)
+
+    assert AttrsBase.__attrs_attrs__[0].type == "List[AttrsChild]"
+
+
+def test_should_raise_exception_for_untyped_attribute():
+    with pytest.raises(UntypedAttrsAttributeException):
+        AttrsClassParser().parse(AttrsClassWithUntypedAttribute)
+
+
+def test_should_parse_tagged_union():
+    model = ModelParser(
+        [AttrsTaggedUnionRoot], [AttrsClassParser()], ModelParserSettings()
+    ).parse()
+
+    assert list(model.classes) == [
+        PyClass(
+            name="AttrsTaggedUnionChild",
+            type=AttrsTaggedUnionChild,
+            fields=(
+                PyField(name="value", type=int),
+                PyField(name="child_value", type=str),
+            ),
+            tagged_union_information=TaggedUnionInformation(
+                discriminant_attribute="type", discriminant_literal="CHILD"
+            ),
+        ),
+        PyClass(
+            name="AttrsTaggedUnionRoot",
+            type=AttrsTaggedUnionRoot,
+            fields=(PyField(name="value", type=int),),
+            tagged_union_information=RootTaggedUnionInformation(
+                discriminant_attribute="type",
+                discriminant_literal="",
+                discriminant_literals=frozenset({"CHILD"}),
+                child_types=frozenset({AttrsTaggedUnionChild}),
+            ),
+        ),
+    ]
+
+
+def test_should_not_import_attrs():
+    code = (
+        "import sys\n"
+        "from dataclasses import dataclass\n"
+        "from py_typescript_generator.model_parser.class_parsers."
+        "attrs_class_parser import AttrsClassParser\n"
+        "@dataclass\n"
+        "class MyDataclass:\n"
+        "    value: int\n"
+        "assert not AttrsClassParser().accepts_class(MyDataclass)\n"
+        "assert 'attr' not in sys.modules and 'attrs' not in sys.modules\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -1,14 +1,25 @@
 from dataclasses import dataclass
-from typing import List, Dict
+from typing import List, Dict, Generic, TypeVar
 
 import pytest
 
+from py_typescript_generator.model.model_object_table import ModelObjectTable
 from py_typescript_generator.model.py_class import PyClass
 from py_typescript_generator.model.py_field import PyField
 from py_typescript_generator.model_parser.class_parsers.dataclass_parser import (
     DataclassParser,
     NotADataclassException,
 )
+from py_typescript_generator.model_parser.class_parsers.annotation_resolver import (
+    UnresolvableAnnotationException,
+)
+from tests.unittests.class_parsers import postponed_annotation_classes
+from tests.unittests.class_parsers.postponed_annotation_classes import (
+    FirstPostponedClassInCycle,
+    SecondPostponedClassInCycle,
+    PostponedClassWithUnknownName,
+    PostponedBook,
+)
 
 
 class TestAccept:
@@ -122,3 +133,122 @@ def test_parse_dataclass_with_nested_generics():
             PyField(name="the_dict", type=Dict[str, List[Dict[str, CustomClass]]]),
         ),
     )
+
+
+class TestTryParse:
+    def test_should_parse_dataclass(self):
+        @dataclass
+        class MyDataClass:
+            value: int
+
+        py_class = DataclassParser().try_parse(MyDataClass)
+
+        assert py_class == PyClass(
+            name="MyDataClass",
+            type=MyDataClass,
+            fields=(PyField(name="value", type=int),),
+        )
+
+    def test_should_return_none_for_non_dataclass(self):
+        class NotADataclass:
+            pass
+
+        assert DataclassParser().try_parse(NotADataclass) is None
+
+
+class TestPostponedAnnotations:
+    def test_should_resolve_postponed_annotations(self):
+        py_class = DataclassParser().parse(SecondPostponedClassInCycle)
+
+        assert py_class == PyClass(
+            name="SecondPostponedClassInCycle",
+            type=SecondPostponedClassInCycle,
+            fields=(
+                PyField(name="first", type=FirstPostponedClassInCycle),
+                PyField(name="values", type=List[int]),
+            ),
+        )
+
+    def test_should_resolve_inherited_annotations_in_module_of_base_class(self):
+        @dataclass
+        class Novel(PostponedBook):
+            pages: int
+
+        py_class = DataclassParser().parse(Novel)
+
+        assert py_class.fields == (
+            PyField(name="author", type=postponed_annotation_classes.PostponedAuthor),
+            PyField(name="pages", type=int),
+        )
+
+    def test_should_raise_exception_for_unresolvable_annotation(self):
+        with pytest.raises(UnresolvableAnnotationException):
+            DataclassParser().parse(PostponedClassWithUnknownName)
+
+
+class TestSharedFields:
+    def test_should_share_equal_fields_of_different_classes(self):
+        @dataclass
+        class FirstClass:
+            values: List[int]
+
+        @dataclass
+        class SecondClass:
+            values: List[int]
+
+        model_object_table = ModelObjectTable()
+        dataclass_parser = DataclassParser(model_object_table=model_object_table)
+
+        first_class = dataclass_parser.parse(FirstClass)
+        second_class = dataclass_parser.parse(SecondClass)
+
+        assert first_class.fields[0] is second_class.fields[0]
+        assert model_object_table.field_dedup_ratio == 0.5
+
+    def test_should_not_share_fields_after_invalidation(self):
+        @dataclass
+        class MyDataClass:
+            value: int
+
+        dataclass_parser = DataclassParser()
+        py_class = dataclass_parser.parse(MyDataClass)
+
+        dataclass_parser.invalidate([MyDataClass])
+
+        assert dataclass_parser.parse(MyDataClass).fields[0] is not py_class.fields[0]
+
+
+class TestGenericDataclass:
+    def test_should_parse_type_parameters(self):
+        T = TypeVar("T")
+
+        @dataclass
+        class Page(Generic[T]):
+            items: List[T]
+
+        assert DataclassParser().parse(Page) == PyClass(
+            name="Page",
+            type=Page,
+            fields=(PyField(name="items", type=List[T]),),  # type: ignore
+            type_parameters=("T",),
+        )
+
+    def test_should_bind_type_arguments_of_parameterized_base_class(self):
+        T = TypeVar("T")
+
+        @dataclass
+        class Page(Generic[T]):
+            items: List[T]
+
+        @dataclass
+        class IntPage(Page[int]):
+            total: int
+
+        assert DataclassParser().parse(IntPage) == PyClass(
+            name="IntPage",
+            type=IntPage,
+            fields=(
+                PyField(name="items", type=List[int]),
+                PyField(name="total", type=int),
+            ),
+        )
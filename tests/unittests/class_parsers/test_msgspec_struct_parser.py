@@ -0,0 +1,125 @@
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+
+from py_typescript_generator.model.py_class import PyClass, TaggedUnionInformation
+from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.model_parser.class_parsers.msgspec_struct_parser import (
+    MsgspecStructParser,
+    NotAMsgspecStructException,
+)
+from py_typescript_generator.model_parser.model_parser import (
+    ModelParser,
+    ModelParserSettings,
+)
+
+pytest.importorskip("msgspec")
+
+from tests.unittests.class_parsers.msgspec_fixture_classes import (  # noqa: E402
+    SimpleStruct,
+    RenamedStruct,
+    TaggedChild,
+    IntTaggedStruct,
+)
+
+
+def test_should_accept_struct():
+    assert MsgspecStructParser().accepts_class(SimpleStruct)
+
+
+def test_should_not_accept_non_struct():
+    @dataclass
+    class MyDataclass:
+        value: int
+
+    assert not MsgspecStructParser().accepts_class(MyDataclass)
+    assert not MsgspecStructParser().accepts_class(List[int])
+
+
+def test_should_raise_exception_for_non_struct():
+    class NotAStruct:
+        pass
+
+    with pytest.raises(NotAMsgspecStructException):
+        MsgspecStructParser().parse(NotAStruct)
+
+
+def test_should_parse_struct():
+    assert MsgspecStructParser().parse(SimpleStruct) == PyClass(
+        name="SimpleStruct",
+        type=SimpleStruct,
+        fields=(
+            PyField(name="value", type=int),
+            PyField(name="values", type=List[str]),
+        ),
+    )
+
+
+def test_should_use_encoded_names_as_aliases():
+    assert MsgspecStructParser().parse(RenamedStruct) == PyClass(
+        name="RenamedStruct",
+        type=RenamedStruct,
+        fields=(
+            PyField(name="some_value", type=int, alias="someValue"),
+            PyField(name="other", type=Optional[SimpleStruct]),
+        ),
+    )
+
+
+def test_should_parse_tag_as_tagged_union_information():
+    assert MsgspecStructParser().parse(TaggedChild) == PyClass(
+        name="TaggedChild",
+        type=TaggedChild,
+        fields=(
+            PyField(name="base_value", type=int),
+            PyField(name="child_value", type=str),
+        ),
+        tagged_union_information=TaggedUnionInformation(
+            discriminant_attribute="kind",
+            discriminant_literal="child",
+            discriminant_attribute_is_alias=True,
+        ),
+    )
+
+
+def test_should_ignore_int_tags():
+    py_class = MsgspecStructParser().parse(IntTaggedStruct)
+
+    assert py_class.tagged_union_information is None
+
+
+def test_should_keep_tag_when_updating_model() -> None:
+    model_parser = ModelParser(
+        [TaggedChild, SimpleStruct], [MsgspecStructParser()], ModelParserSettings()
+    )
+    previous_model = model_parser.parse()
+
+    model = model_parser.update(previous_model, [SimpleStruct])
+
+    assert model == previous_model
+    assert model.classes[0].tagged_union_information == (
+        TaggedUnionInformation(
+            discriminant_attribute="kind",
+            discriminant_literal="child",
+            discriminant_attribute_is_alias=True,
+        )
+    )
+
+
+def test_should_not_import_msgspec():
+    code = (
+        "import sys\n"
+        "from dataclasses import dataclass\n"
+        "from py_typescript_generator.model_parser.class_parsers."
+        "msgspec_struct_parser import MsgspecStructParser\n"
+        "@dataclass\n"
+        "class MyDataclass:\n"
+        "    value: int\n"
+        "assert not MsgspecStructParser().accepts_class(MyDataclass)\n"
+        "assert 'msgspec' not in sys.modules\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,63 @@
+import collections
+from typing import List, NamedTuple, Optional, Tuple
+
+import pytest
+
+from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.model_parser.class_parsers.named_tuple_parser import (
+    NamedTupleParser,
+    NotANamedTupleException,
+    UntypedNamedTupleFieldException,
+)
+
+
+class Point(NamedTuple):
+    x: int
+    y: int
+    label: Optional[str] = None
+
+
+class Line(NamedTuple):
+    points: List["Point"]
+
+
+def test_should_accept_named_tuple():
+    assert NamedTupleParser().accepts_class(Point)
+
+
+def test_should_not_accept_plain_tuple():
+    assert not NamedTupleParser().accepts_class(tuple)
+    assert not NamedTupleParser().accepts_class(Tuple[int, int])
+
+
+def test_should_raise_exception_for_non_named_tuple():
+    with pytest.raises(NotANamedTupleException):
+        NamedTupleParser().parse(tuple)
+
+
+def test_should_parse_fields_in_order():
+    assert NamedTupleParser().parse(Point) == PyClass(
+        name="Point",
+        type=Point,
+        fields=(
+            PyField(name="x", type=int),
+            PyField(name="y", type=int),
+            PyField(name="label", type=Optional[str]),
+        ),
+    )
+
+
+def test_should_resolve_forward_references():
+    assert NamedTupleParser().parse(Line) == PyClass(
+        name="Line",
+        type=Line,
+        fields=(PyField(name="points", type=List[Point]),),
+    )
+
+
+def test_should_raise_exception_for_untyped_named_tuple():
+    UntypedPoint = collections.namedtuple("UntypedPoint", ["x", "y"])
+
+    with pytest.raises(UntypedNamedTupleFieldException):
+        NamedTupleParser().parse(UntypedPoint)
@@ -0,0 +1,170 @@
+import subprocess
+import sys
+from dataclasses import dataclass
+from typing import Optional, List, Union, Literal
+
+import pytest
+
+from py_typescript_generator.model.py_class import PyClass, TaggedUnionInformation
+from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.model_parser.class_parsers.pydantic_model_parser import (
+    PydanticModelParser,
+    NotAPydanticModelException,
+)
+from py_typescript_generator.model_parser.model_parser import (
+    ModelParser,
+    ModelParserSettings,
+)
+from py_typescript_generator.typescript_model_compiler.ts_field import TsField
+from py_typescript_generator.typescript_model_compiler.ts_object_type import (
+    TsObjectType,
+)
+from py_typescript_generator.typescript_model_compiler.ts_type import TsType
+from py_typescript_generator.typescript_model_compiler.ts_union_reference import (
+    TsUnionReference,
+)
+from py_typescript_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+)
+
+pytest.importorskip("pydantic", minversion="2")
+
+from tests.unittests.class_parsers.pydantic_fixture_classes import (  # noqa: E402
+    Address,
+    Customer,
+    IncompleteModel,
+    DefinedLater,
+    Cat,
+    Dog,
+    Owner,
+    Account,
+    Contact,
+)
+
+
+def test_should_accept_pydantic_model():
+    assert PydanticModelParser().accepts_class(Customer)
+
+
+def test_should_not_accept_non_pydantic_class():
+    @dataclass
+    class MyDataclass:
+        value: int
+
+    assert not PydanticModelParser().accepts_class(MyDataclass)
+    assert not PydanticModelParser().accepts_class(List[int])
+
+
+def test_should_raise_exception_for_non_pydantic_class():
+    class NotAModel:
+        pass
+
+    with pytest.raises(NotAPydanticModelException):
+        PydanticModelParser().parse(NotAModel)
+
+
+def test_should_parse_model_with_aliases():
+    assert PydanticModelParser().parse(Customer) == PyClass(
+        name="Customer",
+        type=Customer,
+        fields=(
+            PyField(name="customer_id", type=int, alias="customerId"),
+            PyField(name="address", type=Address),
+            PyField(name="previous", type=Optional[Customer]),
+            PyField(name="legacy_id", type=int, alias="LEGACY_ID"),
+        ),
+    )
+
+
+def test_should_resolve_forward_references_of_incomplete_models():
+    assert PydanticModelParser().parse(IncompleteModel) == PyClass(
+        name="IncompleteModel",
+        type=IncompleteModel,
+        fields=(PyField(name="values", type=List[DefinedLater]),),
+    )
+    assert not IncompleteModel.__pydantic_complete__
+
+
+def test_should_parse_discriminator_of_union_members():
+    assert PydanticModelParser().parse(Cat) == PyClass(
+        name="Cat",
+        type=Cat,
+        fields=(PyField(name="lives", type=int),),
+        tagged_union_information=TaggedUnionInformation(
+            discriminant_attribute="kind",
+            discriminant_literal="cat",
+            discriminant_attribute_is_alias=True,
+        ),
+    )
+    assert PydanticModelParser().parse(Dog).tagged_union_information == (
+        TaggedUnionInformation(
+            discriminant_attribute="kind",
+            discriminant_literal="dog",
+            discriminant_attribute_is_alias=True,
+        )
+    )
+
+
+def test_should_parse_discriminated_union_field():
+    assert PydanticModelParser().parse(Owner) == PyClass(
+        name="Owner",
+        type=Owner,
+        fields=(PyField(name="pet", type=Union[Cat, Dog]),),
+    )
+
+
+def test_should_keep_literal_fields_of_models_outside_discriminated_unions() -> None:
+    assert PydanticModelParser().parse(Account) == PyClass(
+        name="Account",
+        type=Account,
+        fields=(PyField(name="status", type=Literal["active"]),),  # type: ignore
+    )
+
+
+def test_should_compile_discriminated_union_field() -> None:
+    model = ModelParser([Owner], [PydanticModelParser()], ModelParserSettings()).parse()
+
+    ts_model = TypescriptModelCompiler(TypescriptModelCompilerSettings()).compile(model)
+
+    assert ts_model.types[0] == TsObjectType(
+        name="Owner",
+        fields=(
+            TsField(
+                name="pet",
+                type=TsUnionReference(members=(TsType("Cat"), TsType("Dog"))),
+            ),
+        ),
+    )
+
+
+def test_should_compile_union_type_fields() -> None:
+    model = ModelParser(
+        [Contact], [PydanticModelParser()], ModelParserSettings()
+    ).parse()
+
+    ts_model = TypescriptModelCompiler(TypescriptModelCompilerSettings()).compile(model)
+
+    assert ts_model.types[0] == TsObjectType(
+        name="Contact",
+        fields=(
+            TsField(name="email", type=TsType("string", is_optional=True)),
+            TsField(name="address", type=TsType("Address", is_optional=True)),
+        ),
+    )
+
+
+def test_should_not_import_pydantic():
+    code = (
+        "import sys\n"
+        "from dataclasses import dataclass\n"
+        "from py_typescript_generator.model_parser.class_parsers."
+        "pydantic_model_parser import PydanticModelParser\n"
+        "@dataclass\n"
+        "class MyDataclass:\n"
+        "    value: int\n"
+        "assert not PydanticModelParser().accepts_class(MyDataclass)\n"
+        "assert 'pydantic' not in sys.modules\n"
+    )
+
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,109 @@
+import textwrap
+from pathlib import Path
+from typing import List, Optional
+
+import pytest
+
+from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.model_parser.class_parsers.static_class_parser import (
+    StaticClassParser,
+    NotAStaticDataclassException,
+)
+from py_typescript_generator.static_analysis.static_module_loader import (
+    StaticModuleLoader,
+)
+
+MODELS_SOURCE = """
+    from dataclasses import dataclass
+    from typing import List, Optional
+
+    @dataclass
+    class Base:
+        value: int
+        name: str
+
+    @dataclass
+    class Child(Base):
+        value: Optional[int]
+        children: List["Child"]
+
+    class NotADataclass:
+        value: int
+"""
+
+GENERIC_MODELS_SOURCE = """
+    from dataclasses import dataclass
+    from typing import Generic, List, TypeVar
+
+    T = TypeVar("T")
+
+    @dataclass
+    class Page(Generic[T]):
+        items: List[T]
+"""
+
+
+@pytest.fixture
+def loader(tmp_path: Path) -> StaticModuleLoader:
+    (tmp_path / "static_parser_fixture.py").write_text(textwrap.dedent(MODELS_SOURCE))
+    return StaticModuleLoader(["static_parser_fixture"], search_path=[str(tmp_path)])
+
+
+def test_should_accept_static_dataclass(loader):
+    base, child, not_a_dataclass = loader.load_classes("static_parser_fixture")
+    parser = StaticClassParser(loader)
+
+    assert parser.accepts_class(base)
+    assert not parser.accepts_class(not_a_dataclass)
+    assert not parser.accepts_class(int)
+
+
+def test_should_parse_fields_of_static_dataclass(loader):
+    base, _, _ = loader.load_classes("static_parser_fixture")
+
+    py_class = StaticClassParser(loader).parse(base)
+
+    assert py_class == PyClass(
+        name="Base",
+        type=base,
+        fields=(PyField(name="value", type=int), PyField(name="name", type=str)),
+    )
+
+
+def test_should_parse_inherited_fields_in_dataclass_order(loader):
+    _, child, _ = loader.load_classes("static_parser_fixture")
+
+    py_class = StaticClassParser(loader).parse(child)
+
+    assert py_class == PyClass(
+        name="Child",
+        type=child,
+        fields=(
+            PyField(name="value", type=Optional[int]),
+            PyField(name="name", type=str),
+            PyField(name="children", type=List[child]),  # type: ignore
+        ),
+    )
+
+
+def test_should_raise_exception_for_class_without_static_dataclass(loader):
+    _, _, not_a_dataclass = loader.load_classes("static_parser_fixture")
+
+    with pytest.raises(NotAStaticDataclassException):
+        StaticClassParser(loader).parse(not_a_dataclass)
+
+
+def test_should_parse_type_parameters_of_generic_static_dataclass(
+    tmp_path: Path,
+) -> None:
+    (tmp_path / "static_generic_fixture.py").write_text(
+        textwrap.dedent(GENERIC_MODELS_SOURCE)
+    )
+    loader = StaticModuleLoader(["static_generic_fixture"], search_path=[str(tmp_path)])
+    (page,) = loader.load_classes("static_generic_fixture")
+
+    py_class = StaticClassParser(loader).parse(page)
+
+    assert py_class.type_parameters == ("T",)
+    assert py_class.fields == (PyField(name="items", type=List[page.__parameters__[0]]),)  # type: ignore
@@ -0,0 +1,96 @@
+from dataclasses import dataclass
+from typing import List, Optional
+
+import pytest
+from typing_extensions import TypedDict, Required, NotRequired
+
+from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.model_parser.class_parsers.typed_dict_parser import (
+    TypedDictParser,
+    NotATypedDictException,
+)
+from tests.unittests.class_parsers.postponed_annotation_classes import (
+    PostponedMovie,
+    PostponedPartialMovie,
+)
+
+
+class Movie(TypedDict):
+    title: str
+    year: NotRequired[int]
+
+
+class PartialMovie(TypedDict, total=False):
+    title: Required[str]
+    year: int
+
+
+class MovieWithSequel(Movie):
+    sequel: Optional["Movie"]
+    tags: List[str]
+
+
+def test_should_accept_typed_dict():
+    assert TypedDictParser().accepts_class(Movie)
+
+
+def test_should_not_accept_non_typed_dict():
+    @dataclass
+    class MyDataclass:
+        value: int
+
+    assert not TypedDictParser().accepts_class(MyDataclass)
+    assert not TypedDictParser().accepts_class(dict)
+    assert not TypedDictParser().accepts_class(List[int])
+
+
+def test_should_raise_exception_for_non_typed_dict():
+    with pytest.raises(NotATypedDictException):
+        TypedDictParser().parse(dict)
+
+
+def test_should_map_not_required_keys_to_optional():
+    assert TypedDictParser().parse(Movie) == PyClass(
+        name="Movie",
+        type=Movie,
+        fields=(
+            PyField(name="title", type=str),
+            PyField(name="year", type=Optional[int]),
+        ),
+    )
+
+
+def test_should_map_keys_of_non_total_typed_dict_to_optional():
+    assert TypedDictParser().parse(PartialMovie) == PyClass(
+        name="PartialMovie",
+        type=PartialMovie,
+        fields=(
+            PyField(name="title", type=str),
+            PyField(name="year", type=Optional[int]),
+        ),
+    )
+
+
+def test_should_map_qualified_keys_of_postponed_annotations() -> None:
+    assert TypedDictParser().parse(PostponedMovie).fields == (
+        PyField(name="title", type=str),
+        PyField(name="year", type=Optional[int]),  # type: ignore
+    )
+    assert TypedDictParser().parse(PostponedPartialMovie).fields == (
+        PyField(name="title", type=str),
+        PyField(name="year", type=Optional[int]),  # type: ignore
+    )
+
+
+def test_should_parse_inherited_keys_and_forward_references():
+    assert TypedDictParser().parse(MovieWithSequel) == PyClass(
+        name="MovieWithSequel",
+        type=MovieWithSequel,
+        fields=(
+            PyField(name="title", type=str),
+            PyField(name="year", type=Optional[int]),
+            PyField(name="sequel", type=Optional[Movie]),
+            PyField(name="tags", type=List[str]),
+        ),
+    )
@@ -7,6 +7,7 @@ from py_typescript_generator.generation_pipeline.typescript_generation_pipeline_
 from py_typescript_generator.typescript_model_compiler.typescript_model_compiler import (
     CaseFormat,
 )
+from py_typescript_generator.typing_utils.type_filter import module_prefix, has_marker
 
 
 def test_build_fails_because_missing_output_file():
@@ -37,3 +38,53 @@ def test_provided_options_builds_correctly():
     assert pipeline.type_overrides == {int: str}
     assert pipeline.case_format == CaseFormat.CAMEL_CASE
     assert pipeline.output_file == "test.ts"
+
+
+def test_for_packages_builds_correctly():
+    pipeline = (
+        TypeGenerationPipelineBuilder()
+        .for_packages(["my_package"])
+        .to_file("test.ts")
+        .build()
+    )
+
+    assert pipeline.packages == ["my_package"]
+    assert pipeline.static_module_loader is None
+
+
+def test_for_packages_without_import_builds_correctly():
+    pipeline = (
+        TypeGenerationPipelineBuilder()
+        .for_packages(["my_package"], without_import=True)
+        .to_file("test.ts")
+        .build()
+    )
+
+    assert pipeline.packages == ["my_package"]
+    assert pipeline.static_module_loader is not None
+
+
+def test_with_parse_cache_builds_correctly():
+    pipeline = (
+        TypeGenerationPipelineBuilder()
+        .with_parse_cache(".parse_cache")
+        .to_file("test.ts")
+        .build()
+    )
+
+    assert pipeline.parse_cache_dir == ".parse_cache"
+
+
+def test_with_type_filter_builds_correctly():
+    pipeline = (
+        TypeGenerationPipelineBuilder()
+        .include_types([module_prefix("my_package")])
+        .exclude_types([has_marker("__internal__")])
+        .to_file("test.ts")
+        .build()
+    )
+
+    assert pipeline.type_filter.is_excluded(int)
+    assert not pipeline.type_filter.is_excluded(
+        type("MyClass", (), {"__module__": "my_package"})
+    )
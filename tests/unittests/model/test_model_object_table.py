@@ -0,0 +1,71 @@
+from typing import List, Dict, Union
+
+from py_typescript_generator.model.model_object_table import ModelObjectTable
+from py_typescript_generator.model.py_field import PyField
+
+
+def test_should_share_equal_fields():
+    table = ModelObjectTable()
+
+    first_field = table.get_field("value", int)
+    second_field = table.get_field("value", int)
+
+    assert first_field == PyField(name="value", type=int)
+    assert first_field is second_field
+    assert table.field_dedup_ratio == 0.5
+
+
+def test_should_not_share_fields_with_different_names_or_types():
+    table = ModelObjectTable()
+
+    field = table.get_field("value", int)
+
+    assert table.get_field("other_value", int) is not field
+    assert table.get_field("value", str) is not field
+
+
+def test_should_share_equal_generic_types():
+    table = ModelObjectTable()
+
+    first_type = table.get_type(List[Dict[str, int]])
+    second_type = table.get_type(List[Dict[str, int]])
+
+    assert first_type is second_type
+    assert table.get_field("value", List[Dict[str, int]]).type is first_type
+    assert table.type_dedup_ratio == 2 / 3
+
+
+def test_should_not_share_unions_with_different_member_order():
+    table = ModelObjectTable()
+
+    first_type = table.get_type(Union[int, str])
+    second_type = table.get_type(Union[str, int])
+
+    assert first_type.__args__ == (int, str)
+    assert second_type.__args__ == (str, int)
+
+
+def test_should_not_share_fields_of_unions_with_different_member_order():
+    table = ModelObjectTable()
+
+    first_field = table.get_field("value", Union[int, str])
+    second_field = table.get_field("value", Union[str, int])
+
+    assert first_field.type.__args__ == (int, str)
+    assert second_field.type.__args__ == (str, int)
+
+
+def test_should_return_classes_unchanged():
+    table = ModelObjectTable()
+
+    assert table.get_type(int) is int
+    assert table.type_dedup_ratio == 0.0
+
+
+def test_should_clear_shared_objects():
+    table = ModelObjectTable()
+    field = table.get_field("value", int)
+
+    table.clear()
+
+    assert table.get_field("value", int) is not field
@@ -0,0 +1,70 @@
+import pickle
+from typing import List
+
+import pytest
+
+from py_typescript_generator.model.py_class import (
+    PyClass,
+    TaggedUnionInformation,
+    RootTaggedUnionInformation,
+)
+from py_typescript_generator.model.py_enum import PyEnum, PyEnumValue
+from py_typescript_generator.model.py_field import PyField
+from tests.unittests.fixture_classes import EmptyClass, SimpleIntEnum
+
+MODEL_OBJECTS = [
+    PyField(name="value", type=List[int]),
+    PyEnumValue(name="FIRST", value=0),
+    PyEnum(
+        name="SimpleIntEnum",
+        type=SimpleIntEnum,
+        values=(PyEnumValue(name="FIRST", value=0),),
+    ),
+    TaggedUnionInformation(discriminant_attribute="type", discriminant_literal="A"),
+    RootTaggedUnionInformation(
+        discriminant_attribute="type",
+        discriminant_literal="A",
+        discriminant_literals=frozenset({"A"}),
+        child_types=frozenset({EmptyClass}),
+    ),
+    PyClass(
+        name="EmptyClass",
+        type=EmptyClass,
+        fields=(PyField(name="value", type=int),),
+        tagged_union_information=TaggedUnionInformation(
+            discriminant_attribute="type", discriminant_literal="A"
+        ),
+    ),
+]
+
+
+@pytest.mark.parametrize("model_object", MODEL_OBJECTS)
+def test_model_objects_should_not_have_instance_dict(model_object):
+    assert not hasattr(model_object, "__dict__")
+
+
+@pytest.mark.parametrize("model_object", MODEL_OBJECTS)
+def test_model_objects_should_survive_pickling(model_object):
+    hash(model_object)
+
+    unpickled = pickle.loads(pickle.dumps(model_object))
+
+    assert unpickled == model_object
+    assert unpickled._hash is None
+    assert hash(unpickled) == hash(model_object)
+
+
+def test_hash_should_be_cached():
+    py_field = PyField(name="value", type=int)
+
+    assert py_field._hash is None
+    assert hash(py_field) == hash(PyField(name="value", type=int))
+    assert py_field._hash == hash(py_field)
+
+
+def test_names_should_be_interned():
+    name = "".join(["my_", "field"])
+
+    py_field = PyField(name=name, type=int)
+
+    assert py_field.name is PyField(name="my_field", type=int).name
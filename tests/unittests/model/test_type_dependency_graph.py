@@ -0,0 +1,82 @@
+from py_typescript_generator.model.type_dependency_graph import (
+    TypeDependencyGraph,
+    DependencyKind,
+)
+from tests.unittests.fixture_classes import (
+    EmptyClass,
+    ClassWithEmptyClass,
+    ClassWithClassWithEmptyClass,
+    ClassWithInt,
+)
+
+
+def create_graph() -> TypeDependencyGraph:
+    graph = TypeDependencyGraph()
+    graph.add_dependency(
+        ClassWithClassWithEmptyClass, ClassWithEmptyClass, DependencyKind.FIELD
+    )
+    graph.add_dependency(ClassWithEmptyClass, EmptyClass, DependencyKind.FIELD)
+    graph.add_dependency(
+        ClassWithEmptyClass, EmptyClass, DependencyKind.GENERIC_ARGUMENT
+    )
+    return graph
+
+
+def test_empty_graph_should_have_no_neighbours():
+    graph = TypeDependencyGraph()
+
+    assert graph.get_dependencies(EmptyClass) == []
+    assert graph.get_dependents(EmptyClass) == []
+    assert EmptyClass not in graph
+    assert len(graph) == 0
+
+
+def test_should_return_dependencies_and_dependents():
+    graph = create_graph()
+
+    assert graph.get_dependencies(ClassWithEmptyClass) == [EmptyClass]
+    assert graph.get_dependents(ClassWithEmptyClass) == [ClassWithClassWithEmptyClass]
+    assert graph.get_dependents(EmptyClass) == [ClassWithEmptyClass]
+    assert ClassWithInt not in graph
+    assert len(graph) == 2
+
+
+def test_should_filter_neighbours_by_kind():
+    graph = create_graph()
+
+    assert (
+        graph.get_dependencies(
+            ClassWithClassWithEmptyClass, DependencyKind.GENERIC_ARGUMENT
+        )
+        == []
+    )
+    assert graph.get_dependents(EmptyClass, DependencyKind.GENERIC_ARGUMENT) == [
+        ClassWithEmptyClass
+    ]
+    assert graph.get_dependency_kinds(ClassWithEmptyClass, EmptyClass) == frozenset(
+        {DependencyKind.FIELD, DependencyKind.GENERIC_ARGUMENT}
+    )
+
+
+def test_should_return_transitive_neighbours():
+    graph = create_graph()
+
+    assert graph.get_transitive_dependencies([ClassWithClassWithEmptyClass]) == {
+        ClassWithEmptyClass,
+        EmptyClass,
+    }
+    assert graph.get_transitive_dependents([EmptyClass]) == {
+        ClassWithEmptyClass,
+        ClassWithClassWithEmptyClass,
+    }
+
+
+def test_transitive_neighbours_should_terminate_for_cycles():
+    graph = TypeDependencyGraph()
+    graph.add_dependency(EmptyClass, ClassWithInt, DependencyKind.FIELD)
+    graph.add_dependency(ClassWithInt, EmptyClass, DependencyKind.FIELD)
+
+    assert graph.get_transitive_dependencies([EmptyClass]) == {
+        EmptyClass,
+        ClassWithInt,
+    }
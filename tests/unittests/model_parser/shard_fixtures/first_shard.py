@@ -0,0 +1,13 @@
+from dataclasses import dataclass
+from typing import List
+
+from tests.unittests.model_parser.shard_fixtures.second_shard import (
+    SharedClass,
+    SharedEnum,
+)
+
+
+@dataclass
+class FirstRootClass:
+    shared: SharedClass
+    values: List[SharedEnum]
@@ -0,0 +1,23 @@
+from dataclasses import dataclass
+from enum import Enum
+
+from tests.unittests.model_parser.shard_fixtures.union_root import TaggedUnionRoot
+
+
+class SharedEnum(Enum):
+    FIRST = "FIRST"
+
+
+@dataclass
+class SharedClass:
+    value: int
+
+
+@dataclass
+class SecondRootClass:
+    shared: SharedClass
+
+
+@dataclass
+class TaggedUnionChild(TaggedUnionRoot):
+    type = "CHILD"
@@ -0,0 +1,6 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class TaggedUnionRoot:
+    __json_type_info_attribute__ = "type"
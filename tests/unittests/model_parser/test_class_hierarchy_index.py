@@ -0,0 +1,145 @@
+import gc
+import weakref
+
+from py_typescript_generator.model_parser.class_hierarchy_index import (
+    ClassHierarchyIndex,
+)
+from tests.unittests.fixture_classes import (
+    EmptyClass,
+    ClassWithTaggedUnionDiscriminantMultipleChildren,
+    ClassWithTaggedUnionDiscriminantMultipleChildrenChild1,
+    ClassWithTaggedUnionDiscriminantMultipleChildrenChild2,
+    ClassWithTaggedUnionDiscriminantNoDiscriminatorForRoot,
+    ClassWithTaggedUnionDiscriminantEnumDiscriminator,
+    ClassWithTaggedUnionDiscriminantEnumDiscriminatorChild,
+)
+
+
+def test_should_find_parent_classes():
+    index = ClassHierarchyIndex()
+
+    assert index.get_parent_classes(
+        ClassWithTaggedUnionDiscriminantMultipleChildrenChild1
+    ) == {ClassWithTaggedUnionDiscriminantMultipleChildren}
+    assert index.get_parent_classes(EmptyClass) == set()
+
+
+def test_should_find_transitive_child_classes_in_order():
+    class Root:
+        pass
+
+    class Child(Root):
+        pass
+
+    class GrandChild(Child):
+        pass
+
+    class SecondChild(Root):
+        pass
+
+    index = ClassHierarchyIndex()
+
+    assert list(index.get_child_classes(Root)) == [Child, GrandChild, SecondChild]
+    assert list(index.get_child_classes(Child)) == [GrandChild]
+
+
+def test_should_detect_tagged_union_roots():
+    index = ClassHierarchyIndex()
+
+    assert index.is_tagged_union_class(ClassWithTaggedUnionDiscriminantMultipleChildren)
+    assert index.is_tagged_union_root(ClassWithTaggedUnionDiscriminantMultipleChildren)
+    assert index.is_tagged_union_class(
+        ClassWithTaggedUnionDiscriminantMultipleChildrenChild2
+    )
+    assert not index.is_tagged_union_root(
+        ClassWithTaggedUnionDiscriminantMultipleChildrenChild2
+    )
+    assert not index.is_tagged_union_class(EmptyClass)
+
+
+def test_should_read_discriminant():
+    index = ClassHierarchyIndex()
+
+    assert (
+        index.get_discriminant_attribute_name(
+            ClassWithTaggedUnionDiscriminantMultipleChildrenChild1
+        )
+        == "type"
+    )
+    assert (
+        index.get_discriminant_literal(
+            ClassWithTaggedUnionDiscriminantMultipleChildrenChild1
+        )
+        == "CHILD_1"
+    )
+    assert (
+        index.get_discriminant_literal(
+            ClassWithTaggedUnionDiscriminantEnumDiscriminatorChild
+        )
+        == "CHILD"
+    )
+    assert (
+        index.get_discriminant_literal(
+            ClassWithTaggedUnionDiscriminantNoDiscriminatorForRoot
+        )
+        == ""
+    )
+    assert index.get_discriminant_attribute_name(EmptyClass) is None
+    assert (
+        index.get_discriminant_literal(
+            ClassWithTaggedUnionDiscriminantEnumDiscriminator
+        )
+        == "BASE"
+    )
+
+
+def test_refresh_should_pick_up_new_subclasses():
+    class Root:
+        pass
+
+    class Child(Root):
+        pass
+
+    index = ClassHierarchyIndex()
+    assert list(index.get_child_classes(Root)) == [Child]
+
+    class GrandChild(Child):
+        pass
+
+    assert list(index.get_child_classes(Root)) == [Child]
+    index.refresh()
+    assert list(index.get_child_classes(Root)) == [Child, GrandChild]
+    assert list(index.get_child_classes(Child)) == [GrandChild]
+
+
+def test_invalidate_should_drop_cached_discriminants():
+    class Root:
+        __json_type_info_attribute__ = "type"
+        type = "ROOT"
+
+    index = ClassHierarchyIndex()
+    assert index.get_discriminant_literal(Root) == "ROOT"
+
+    Root.type = "CHANGED"
+    index.invalidate()
+
+    assert index.get_discriminant_literal(Root) == "CHANGED"
+
+
+def test_should_not_keep_child_classes_alive():
+    class Root:
+        pass
+
+    class Child(Root):
+        pass
+
+    index = ClassHierarchyIndex()
+    assert list(index.get_child_classes(Root)) == [Child]
+    child = weakref.ref(Child)
+
+    del Child
+    gc.collect()
+    index.refresh()
+
+    assert child() is None
+    assert list(index.get_child_classes(Root)) == []
@@ -0,0 +1,72 @@
+from typing import Type, List, Optional
+
+from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model_parser.class_parser_dispatcher import (
+    ClassParserDispatcher,
+)
+from py_typescript_generator.model_parser.class_parsers.abstract_class_parser import (
+    AbstractClassParser,
+)
+
+
+class Base:
+    pass
+
+
+class Child(Base):
+    pass
+
+
+class Other:
+    pass
+
+
+class RecordingParser(AbstractClassParser):
+    def __init__(self, accepted_types: List[Type]):
+        self.accepted_types = accepted_types
+        self.asked_types: List[Type] = []
+
+    def try_parse(self, cls: Type) -> Optional[PyClass]:
+        self.asked_types.append(cls)
+        if cls not in self.accepted_types:
+            return None
+        return PyClass(name=cls.__name__, type=cls, fields=())
+
+
+def test_should_use_first_parser_accepting_the_class():
+    first_parser = RecordingParser([Other])
+    second_parser = RecordingParser([Base, Other])
+    dispatcher = ClassParserDispatcher([first_parser, second_parser])
+
+    assert dispatcher.try_parse(Base) == PyClass(name="Base", type=Base, fields=())
+    assert dispatcher.try_parse(Other) == PyClass(name="Other", type=Other, fields=())
+    assert first_parser.asked_types == [Base, Other]
+    assert second_parser.asked_types == [Base]
+
+
+def test_should_return_none_if_no_parser_accepts_the_class():
+    dispatcher = ClassParserDispatcher([RecordingParser([])])
+
+    assert dispatcher.try_parse(Base) is None
+
+
+def test_should_ask_parser_of_base_class_first():
+    first_parser = RecordingParser([])
+    second_parser = RecordingParser([Base, Child])
+    dispatcher = ClassParserDispatcher([first_parser, second_parser])
+    dispatcher.try_parse(Base)
+
+    dispatcher.try_parse(Child)
+
+    assert first_parser.asked_types == [Base]
+    assert second_parser.asked_types == [Base, Child]
+
+
+def test_should_fall_back_to_other_parsers_if_cached_parser_rejects_class():
+    first_parser = RecordingParser([Child])
+    second_parser = RecordingParser([Base])
+    dispatcher = ClassParserDispatcher([first_parser, second_parser])
+    dispatcher.try_parse(Base)
+
+    assert dispatcher.try_parse(Child) == PyClass(name="Child", type=Child, fields=())
+    assert second_parser.asked_types == [Base, Child]
@@ -1,3 +1,4 @@
+from dataclasses import dataclass
 from datetime import datetime
 from typing import (
     Type,
@@ -8,6 +9,8 @@ from typing import (
     Union,
     FrozenSet,
     DefaultDict,
+    Optional,
+    Generic,
 )
 from uuid import UUID
 
@@ -15,19 +18,48 @@ import pytest
 from ordered_set import OrderedSet
 
 from py_typescript_generator.model.model import Model
-from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model.py_class import PyClass, RootTaggedUnionInformation
+from py_typescript_generator.model.py_enum import PyEnum
 from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.model.type_dependency_graph import DependencyKind
 from py_typescript_generator.model_parser.class_parsers.abstract_class_parser import (
     AbstractClassParser,
 )
+from py_typescript_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py_typescript_generator.model_parser.parse_cache import ParseCache
 from py_typescript_generator.model_parser.model_parser import (
     ModelParser,
     NoParserForClassFoundException,
     IsNotAClassException,
     ModelParserSettings,
 )
+from py_typescript_generator.model_parser.parsed_types import ParsedTypes
+from py_typescript_generator.typing_utils.type_descriptor import (
+    TypeDescriptorCache,
+    TypeDescriptor,
+)
+from py_typescript_generator.typing_utils.type_filter import (
+    TypeFilter,
+    name_pattern,
+    module_prefix,
+)
 from tests.unittests.demo_parser_fixture import DemoParser
 from tests.unittests.fixture_classes import (
+    ClassWithClassWithEmptyClass,
+    ClassWithEmptyClass,
+    EmptyClass,
+    ClassWithDeepNestedGenerics,
+    ClassWithOptionalEmptyClass,
+    ClassWithInt,
+    FirstClassInCycle,
+    SecondClassInCycle,
+    SimpleIntEnum,
+    T,
+    ClassWithTaggedUnionDiscriminantMultipleChildren,
+    ClassWithTaggedUnionDiscriminantMultipleChildrenChild1,
+    ClassWithTaggedUnionDiscriminantMultipleChildrenChild2,
     ClassFixture,
     EnumFixture,
     PY_CLASS_FOR_CLASS_WITH_TAGGED_UNION_DISCRIMINANT_SINGLE_CHILD_CHILD,
@@ -583,3 +615,460 @@ class TestParseDiscriminantUnionClasses:
                 ]
             )
         )
+
+
+def test_parsing_again_should_include_tagged_union_children_defined_in_between():
+    @dataclass
+    class Root:
+        __json_type_info_attribute__ = "type"
+
+    @dataclass
+    class FirstChild(Root):
+        type = "FIRST"
+
+    model_parser = ModelParser([Root], [DataclassParser()], ModelParserSettings())
+    model_parser.parse()
+
+    @dataclass
+    class SecondChild(Root):
+        type = "SECOND"
+
+    model = model_parser.parse()
+
+    assert model.classes[-1].tagged_union_information == RootTaggedUnionInformation(
+        discriminant_attribute="type",
+        discriminant_literal="",
+        discriminant_literals=frozenset({"FIRST", "SECOND"}),
+        child_types=frozenset({FirstChild, SecondChild}),
+    )
+
+
+class CountingDemoParser(DemoParser):
+    def __init__(self):
+        self.parsed_classes: List[Type] = []
+
+    def try_parse(self, cls: Type) -> Optional[PyClass]:
+        self.parsed_classes.append(cls)
+        return super().try_parse(cls)
+
+
+def test_should_ask_parser_only_once_per_class():
+    parser = CountingDemoParser()
+    model_parser = ModelParser(
+        [ClassWithClassWithEmptyClass, ClassWithEmptyClass],
+        [parser],
+        ModelParserSettings(),
+    )
+
+    model_parser.parse()
+
+    assert parser.parsed_classes == [
+        ClassWithClassWithEmptyClass,
+        ClassWithEmptyClass,
+        EmptyClass,
+    ]
+
+
+def test_should_use_parse_cache_of_previous_run(tmp_path, simple_int_enum):
+    classes_to_parse = [ClassWithClassWithEmptyClass, simple_int_enum.cls]
+    parse_cache = ParseCache(tmp_path)
+    expected_model = ModelParser(
+        classes_to_parse,
+        [DemoParser()],
+        ModelParserSettings(),
+        parse_cache=parse_cache,
+    ).parse()
+    parse_cache.save()
+    parser = CountingDemoParser()
+
+    model = ModelParser(
+        classes_to_parse,
+        [parser],
+        ModelParserSettings(),
+        parse_cache=ParseCache(tmp_path),
+    ).parse()
+
+    assert model == expected_model
+    assert parser.parsed_classes == []
+
+
+class TestUpdate:
+    def test_should_reparse_changed_types_and_types_referencing_them(self):
+        parser = CountingDemoParser()
+        model_parser = ModelParser(
+            [ClassWithClassWithEmptyClass], [parser], ModelParserSettings()
+        )
+        previous_model = model_parser.parse()
+        parser.parsed_classes.clear()
+
+        model = model_parser.update(previous_model, [ClassWithEmptyClass])
+
+        assert model == previous_model
+        assert list(model.classes) == list(previous_model.classes)
+        assert parser.parsed_classes == [
+            ClassWithClassWithEmptyClass,
+            ClassWithEmptyClass,
+        ]
+
+    def test_should_not_reparse_anything_if_nothing_changed(self):
+        parser = CountingDemoParser()
+        model_parser = ModelParser(
+            [ClassWithClassWithEmptyClass], [parser], ModelParserSettings()
+        )
+        previous_model = model_parser.parse()
+        parser.parsed_classes.clear()
+
+        model = model_parser.update(previous_model, [])
+
+        assert model == previous_model
+        assert parser.parsed_classes == []
+
+    def test_should_drop_removed_root(self):
+        model_parser = ModelParser(
+            [ClassWithClassWithEmptyClass, EmptyClass],
+            [DemoParser()],
+            ModelParserSettings(),
+        )
+        previous_model = model_parser.parse()
+
+        model = model_parser.update(
+            previous_model, [], removed_types=[ClassWithClassWithEmptyClass]
+        )
+
+        assert [py_class.type for py_class in model.classes] == [EmptyClass]
+
+    def test_should_replace_root_with_changed_type_of_same_name(self):
+        @dataclass
+        class MyClass:
+            value: int
+
+        model_parser = ModelParser(
+            [MyClass], [DataclassParser()], ModelParserSettings()
+        )
+        previous_model = model_parser.parse()
+        old_class = MyClass
+
+        @dataclass  # type: ignore
+        class MyClass:  # noqa: F811
+            value: str
+
+        model = model_parser.update(previous_model, [MyClass])
+
+        assert MyClass is not old_class
+        assert model == Model.of_classes(
+            [
+                PyClass(
+                    name="MyClass",
+                    type=MyClass,
+                    fields=(PyField(name="value", type=str),),
+                )
+            ]
+        )
+
+    def test_should_update_tagged_union_root_with_new_child(self):
+        @dataclass
+        class Root:
+            __json_type_info_attribute__ = "type"
+
+        @dataclass
+        class FirstChild(Root):
+            type = "FIRST"
+
+        model_parser = ModelParser([Root], [DataclassParser()], ModelParserSettings())
+        previous_model = model_parser.parse()
+
+        @dataclass
+        class SecondChild(Root):
+            type = "SECOND"
+
+        model = model_parser.update(previous_model, [SecondChild])
+
+        assert [py_class.type for py_class in model.classes] == [
+            FirstChild,
+            SecondChild,
+            Root,
+        ]
+        root_information = model.classes[-1].tagged_union_information
+        assert isinstance(root_information, RootTaggedUnionInformation)
+        assert root_information.child_types == frozenset({FirstChild, SecondChild})
+
+    def test_should_not_visit_types_of_unchanged_subtrees(self):
+        class RecordingTypeDescriptorCache(TypeDescriptorCache):
+            def __init__(self) -> None:
+                super().__init__()
+                self.requested_types: List[Type] = []
+
+            def get(self, cls: Type) -> TypeDescriptor:
+                self.requested_types.append(cls)
+                return super().get(cls)
+
+        type_descriptors = RecordingTypeDescriptorCache()
+        model_parser = ModelParser(
+            [ClassWithClassWithEmptyClass, ClassWithInt],
+            [DemoParser()],
+            ModelParserSettings(),
+            type_descriptor_cache=type_descriptors,
+        )
+        previous_model = model_parser.parse()
+        type_descriptors.requested_types.clear()
+
+        model = model_parser.update(previous_model, [ClassWithInt])
+
+        assert model == previous_model
+        assert ClassWithEmptyClass not in type_descriptors.requested_types
+        assert EmptyClass not in type_descriptors.requested_types
+
+    def test_should_drop_types_no_longer_referenced(self):
+        @dataclass
+        class Referenced:
+            value: int
+
+        @dataclass
+        class MyClass:
+            referenced: Referenced
+
+        model_parser = ModelParser(
+            [MyClass], [DataclassParser()], ModelParserSettings()
+        )
+        previous_model = model_parser.parse()
+
+        @dataclass  # type: ignore
+        class MyClass:  # noqa: F811
+            value: int
+
+        model = model_parser.update(previous_model, [MyClass])
+
+        assert [py_class.type for py_class in model.classes] == [MyClass]
+        assert Referenced not in model.dependency_graph
+
+    def test_should_keep_types_of_unchanged_generic_roots(self):
+        @dataclass
+        class Item:
+            value: int
+
+        @dataclass
+        class Box(Generic[T]):
+            item: T
+
+        @dataclass
+        class Counter:
+            count: int
+
+        model_parser = ModelParser(
+            [Box[Item], Counter], [DataclassParser()], ModelParserSettings()
+        )
+        previous_model = model_parser.parse()
+
+        model = model_parser.update(previous_model, [Counter])
+
+        assert model == previous_model
+
+
+class TestIterParse:
+    def test_should_yield_types_in_model_order(
+        self,
+        class_with_tagged_union_discriminant_multiple_children_child_1: ClassFixture,
+        simple_int_enum: EnumFixture,
+    ) -> None:
+        classes_to_parse = [
+            class_with_tagged_union_discriminant_multiple_children_child_1.cls,
+            simple_int_enum.cls,
+            ClassWithClassWithEmptyClass,
+        ]
+        model = ModelParser(
+            classes_to_parse, [DemoParser()], ModelParserSettings()
+        ).parse()
+
+        parsed_types = list(
+            ModelParser(
+                classes_to_parse, [DemoParser()], ModelParserSettings()
+            ).iter_parse()
+        )
+
+        assert [x for x in parsed_types if isinstance(x, PyClass)] == list(
+            model.classes
+        )
+        assert [x for x in parsed_types if isinstance(x, PyEnum)] == list(model.enums)
+
+    def test_should_yield_types_before_parsing_is_finished(self):
+        parser = CountingDemoParser()
+        model_parser = ModelParser(
+            [EmptyClass, ClassWithClassWithEmptyClass], [parser], ModelParserSettings()
+        )
+
+        first_parsed_type = next(model_parser.iter_parse())
+
+        assert first_parsed_type == PyClass(
+            name="EmptyClass", type=EmptyClass, fields=()
+        )
+        assert parser.parsed_classes == [EmptyClass]
+        assert model_parser.frontier == [ClassWithClassWithEmptyClass]
+
+
+class TestDependencyGraph:
+    def test_should_record_field_dependencies_through_wrapping_types(self):
+        model = ModelParser(
+            [ClassWithDeepNestedGenerics, SimpleIntEnum, ClassWithOptionalEmptyClass],
+            [DemoParser()],
+            ModelParserSettings(),
+        ).parse()
+
+        graph = model.dependency_graph
+        assert graph.get_dependencies(ClassWithDeepNestedGenerics) == [EmptyClass]
+        assert graph.get_dependencies(ClassWithOptionalEmptyClass) == [EmptyClass]
+        assert graph.get_dependents(EmptyClass) == [
+            ClassWithDeepNestedGenerics,
+            ClassWithOptionalEmptyClass,
+        ]
+        assert graph.get_dependency_kinds(
+            ClassWithDeepNestedGenerics, EmptyClass
+        ) == frozenset({DependencyKind.FIELD})
+        assert SimpleIntEnum not in graph
+
+    def test_should_record_dependencies_of_cycles(self):
+        model = ModelParser(
+            [FirstClassInCycle], [DemoParser()], ModelParserSettings()
+        ).parse()
+
+        graph = model.dependency_graph
+        assert graph.get_dependencies(FirstClassInCycle) == [SecondClassInCycle]
+        assert graph.get_dependencies(SecondClassInCycle) == [FirstClassInCycle]
+
+    def test_should_record_override_as_dependency(self):
+        model = ModelParser(
+            [ClassWithEmptyClass],
+            [DemoParser()],
+            ModelParserSettings(type_mapping_overrides={EmptyClass: ClassWithInt}),
+        ).parse()
+
+        assert model.dependency_graph.get_dependencies(ClassWithEmptyClass) == [
+            ClassWithInt
+        ]
+
+    def test_should_record_generic_arguments(self):
+        @dataclass
+        class Box(Generic[T]):
+            item: T
+
+        class GenericAliasParser(AbstractClassParser):
+            def accepts_class(self, cls: Type) -> bool:
+                return True
+
+            def parse(self, cls: Type) -> PyClass:
+                if cls is Holder:
+                    return PyClass(
+                        name="Holder",
+                        type=Holder,
+                        fields=(PyField(name="box", type=List[Box[EmptyClass]]),),
+                    )
+                return PyClass(name=cls.__name__, type=cls, fields=())
+
+        class Holder:
+            pass
+
+        model = ModelParser(
+            [Holder], [GenericAliasParser()], ModelParserSettings()
+        ).parse()
+
+        graph = model.dependency_graph
+        assert graph.get_dependencies(Holder, DependencyKind.FIELD) == [Box]
+        assert graph.get_dependencies(Holder, DependencyKind.GENERIC_ARGUMENT) == [
+            EmptyClass
+        ]
+
+    def test_should_record_tagged_union_links(self):
+        root = ClassWithTaggedUnionDiscriminantMultipleChildren
+        child_1 = ClassWithTaggedUnionDiscriminantMultipleChildrenChild1
+        child_2 = ClassWithTaggedUnionDiscriminantMultipleChildrenChild2
+
+        model = ModelParser([root], [DemoParser()], ModelParserSettings()).parse()
+
+        graph = model.dependency_graph
+        assert graph.get_dependencies(root, DependencyKind.TAGGED_UNION_CHILD) == [
+            child_1,
+            child_2,
+        ]
+        assert graph.get_dependencies(child_1, DependencyKind.TAGGED_UNION_PARENT) == [
+            root
+        ]
+        assert graph.get_transitive_dependents([child_2]) == {root, child_1, child_2}
+
+    def test_should_not_record_dependencies_when_streaming(self):
+        parsed_types = ParsedTypes(retain_parsed_types=False)
+        model_parser = ModelParser(
+            [ClassWithClassWithEmptyClass], [DemoParser()], ModelParserSettings()
+        )
+
+        for _ in model_parser._iter_parse(parsed_types):
+            pass
+
+        assert len(parsed_types._dependency_graph) == 0
+
+
+class TestTypeFilter:
+    def test_should_not_traverse_excluded_types(self):
+        parser = CountingDemoParser()
+        model_parser = ModelParser(
+            [ClassWithClassWithEmptyClass],
+            [parser],
+            ModelParserSettings(
+                type_filter=TypeFilter(exclude=[name_pattern("*.ClassWithEmptyClass")])
+            ),
+        )
+
+        model = model_parser.parse()
+
+        assert [py_class.type for py_class in model.classes] == [
+            ClassWithClassWithEmptyClass
+        ]
+        assert parser.parsed_classes == [ClassWithClassWithEmptyClass]
+
+    def test_should_not_filter_terminal_types_with_include_rules(
+        self, class_with_empty_class_list: ClassFixture
+    ) -> None:
+        model = ModelParser(
+            [class_with_empty_class_list.cls],
+            [DemoParser()],
+            ModelParserSettings(
+                type_filter=TypeFilter(include=[module_prefix("tests.unittests")])
+            ),
+        ).parse()
+
+        assert [py_class.type for py_class in model.classes] == [
+            class_with_empty_class_list.cls,
+            EmptyClass,
+        ]
+
+    def test_should_skip_excluded_enums(self, simple_int_enum: EnumFixture) -> None:
+        model = ModelParser(
+            [simple_int_enum.cls],
+            [DemoParser()],
+            ModelParserSettings(
+                type_filter=TypeFilter(exclude=[name_pattern("*.SimpleIntEnum")])
+            ),
+        ).parse()
+
+        assert model == Model()
+
+    def test_should_not_include_excluded_tagged_union_children(self):
+        model = ModelParser(
+            [ClassWithTaggedUnionDiscriminantMultipleChildren],
+            [DemoParser()],
+            ModelParserSettings(
+                type_filter=TypeFilter(exclude=[name_pattern("*Child2")])
+            ),
+        ).parse()
+
+        root = model.classes[-1]
+        assert [py_class.type for py_class in model.classes] == [
+            ClassWithTaggedUnionDiscriminantMultipleChildrenChild1,
+            ClassWithTaggedUnionDiscriminantMultipleChildren,
+        ]
+        assert root.tagged_union_information == RootTaggedUnionInformation(
+            discriminant_attribute="type",
+            discriminant_literal="BASE",
+            discriminant_literals=frozenset({"BASE", "CHILD_1"}),
+            child_types=frozenset(
+                {ClassWithTaggedUnionDiscriminantMultipleChildrenChild1}
+            ),
+        )
@@ -0,0 +1,171 @@
+from dataclasses import dataclass
+
+from py_typescript_generator.model.model_object_table import ModelObjectTable
+from py_typescript_generator.model.type_dependency_graph import DependencyKind
+from py_typescript_generator.model_parser.model_parser import (
+    ModelParser,
+    ModelParserSettings,
+)
+from py_typescript_generator.model_parser.class_parsers.dataclass_parser import (
+    DataclassParser,
+)
+from py_typescript_generator.model_parser.class_parsers.default_parsers import (
+    create_default_parsers,
+)
+from py_typescript_generator.model_parser.parallel_model_parser import (
+    ParallelModelParser,
+    _ParseShard,
+    _parse_shard,
+)
+from py_typescript_generator.serialization.model_snapshot import ModelSnapshot
+from py_typescript_generator.serialization.type_reference_codec import (
+    TypeReferenceCodec,
+)
+from py_typescript_generator.typing_utils.type_filter import TypeFilter, name_pattern
+from tests.unittests.model_parser.shard_fixtures.first_shard import FirstRootClass
+from tests.unittests.model_parser.shard_fixtures.second_shard import (
+    SecondRootClass,
+    SharedClass,
+    SharedEnum,
+    TaggedUnionChild,
+)
+from tests.unittests.model_parser.shard_fixtures.union_root import TaggedUnionRoot
+
+ROOT_TYPES = [SecondRootClass, TaggedUnionRoot, FirstRootClass]
+
+
+def _parse_in_parallel(types, settings=None):
+    return ParallelModelParser(
+        types, settings or ModelParserSettings(), max_workers=2
+    ).parse()
+
+
+def _create_shard(cls, parsed_type_names):
+    return _ParseShard(
+        type_references=[TypeReferenceCodec().encode(cls)],
+        module=cls.__module__,
+        parsed_type_names=parsed_type_names,
+        modules=[cls.__module__],
+        settings=ModelParserSettings(),
+        parser_factory=create_default_parsers,
+    )
+
+
+def test_should_parse_same_types_as_model_parser():
+    model = _parse_in_parallel(ROOT_TYPES)
+
+    expected_model = ModelParser(
+        ROOT_TYPES, [DataclassParser()], ModelParserSettings()
+    ).parse()
+    assert set(model.classes) == set(expected_model.classes)
+    assert set(model.enums) == set(expected_model.enums)
+
+
+def test_should_keep_order_of_model_parser():
+    model = _parse_in_parallel(ROOT_TYPES)
+
+    expected_model = ModelParser(
+        ROOT_TYPES, [DataclassParser()], ModelParserSettings()
+    ).parse()
+    assert list(model.classes) == list(expected_model.classes)
+    assert list(model.enums) == list(expected_model.enums)
+    assert [py_enum.type for py_enum in model.enums] == [SharedEnum]
+
+
+def test_should_parse_types_of_other_modules_in_their_own_shard():
+    snapshot, foreign_type_references = _parse_shard(
+        _create_shard(FirstRootClass, parsed_type_names=frozenset())
+    )
+
+    model = ModelSnapshot(snapshot).to_model()
+    assert [py_class.type for py_class in model.classes] == [FirstRootClass]
+    assert foreign_type_references == [TypeReferenceCodec().encode(SharedClass)]
+
+
+def test_should_not_parse_types_parsed_by_other_shards_again():
+    shared_class_name = TypeReferenceCodec().encode(SharedClass)["ref"]
+
+    snapshot, foreign_type_references = _parse_shard(
+        _create_shard(SecondRootClass, parsed_type_names=frozenset({shared_class_name}))
+    )
+
+    model = ModelSnapshot(snapshot).to_model()
+    assert [py_class.type for py_class in model.classes] == [SecondRootClass]
+    assert foreign_type_references == []
+
+
+def test_should_share_fields_of_classes_parsed_in_workers():
+    model_object_table = ModelObjectTable()
+
+    model = ParallelModelParser(
+        ROOT_TYPES,
+        ModelParserSettings(),
+        max_workers=2,
+        model_object_table=model_object_table,
+    ).parse()
+
+    first_root_class, second_root_class = (
+        py_class
+        for py_class in model.classes
+        if py_class.type in (FirstRootClass, SecondRootClass)
+    )
+    assert first_root_class.fields[0] is second_root_class.fields[0]
+    assert model_object_table.field_dedup_ratio > 0
+
+
+def test_should_resolve_shared_types_once():
+    model = _parse_in_parallel(ROOT_TYPES)
+
+    shared_classes = [
+        py_class for py_class in model.classes if py_class.type is SharedClass
+    ]
+    assert len(shared_classes) == 1
+    assert set(model.dependency_graph.get_dependents(SharedClass)) == {
+        FirstRootClass,
+        SecondRootClass,
+    }
+    assert model.dependency_graph.get_dependency_kinds(
+        TaggedUnionRoot, TaggedUnionChild
+    ) == {DependencyKind.TAGGED_UNION_CHILD}
+
+
+def test_should_apply_settings_in_workers():
+    model = _parse_in_parallel(
+        ROOT_TYPES,
+        ModelParserSettings(type_filter=TypeFilter(exclude=[name_pattern("*Shared*")])),
+    )
+
+    assert [py_class.type for py_class in model.classes] == [
+        SecondRootClass,
+        TaggedUnionChild,
+        TaggedUnionRoot,
+        FirstRootClass,
+    ]
+    assert not model.enums
+
+
+def test_should_parse_types_which_can_not_be_referenced_by_name_in_process():
+    @dataclass
+    class LocalClass:
+        shared: SharedClass
+
+    model = _parse_in_parallel([FirstRootClass, SecondRootClass, LocalClass])
+
+    assert [py_class.type for py_class in model.classes] == [
+        FirstRootClass,
+        SharedClass,
+        SecondRootClass,
+        LocalClass,
+    ]
+
+
+def test_should_parse_in_process_if_settings_can_not_be_pickled():
+    model = _parse_in_parallel(
+        ROOT_TYPES,
+        ModelParserSettings(type_filter=TypeFilter(exclude=[lambda cls: False])),
+    )
+
+    expected_model = ModelParser(
+        ROOT_TYPES, [DataclassParser()], ModelParserSettings()
+    ).parse()
+    assert model == expected_model
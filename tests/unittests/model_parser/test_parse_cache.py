@@ -0,0 +1,157 @@
+import sys
+import textwrap
+from pathlib import Path
+from typing import List, Optional, Iterator, Tuple, Type, cast
+
+import pytest
+
+from py_typescript_generator.model.py_class import PyClass, TaggedUnionInformation
+from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.model_parser.parse_cache import ParseCache
+from tests.unittests.fixture_classes import (
+    ClassFixture,
+    EnumFixture,
+    EmptyClass,
+)
+
+
+@pytest.fixture
+def cached_module(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> Iterator[Tuple[Path, Type]]:
+    source_folder = tmp_path / "src"
+    source_folder.mkdir()
+    monkeypatch.syspath_prepend(str(source_folder))
+    module_file = source_folder / "parse_cache_fixture_module.py"
+    module_file.write_text(
+        textwrap.dedent(
+            """
+            class CachedClass:
+                pass
+            """
+        )
+    )
+    import parse_cache_fixture_module  # type: ignore
+
+    yield module_file, parse_cache_fixture_module.CachedClass
+    del sys.modules["parse_cache_fixture_module"]
+
+
+def test_should_return_cached_class(
+    tmp_path: Path, class_with_int: ClassFixture
+) -> None:
+    parse_cache = ParseCache(tmp_path)
+    parse_cache.add_class(class_with_int.py_class)
+    parse_cache.save()
+
+    reloaded_cache = ParseCache(tmp_path)
+
+    assert reloaded_cache.get_class(class_with_int.cls) == class_with_int.py_class
+    assert reloaded_cache.hits == 1
+
+
+def test_should_return_cached_aliases_and_tagged_union_information(
+    tmp_path: Path,
+) -> None:
+    py_class = PyClass(
+        name="EmptyClass",
+        type=EmptyClass,
+        fields=(PyField(name="some_value", type=int, alias="someValue"),),
+        tagged_union_information=TaggedUnionInformation(
+            discriminant_attribute="kind",
+            discriminant_literal="empty",
+            discriminant_attribute_is_alias=True,
+        ),
+    )
+    parse_cache = ParseCache(tmp_path)
+    parse_cache.add_class(py_class)
+    parse_cache.save()
+
+    cached_class = ParseCache(tmp_path).get_class(EmptyClass)
+
+    assert cached_class == py_class
+    assert cached_class.fields[0].alias == "someValue"  # type: ignore
+
+
+def test_should_return_cached_type_parameters(tmp_path: Path) -> None:
+    py_class = PyClass(
+        name="EmptyClass", type=EmptyClass, fields=(), type_parameters=("T",)
+    )
+    parse_cache = ParseCache(tmp_path)
+    parse_cache.add_class(py_class)
+    parse_cache.save()
+
+    cached_class = ParseCache(tmp_path).get_class(EmptyClass)
+
+    assert cached_class.type_parameters == ("T",)  # type: ignore
+
+
+def test_should_return_cached_enum(
+    tmp_path: Path, simple_int_enum: EnumFixture
+) -> None:
+    parse_cache = ParseCache(tmp_path)
+    parse_cache.add_enum(simple_int_enum.py_enum)
+    parse_cache.save()
+
+    assert ParseCache(tmp_path).get_enum(simple_int_enum.cls) == simple_int_enum.py_enum
+
+
+def test_should_miss_for_unknown_class(
+    tmp_path: Path, class_with_int: ClassFixture
+) -> None:
+    parse_cache = ParseCache(tmp_path)
+
+    assert parse_cache.get_class(class_with_int.cls) is None
+    assert parse_cache.misses == 1
+
+
+def test_should_not_cache_local_classes(tmp_path: Path) -> None:
+    class LocalClass:
+        pass
+
+    parse_cache = ParseCache(tmp_path)
+    parse_cache.add_class(PyClass(name="LocalClass", type=LocalClass, fields=()))
+
+    assert parse_cache.get_class(LocalClass) is None
+
+
+def test_should_miss_if_module_of_class_changed(
+    tmp_path: Path, cached_module: Tuple[Path, Type]
+) -> None:
+    module_file, cached_class = cached_module
+    parse_cache = ParseCache(tmp_path / "cache")
+    parse_cache.add_class(PyClass(name="CachedClass", type=cached_class, fields=()))
+    parse_cache.save()
+
+    module_file.write_text(module_file.read_text() + "\n# changed\n")
+
+    assert ParseCache(tmp_path / "cache").get_class(cached_class) is None
+
+
+def test_should_miss_if_module_of_field_type_changed(
+    tmp_path: Path, cached_module: Tuple[Path, Type]
+) -> None:
+    module_file, cached_class = cached_module
+    py_class = PyClass(
+        name="EmptyClass",
+        type=EmptyClass,
+        fields=(
+            PyField(name="value", type=cast(Type, Optional[List[cached_class]])),  # type: ignore[valid-type]
+        ),
+    )
+    parse_cache = ParseCache(tmp_path / "cache")
+    parse_cache.add_class(py_class)
+    parse_cache.save()
+    assert ParseCache(tmp_path / "cache").get_class(EmptyClass) == py_class
+
+    module_file.write_text(module_file.read_text() + "\n# changed\n")
+
+    assert ParseCache(tmp_path / "cache").get_class(EmptyClass) is None
+
+
+def test_should_ignore_corrupted_cache_file(
+    tmp_path: Path, class_with_int: ClassFixture
+) -> None:
+    (tmp_path / "model_parser_cache.json").write_text("{not json")
+
+    assert ParseCache(tmp_path).get_class(class_with_int.cls) is None
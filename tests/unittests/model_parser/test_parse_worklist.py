@@ -0,0 +1,61 @@
+from py_typescript_generator.model_parser.parse_worklist import (
+    ParseWorklist,
+    ParseTask,
+)
+from tests.unittests.fixture_classes import (
+    EmptyClass,
+    ClassWithInt,
+    ClassWithStr,
+    PY_CLASS_FOR_CLASS_WITH_INT,
+    PY_CLASS_FOR_CLASS_WITH_STR,
+)
+
+
+def test_new_worklist_should_be_empty():
+    worklist = ParseWorklist()
+
+    assert not worklist
+    assert worklist.frontier == []
+
+
+def test_scheduled_types_should_be_popped_in_scheduled_order():
+    worklist = ParseWorklist()
+
+    worklist.schedule_types([EmptyClass, ClassWithInt])
+
+    assert worklist.pop() == ParseTask.visit_type(EmptyClass)
+    assert worklist.pop() == ParseTask.visit_type(ClassWithInt)
+    assert not worklist
+
+
+def test_tasks_scheduled_later_should_be_processed_first():
+    worklist = ParseWorklist()
+    worklist.schedule_types([EmptyClass, ClassWithInt])
+    worklist.pop()
+
+    worklist.schedule(
+        [
+            ParseTask.visit_type(ClassWithStr),
+            ParseTask.finish_tagged_union_class(PY_CLASS_FOR_CLASS_WITH_STR),
+        ]
+    )
+
+    assert worklist.pop() == ParseTask.visit_type(ClassWithStr)
+    assert worklist.pop() == ParseTask.finish_tagged_union_class(
+        PY_CLASS_FOR_CLASS_WITH_STR
+    )
+    assert worklist.pop() == ParseTask.visit_type(ClassWithInt)
+
+
+def test_frontier_should_contain_only_types_to_visit_in_processing_order():
+    worklist = ParseWorklist()
+    worklist.schedule_types([EmptyClass])
+    worklist.schedule(
+        [
+            ParseTask.visit_type(ClassWithStr),
+            ParseTask.finish_tagged_union_class(PY_CLASS_FOR_CLASS_WITH_INT),
+        ]
+    )
+
+    assert worklist.frontier == [ClassWithStr, EmptyClass]
+    assert len(worklist) == 3
@@ -0,0 +1,99 @@
+import pytest
+from ordered_set import OrderedSet
+
+from py_typescript_generator.model.model import Model
+from py_typescript_generator.model_parser.parsed_types import (
+    ParsedTypes,
+    ModelNotRetainedException,
+)
+from tests.unittests.fixture_classes import (
+    ClassFixture,
+    EnumFixture,
+)
+
+
+def test_empty_parsed_types_should_produce_empty_model():
+    assert ParsedTypes().to_model() == Model()
+
+
+def test_should_contain_added_class(
+    empty_class: ClassFixture, class_with_int: ClassFixture
+) -> None:
+    parsed_types = ParsedTypes()
+
+    parsed_types.add_class(empty_class.py_class)
+
+    assert parsed_types.contains_class(empty_class.cls)
+    assert not parsed_types.contains_class(class_with_int.cls)
+    assert not parsed_types.contains_enum(empty_class.cls)
+
+
+def test_should_contain_added_enum(simple_int_enum: EnumFixture) -> None:
+    parsed_types = ParsedTypes()
+
+    parsed_types.add_enum(simple_int_enum.py_enum)
+
+    assert parsed_types.contains_enum(simple_int_enum.cls)
+    assert not parsed_types.contains_class(simple_int_enum.cls)
+    assert parsed_types.to_model() == Model(enums=OrderedSet([simple_int_enum.py_enum]))
+
+
+def test_should_keep_insertion_order(
+    empty_class: ClassFixture,
+    class_with_int: ClassFixture,
+    class_with_str: ClassFixture,
+) -> None:
+    parsed_types = ParsedTypes()
+
+    parsed_types.add_class(class_with_str.py_class)
+    parsed_types.add_class(empty_class.py_class)
+    parsed_types.add_class(class_with_int.py_class)
+
+    assert parsed_types.to_model() == Model.of_classes(
+        [class_with_str.py_class, empty_class.py_class, class_with_int.py_class]
+    )
+
+
+def test_moved_class_should_be_placed_at_the_end(
+    empty_class: ClassFixture,
+    class_with_int: ClassFixture,
+) -> None:
+    parsed_types = ParsedTypes()
+    parsed_types.add_class(class_with_int.py_class)
+    parsed_types.add_class(empty_class.py_class)
+
+    parsed_types.move_class_to_end(class_with_int.py_class)
+
+    assert parsed_types.to_model() == Model.of_classes(
+        [empty_class.py_class, class_with_int.py_class]
+    )
+
+
+def test_should_hand_out_finalized_types_once(
+    empty_class: ClassFixture,
+    class_with_int: ClassFixture,
+    simple_int_enum: EnumFixture,
+) -> None:
+    parsed_types = ParsedTypes()
+    parsed_types.add_class(class_with_int.py_class, is_final=False)
+    parsed_types.add_class(empty_class.py_class)
+    parsed_types.add_enum(simple_int_enum.py_enum)
+
+    assert parsed_types.pop_finalized() == [
+        empty_class.py_class,
+        simple_int_enum.py_enum,
+    ]
+    parsed_types.move_class_to_end(class_with_int.py_class)
+    assert parsed_types.pop_finalized() == [class_with_int.py_class]
+    assert parsed_types.pop_finalized() == []
+
+
+def test_should_not_create_model_if_types_are_not_retained(
+    empty_class: ClassFixture,
+) -> None:
+    parsed_types = ParsedTypes(retain_parsed_types=False)
+    parsed_types.add_class(empty_class.py_class)
+
+    assert parsed_types.contains_class(empty_class.cls)
+    with pytest.raises(ModelNotRetainedException):
+        parsed_types.to_model()
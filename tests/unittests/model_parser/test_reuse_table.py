@@ -0,0 +1,78 @@
+from typing import List, Optional
+
+from py_typescript_generator.model.model import Model
+from py_typescript_generator.model.py_class import PyClass, TaggedUnionInformation
+from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.model_parser.reuse_table import ReuseTable
+from py_typescript_generator.typing_utils.type_descriptor import TypeDescriptorCache
+from tests.unittests.fixture_classes import (
+    EmptyClass,
+    ClassWithEmptyClass,
+    ClassWithInt,
+    EnumFixture,
+)
+
+PY_CLASS_WITH_EMPTY_CLASS = PyClass(
+    name="ClassWithEmptyClass",
+    type=ClassWithEmptyClass,
+    fields=(PyField(name="value", type=Optional[List[EmptyClass]]),),  # type: ignore
+)
+PY_CLASS_FOR_EMPTY_CLASS = PyClass(name="EmptyClass", type=EmptyClass, fields=())
+
+
+def test_should_reuse_unchanged_classes(simple_int_enum: EnumFixture) -> None:
+    previous_model = Model.of_classes([PY_CLASS_WITH_EMPTY_CLASS])
+    previous_model.enums.add(simple_int_enum.py_enum)
+
+    reuse_table = ReuseTable.of_unchanged_types(
+        previous_model, [ClassWithInt], TypeDescriptorCache()
+    )
+
+    assert reuse_table.get_class(ClassWithEmptyClass) == PY_CLASS_WITH_EMPTY_CLASS
+    assert reuse_table.get_enum(simple_int_enum.cls) == simple_int_enum.py_enum
+
+
+def test_should_not_reuse_changed_classes_and_classes_referencing_them(
+    simple_int_enum: EnumFixture,
+) -> None:
+    previous_model = Model.of_classes(
+        [PY_CLASS_WITH_EMPTY_CLASS, PY_CLASS_FOR_EMPTY_CLASS]
+    )
+    previous_model.enums.add(simple_int_enum.py_enum)
+
+    reuse_table = ReuseTable.of_unchanged_types(
+        previous_model, [EmptyClass, simple_int_enum.cls], TypeDescriptorCache()
+    )
+
+    assert len(reuse_table) == 0
+
+
+def test_should_keep_tagged_union_information() -> None:
+    tagged_py_class = PY_CLASS_FOR_EMPTY_CLASS.with_tagged_union_information(
+        TaggedUnionInformation(
+            discriminant_attribute="type", discriminant_literal="EMPTY"
+        )
+    )
+    previous_model = Model.of_classes([tagged_py_class])
+
+    reuse_table = ReuseTable.of_unchanged_types(
+        previous_model, [], TypeDescriptorCache()
+    )
+
+    assert reuse_table.get_class(EmptyClass) == tagged_py_class
+
+
+def test_should_not_reuse_classes_with_changed_base_classes() -> None:
+    class Base:
+        pass
+
+    class Child(Base):
+        pass
+
+    previous_model = Model.of_classes([PyClass(name="Child", type=Child, fields=())])
+
+    reuse_table = ReuseTable.of_unchanged_types(
+        previous_model, [Base], TypeDescriptorCache()
+    )
+
+    assert len(reuse_table) == 0
@@ -0,0 +1,206 @@
+from enum import Enum
+from typing import Union
+
+import pytest
+from ordered_set import OrderedSet
+
+from py_typescript_generator.model.model import Model
+from py_typescript_generator.model.py_class import PyClass, TaggedUnionInformation
+from py_typescript_generator.model.py_enum import PyEnum, PyEnumValue
+from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.model.type_dependency_graph import DependencyKind
+from py_typescript_generator.model_parser.model_parser import (
+    ModelParser,
+    ModelParserSettings,
+)
+from py_typescript_generator.serialization.model_snapshot import (
+    ModelSnapshot,
+    UnsupportedEnumValueException,
+)
+from py_typescript_generator.serialization.snapshot_format import (
+    InvalidSnapshotException,
+)
+from py_typescript_generator.serialization.ts_model_snapshot import TsModelSnapshot
+from py_typescript_generator.serialization.type_reference_codec import (
+    TypeReferenceCodec,
+)
+from py_typescript_generator.typescript_model_compiler.typescript_model_compiler import (
+    TypescriptModelCompiler,
+    TypescriptModelCompilerSettings,
+)
+from tests.unittests.demo_parser_fixture import DemoParser
+from tests.unittests.fixture_classes import (
+    ClassWithClassWithEmptyClass,
+    ClassWithDeepNestedGenerics,
+    ClassWithTaggedUnionDiscriminantMultipleChildren,
+    ClassWithEmptyClass,
+    EmptyClass,
+    SimpleIntEnum,
+)
+
+
+def parse_model() -> Model:
+    return ModelParser(
+        [
+            ClassWithClassWithEmptyClass,
+            ClassWithDeepNestedGenerics,
+            ClassWithTaggedUnionDiscriminantMultipleChildren,
+            SimpleIntEnum,
+        ],
+        [DemoParser()],
+        ModelParserSettings(),
+    ).parse()
+
+
+def test_should_load_dumped_model():
+    model = parse_model()
+
+    loaded_model = ModelSnapshot(ModelSnapshot.dump(model)).to_model()
+
+    assert loaded_model == model
+    assert list(loaded_model.classes) == list(model.classes)
+    assert [py_class.tagged_union_information for py_class in loaded_model.classes] == [
+        py_class.tagged_union_information for py_class in model.classes
+    ]
+
+
+def test_should_load_field_aliases():
+    model = Model.of_classes(
+        [
+            PyClass(
+                name="EmptyClass",
+                type=EmptyClass,
+                fields=(
+                    PyField(name="some_value", type=int, alias="someValue"),
+                    PyField(name="other_value", type=int),
+                ),
+            )
+        ]
+    )
+
+    loaded_model = ModelSnapshot(ModelSnapshot.dump(model)).to_model()
+
+    assert [field.alias for field in loaded_model.classes[0].fields] == [
+        "someValue",
+        None,
+    ]
+
+
+def test_should_load_discriminant_alias() -> None:
+    tagged_union_information = TaggedUnionInformation(
+        discriminant_attribute="pet_kind",
+        discriminant_literal="cat",
+        discriminant_attribute_is_alias=True,
+    )
+    model = Model.of_classes(
+        [
+            PyClass(
+                name="EmptyClass",
+                type=EmptyClass,
+                fields=(),
+                tagged_union_information=tagged_union_information,
+            )
+        ]
+    )
+
+    loaded_model = ModelSnapshot(ModelSnapshot.dump(model)).to_model()
+
+    assert loaded_model.classes[0].tagged_union_information == (
+        tagged_union_information
+    )
+
+
+def test_should_load_type_parameters():
+    model = Model.of_classes(
+        [
+            PyClass(
+                name="EmptyClass",
+                type=EmptyClass,
+                fields=(),
+                type_parameters=("K", "V"),
+            )
+        ]
+    )
+
+    loaded_model = ModelSnapshot(ModelSnapshot.dump(model)).to_model()
+
+    assert loaded_model.classes[0].type_parameters == ("K", "V")
+
+
+def test_should_keep_member_order_of_equal_unions():
+    model = Model.of_classes(
+        [
+            PyClass(
+                name="EmptyClass",
+                type=EmptyClass,
+                fields=(
+                    PyField(name="first", type=Union[int, str]),
+                    PyField(name="second", type=Union[str, int]),
+                ),
+            )
+        ]
+    )
+
+    loaded_model = ModelSnapshot(ModelSnapshot.dump(model)).to_model()
+
+    assert [field.type.__args__ for field in loaded_model.classes[0].fields] == [
+        (int, str),
+        (str, int),
+    ]
+
+
+def test_should_load_dependency_graph():
+    model = parse_model()
+
+    graph = ModelSnapshot(ModelSnapshot.dump(model)).dependency_graph
+
+    assert list(graph.iter_dependencies()) == list(
+        model.dependency_graph.iter_dependencies()
+    )
+    assert graph.get_dependents(EmptyClass, DependencyKind.FIELD) == [
+        ClassWithEmptyClass,
+        ClassWithDeepNestedGenerics,
+    ]
+
+
+def test_should_only_resolve_types_of_accessed_sections():
+    resolved_classes = []
+
+    class RecordingCodec(TypeReferenceCodec):
+        def decode(self, encoded):
+            cls = super().decode(encoded)
+            resolved_classes.append(cls)
+            return cls
+
+    snapshot = ModelSnapshot(ModelSnapshot.dump(parse_model()), RecordingCodec())
+
+    assert list(snapshot.enums) == list(parse_model().enums)
+    assert resolved_classes == [SimpleIntEnum]
+
+
+def test_should_fail_for_enum_values_which_are_not_json_literals():
+    class FloatEnum(Enum):
+        VALUE = 1.5
+
+    model = Model(
+        enums=OrderedSet(
+            [
+                PyEnum(
+                    name="FloatEnum",
+                    type=FloatEnum,
+                    values=(PyEnumValue("VALUE", 1.5),),
+                )
+            ]
+        )
+    )
+
+    with pytest.raises(UnsupportedEnumValueException):
+        ModelSnapshot.dump(model)
+
+
+def test_should_not_load_ts_model_snapshot_as_model():
+    model = parse_model()
+    ts_model = TypescriptModelCompiler(TypescriptModelCompilerSettings()).compile(model)
+
+    with pytest.raises(InvalidSnapshotException):
+        ModelSnapshot(TsModelSnapshot.dump(ts_model))
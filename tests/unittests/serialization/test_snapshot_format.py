@@ -0,0 +1,58 @@
+import pytest
+
+from py_typescript_generator.serialization.snapshot_format import (
+    SnapshotWriter,
+    SnapshotReader,
+    InvalidSnapshotException,
+)
+
+
+def create_snapshot() -> bytes:
+    writer = SnapshotWriter("Test")
+    writer.add_section("values", [writer.add_string("a"), writer.add_string("a")])
+    return writer.to_bytes()
+
+
+def test_should_read_written_sections_and_strings():
+    reader = SnapshotReader(create_snapshot(), "Test")
+
+    assert reader.get_section("values") == [0, 0]
+    assert reader.get_string(0) == "a"
+
+
+def test_should_fail_for_missing_section():
+    reader = SnapshotReader(create_snapshot(), "Test")
+
+    with pytest.raises(InvalidSnapshotException):
+        reader.get_section("other")
+
+
+@pytest.mark.parametrize(
+    "data",
+    [b"", b"not a snapshot at all, just some bytes", create_snapshot()[:-4]],
+)
+def test_should_fail_for_invalid_data(data):
+    with pytest.raises(InvalidSnapshotException):
+        SnapshotReader(data, "Test")
+
+
+def test_should_fail_for_other_kind():
+    with pytest.raises(InvalidSnapshotException):
+        SnapshotReader(create_snapshot(), "Other")
+
+
+def test_should_fail_for_other_version():
+    data = bytearray(create_snapshot())
+    data[8] = 99
+
+    with pytest.raises(InvalidSnapshotException):
+        SnapshotReader(bytes(data), "Test")
+
+
+def test_should_fail_for_corrupted_section():
+    data = bytearray(create_snapshot())
+    data[-3] ^= 0xFF
+    reader = SnapshotReader(bytes(data), "Test")
+
+    with pytest.raises(InvalidSnapshotException):
+        reader.get_section("values")
@@ -0,0 +1,123 @@
+from ordered_set import OrderedSet
+
+from py_typescript_generator.serialization.ts_model_snapshot import TsModelSnapshot
+from py_typescript_generator.typescript_model_compiler.ts_array import TsArray
+from py_typescript_generator.typescript_model_compiler.ts_enum import (
+    TsEnum,
+    TsEnumValue,
+)
+from py_typescript_generator.typescript_model_compiler.ts_field import TsField
+from py_typescript_generator.typescript_model_compiler.ts_generic_type import (
+    TsGenericType,
+)
+from py_typescript_generator.typescript_model_compiler.ts_interface import (
+    TsInterface,
+)
+from py_typescript_generator.typescript_model_compiler.ts_mapped_type import (
+    TsMappedType,
+)
+from py_typescript_generator.typescript_model_compiler.ts_model import TsModel
+from py_typescript_generator.typescript_model_compiler.ts_union_reference import (
+    TsUnionReference,
+)
+from py_typescript_generator.typescript_model_compiler.ts_object_type import (
+    TsObjectType,
+    TsDiscriminator,
+    TsUnionType,
+    TsTupleType,
+)
+from py_typescript_generator.typescript_model_compiler.ts_type import TsType
+from py_typescript_generator.typescript_model_compiler.well_known_types import (
+    TS_STRING,
+    TS_NUMBER,
+)
+
+TS_MODEL = TsModel(
+    types=OrderedSet(
+        [
+            TsObjectType(
+                name="Child",
+                fields=(
+                    TsField(name="names", type=TsArray(TS_STRING, is_optional=True)),
+                    TsField(name="values", type=TsMappedType(TS_NUMBER)),
+                    TsField(name="other", type=TsInterface("Other")),
+                    TsField(name="nested", type=TsArray(TsArray(TS_STRING))),
+                    TsField(name="number", type=TS_NUMBER),
+                ),
+                discriminator=TsDiscriminator(name="type", value="CHILD"),
+            ),
+            TsObjectType(
+                name="Page",
+                fields=(
+                    TsField(name="items", type=TsArray(TsType("T"))),
+                    TsField(
+                        name="next",
+                        type=TsGenericType("Page", (TsType("T"),), is_optional=True),
+                    ),
+                ),
+                type_parameters=("T",),
+            ),
+            TsUnionType(name="Root", union_members=("Child",)),
+            TsTupleType(
+                name="Point",
+                elements=(
+                    TsField(name="x", type=TS_NUMBER),
+                    TsField(name="label", type=TsInterface("Label", is_optional=True)),
+                ),
+            ),
+        ]
+    ),
+    enums=OrderedSet(
+        [
+            TsEnum(
+                name="Color",
+                values=(TsEnumValue("RED", "RED"), TsEnumValue("GREEN", 1)),
+            )
+        ]
+    ),
+)
+
+
+def test_should_load_dumped_ts_model():
+    loaded_ts_model = TsModelSnapshot(TsModelSnapshot.dump(TS_MODEL)).to_ts_model()
+
+    assert loaded_ts_model == TS_MODEL
+
+
+def test_should_keep_classes_of_ts_types():
+    loaded_ts_model = TsModelSnapshot(TsModelSnapshot.dump(TS_MODEL)).to_ts_model()
+
+    field_types = [field.type for field in loaded_ts_model.types[0].fields]
+    assert [type(field_type) for field_type in field_types] == [
+        TsArray,
+        TsMappedType,
+        TsInterface,
+        TsArray,
+        TsType,
+    ]
+    assert type(field_types[3].wrapped_type) is TsArray
+
+
+def test_should_keep_type_arguments_of_generic_types():
+    loaded_ts_model = TsModelSnapshot(TsModelSnapshot.dump(TS_MODEL)).to_ts_model()
+
+    page = loaded_ts_model.types[1]
+    next_type = page.fields[1].type  # type: ignore
+    assert page.type_parameters == ("T",)  # type: ignore
+    assert type(next_type) is TsGenericType
+    assert next_type.type_arguments == (TsType("T"),)
+
+
+def test_should_keep_members_of_union_references() -> None:
+    union_reference = TsUnionReference(
+        members=(TsType("Cat"), TsType('"dog"')), is_optional=True
+    )
+    ts_model = TsModel.of_types(
+        [TsObjectType(name="Owner", fields=(TsField("pet", union_reference),))]
+    )
+
+    loaded_ts_model = TsModelSnapshot(TsModelSnapshot.dump(ts_model)).to_ts_model()
+
+    loaded_type = loaded_ts_model.types[0].fields[0].type  # type: ignore
+    assert type(loaded_type) is TsUnionReference
+    assert loaded_type == union_reference
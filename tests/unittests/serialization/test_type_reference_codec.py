@@ -0,0 +1,64 @@
+import json
+from typing import List, Dict, Optional, Union, Literal, Tuple, TypeVar, DefaultDict
+
+import pytest
+from ordered_set import OrderedSet
+
+from py_typescript_generator.serialization.type_reference_codec import (
+    TypeReferenceCodec,
+    UnsupportedTypeReferenceException,
+)
+from tests.unittests.fixture_classes import EmptyClass, SimpleIntEnum
+
+T = TypeVar("T")
+
+
+@pytest.mark.parametrize(
+    "cls",
+    [
+        int,
+        type(None),
+        EmptyClass,
+        SimpleIntEnum,
+        T,
+        List,
+        List[int],
+        Dict[str, EmptyClass],
+        DefaultDict[str, int],
+        Optional[List[EmptyClass]],
+        Union[int, str],
+        Literal["a", 1],
+        Tuple[int, ...],
+        OrderedSet[int],
+        list[EmptyClass],
+        int | None,
+    ],
+)
+def test_should_decode_encoded_type_reference(cls):
+    codec = TypeReferenceCodec()
+
+    encoded = json.loads(json.dumps(codec.encode(cls)))
+
+    assert codec.decode(encoded) == cls
+
+
+def test_should_raise_exception_for_local_class():
+    class LocalClass:
+        pass
+
+    with pytest.raises(UnsupportedTypeReferenceException):
+        TypeReferenceCodec().encode(List[LocalClass])
+
+
+def test_should_use_class_resolver_to_decode_classes():
+    codec = TypeReferenceCodec(class_resolver=lambda module, qualname: EmptyClass)
+
+    assert codec.decode(codec.encode(List[int])) == List[EmptyClass]
+
+
+def test_should_return_modules_of_type_reference():
+    codec = TypeReferenceCodec()
+
+    modules = codec.get_modules(codec.encode(Dict[str, List[EmptyClass]]))
+
+    assert modules == {"builtins", "tests.unittests.fixture_classes"}
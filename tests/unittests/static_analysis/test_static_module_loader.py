@@ -0,0 +1,193 @@
+import sys
+import textwrap
+from enum import Enum
+from pathlib import Path
+from typing import List, Dict, Optional
+
+import pytest
+
+from py_typescript_generator.static_analysis.static_class_definition import (
+    get_static_class_definition,
+    StaticClassDefinition,
+    StaticField,
+)
+from py_typescript_generator.static_analysis.static_module_loader import (
+    StaticModuleLoader,
+    StaticAnalysisException,
+)
+
+PACKAGE_SOURCES = {
+    "__init__.py": "",
+    "enums.py": """
+        from enum import Enum, auto
+
+        class Color(Enum):
+            RED = "RED"
+            GREEN = "GREEN"
+
+        class Number(Enum):
+            ONE = auto()
+            TWO = auto()
+    """,
+    "models.py": """
+        from __future__ import annotations
+
+        import not_installed_dependency
+        from dataclasses import dataclass, field
+        from typing import ClassVar, List, TYPE_CHECKING
+
+        from .enums import Color
+
+        if TYPE_CHECKING:
+            from static_fixture_package.other import Other
+
+        @dataclass
+        class Base:
+            __json_type_info_attribute__ = "kind"
+            kind = "BASE"
+            color: Color
+            counter: ClassVar[int] = 0
+
+        @dataclass
+        class Child(Base):
+            kind = Color.GREEN
+            others: List[Other] = field(default_factory=list)
+
+        class NotADataclass:
+            value: int
+    """,
+    "other.py": """
+        from dataclasses import dataclass
+
+        @dataclass
+        class Other:
+            value: int
+    """,
+    "assignments.py": """
+        import typing
+        from typing import Dict, Optional
+
+        from .other import Other
+
+        T = typing.TypeVar("T", bound=Other)
+        NAME = "name"
+        OTHER = Other
+        OPTIONAL_OTHERS = Dict[str, Optional[Other]]
+        CREATED_CLASS = type("CreatedClass", (), {})
+    """,
+    "calls.py": """
+        from types import new_class
+
+        Base = new_class("Base")
+
+        class Model(Base):
+            value: int
+    """,
+    "cyclic.py": """
+        class First(Second):
+            pass
+
+        class Second(First):
+            pass
+    """,
+}
+
+
+@pytest.fixture
+def source_root(tmp_path: Path) -> List[str]:
+    package_folder = tmp_path / "static_fixture_package"
+    package_folder.mkdir()
+    for file_name, source in PACKAGE_SOURCES.items():
+        (package_folder / file_name).write_text(textwrap.dedent(source))
+    return [str(tmp_path)]
+
+
+@pytest.fixture
+def loader(source_root: List[str]) -> StaticModuleLoader:
+    return StaticModuleLoader(["static_fixture_package"], search_path=source_root)
+
+
+def test_should_load_classes_without_importing_module(loader):
+    classes = loader.load_classes("static_fixture_package.models")
+
+    assert [cls.__name__ for cls in classes] == ["Base", "Child", "NotADataclass"]
+    assert "static_fixture_package" not in sys.modules
+    assert "static_fixture_package.models" not in sys.modules
+
+
+def test_should_record_static_class_definition(loader):
+    base, child, not_a_dataclass = loader.load_classes("static_fixture_package.models")
+
+    assert get_static_class_definition(base) == StaticClassDefinition(
+        module="static_fixture_package.models",
+        qualname="Base",
+        is_dataclass=True,
+        fields=(StaticField(name="color", annotation="Color"),),
+    )
+    assert get_static_class_definition(child) == StaticClassDefinition(
+        module="static_fixture_package.models",
+        qualname="Child",
+        is_dataclass=True,
+        fields=(StaticField(name="others", annotation="List[Other]"),),
+    )
+    assert not get_static_class_definition(not_a_dataclass).is_dataclass  # type: ignore
+
+
+def test_should_keep_class_hierarchy_and_discriminator(loader):
+    base, child, _ = loader.load_classes("static_fixture_package.models")
+    color = loader.load_classes("static_fixture_package.enums")[0]
+
+    assert issubclass(child, base)
+    assert base.__subclasses__() == [child]
+    assert base.__json_type_info_attribute__ == "kind"
+    assert base.kind == "BASE"
+    assert child.kind == color.GREEN
+
+
+def test_should_create_enums(loader):
+    color, number = loader.load_classes("static_fixture_package.enums")
+
+    assert issubclass(color, Enum)
+    assert [(e.name, e.value) for e in color] == [("RED", "RED"), ("GREEN", "GREEN")]
+    assert [(e.name, e.value) for e in number] == [("ONE", 1), ("TWO", 2)]
+    assert get_static_class_definition(color) is None
+
+
+def test_should_resolve_names_across_modules(loader):
+    namespace = loader.get_namespace("static_fixture_package.models")
+
+    assert namespace["Other"] is loader.load_classes("static_fixture_package.other")[0]
+
+
+def test_should_not_resolve_unused_imports(loader):
+    loader.load_classes("static_fixture_package.models")
+
+    assert "not_installed_dependency" not in sys.modules
+
+
+def test_should_evaluate_module_level_assignments_without_calls(loader):
+    namespace = loader.get_namespace("static_fixture_package.assignments")
+    other = loader.load_classes("static_fixture_package.other")[0]
+
+    assert namespace["NAME"] == "name"
+    assert namespace["OTHER"] is other
+    assert namespace["OPTIONAL_OTHERS"] == Dict[str, Optional[other]]
+    assert namespace["T"].__name__ == "T"
+    assert namespace["T"].__bound__ is other
+    with pytest.raises(StaticAnalysisException):
+        namespace["CREATED_CLASS"]
+
+
+def test_should_raise_exception_for_base_classes_created_by_calls(loader):
+    with pytest.raises(StaticAnalysisException):
+        loader.load_classes("static_fixture_package.calls")
+
+
+def test_should_raise_exception_for_cyclic_base_classes(loader):
+    with pytest.raises(StaticAnalysisException):
+        loader.load_classes("static_fixture_package.cyclic")
+
+
+def test_should_raise_exception_for_module_without_source(loader):
+    with pytest.raises(StaticAnalysisException):
+        loader.load_classes("static_fixture_package.does_not_exist")
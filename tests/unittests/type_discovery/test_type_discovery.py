@@ -0,0 +1,107 @@
+import sys
+import textwrap
+from pathlib import Path
+from typing import List
+
+import pytest
+
+from py_typescript_generator.static_analysis.static_module_loader import (
+    StaticModuleLoader,
+)
+from py_typescript_generator.type_discovery.type_discovery import (
+    TypeDiscovery,
+    PackageNotFoundException,
+)
+
+PACKAGE_SOURCES = {
+    "__init__.py": "",
+    "models.py": """
+        from dataclasses import dataclass
+        from enum import Enum
+
+        class Color(Enum):
+            RED = "RED"
+
+        @dataclass
+        class MyDataclass:
+            color: Color
+
+        class NoDataclass:
+            pass
+
+        class TaggedUnionRoot:
+            __json_type_info_attribute__ = "type"
+
+        class TaggedUnionChild(TaggedUnionRoot):
+            type = "CHILD"
+    """,
+    "sub_package/__init__.py": "",
+    "sub_package/other_models.py": """
+        from dataclasses import dataclass
+        from ..models import MyDataclass
+
+        @dataclass
+        class OtherDataclass:
+            value: MyDataclass
+    """,
+}
+
+
+def create_package(tmp_path: Path, package_name: str) -> List[str]:
+    for file_name, source in PACKAGE_SOURCES.items():
+        file_path = tmp_path / package_name / file_name
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_text(textwrap.dedent(source))
+    return [str(tmp_path)]
+
+
+@pytest.fixture
+def importable_package(tmp_path, monkeypatch):
+    package_name = "discovery_fixture_package"
+    monkeypatch.syspath_prepend(str(tmp_path))
+    create_package(tmp_path, package_name)
+    yield package_name
+    for module_name in list(sys.modules):
+        if module_name.startswith(package_name):
+            del sys.modules[module_name]
+
+
+def test_should_discover_types_by_importing_modules(importable_package):
+    discovered_types = TypeDiscovery(max_workers=2).discover([importable_package])
+
+    assert [cls.__name__ for cls in discovered_types.types] == [
+        "Color",
+        "MyDataclass",
+        "TaggedUnionRoot",
+        "OtherDataclass",
+    ]
+    assert list(discovered_types.module_import_times) == [
+        "discovery_fixture_package",
+        "discovery_fixture_package.models",
+        "discovery_fixture_package.sub_package",
+        "discovery_fixture_package.sub_package.other_models",
+    ]
+
+
+def test_should_discover_types_without_importing_modules(tmp_path):
+    package_name = "static_discovery_fixture_package"
+    search_path = create_package(tmp_path, package_name)
+    loader = StaticModuleLoader([package_name], search_path)
+
+    discovered_types = TypeDiscovery(
+        static_module_loader=loader, search_path=search_path
+    ).discover([package_name])
+
+    assert [cls.__name__ for cls in discovered_types.types] == [
+        "Color",
+        "MyDataclass",
+        "TaggedUnionRoot",
+        "OtherDataclass",
+    ]
+    assert len(discovered_types.module_import_times) == 4
+    assert package_name not in sys.modules
+
+
+def test_should_raise_exception_for_unknown_package():
+    with pytest.raises(PackageNotFoundException):
+        TypeDiscovery().discover(["this_package_does_not_exist"])
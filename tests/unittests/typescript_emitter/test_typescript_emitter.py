@@ -8,6 +8,16 @@ from py_typescript_generator.typescript_model_compiler.ts_model import TsModel
 from py_typescript_generator.typescript_model_compiler.ts_object_type import (
     TsObjectType,
     TsBaseType,
+    TsTupleType,
+)
+from py_typescript_generator.typescript_model_compiler.ts_field import TsField
+from py_typescript_generator.typescript_model_compiler.ts_generic_type import (
+    TsGenericType,
+)
+from py_typescript_generator.typescript_model_compiler.ts_type import TsType
+from py_typescript_generator.typescript_model_compiler.well_known_types import (
+    TS_NUMBER,
+    TS_STRING,
 )
 from tests.unittests.fixture_classes import ClassFixture, EnumFixture
 
@@ -197,3 +207,48 @@ class TestEmitDiscriminantUnion:
 }
 """
         )
+
+
+def test_emit_tuple_type():
+    assert (
+        _emit_objects(
+            [
+                TsTupleType(
+                    name="Point",
+                    elements=(
+                        TsField(name="x", type=TS_NUMBER),
+                        TsField(name="label", type=TS_STRING.as_optional_type()),
+                    ),
+                )
+            ]
+        )
+        == "export type Point = [x: number, label: (string | undefined)];\n"
+    )
+
+
+def test_emit_generic_interface_and_reference():
+    assert _emit_objects(
+        [
+            TsObjectType(
+                name="Page",
+                fields=(TsField(name="item", type=TsType("T")),),
+                type_parameters=("K", "T"),
+            ),
+            TsObjectType(
+                name="Pages",
+                fields=(
+                    TsField(
+                        name="page",
+                        type=TsGenericType("Page", (TS_STRING, TS_NUMBER)),
+                    ),
+                ),
+            ),
+        ]
+    ) == (
+        "export interface Page<K, T> {\n"
+        "    item: T\n"
+        "}\n"
+        "export interface Pages {\n"
+        "    page: Page<string, number>\n"
+        "}\n"
+    )
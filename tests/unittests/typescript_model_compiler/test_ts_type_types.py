@@ -1,11 +1,17 @@
 import pytest
 
 from py_typescript_generator.typescript_model_compiler.ts_array import TsArray
+from py_typescript_generator.typescript_model_compiler.ts_generic_type import (
+    TsGenericType,
+)
 from py_typescript_generator.typescript_model_compiler.ts_interface import TsInterface
 from py_typescript_generator.typescript_model_compiler.ts_mapped_type import (
     TsMappedType,
 )
 from py_typescript_generator.typescript_model_compiler.ts_type import TsType
+from py_typescript_generator.typescript_model_compiler.ts_union_reference import (
+    TsUnionReference,
+)
 from py_typescript_generator.typescript_model_compiler.well_known_types import (
     TS_STRING,
     TS_NUMBER,
@@ -32,6 +38,10 @@ class TestAsOptionalType:
                 TsMappedType(wrapped_type=TS_STRING, is_optional=False),
                 TsMappedType(wrapped_type=TS_STRING, is_optional=True),
             ),
+            (
+                TsGenericType("Page", (TS_STRING,), is_optional=False),
+                TsGenericType("Page", (TS_STRING,), is_optional=True),
+            ),
         ],
     )
     def test_non_optional_type_should_get_optional(self, ts_type_before, ts_type_after):
@@ -58,6 +68,10 @@ class TestAsOptionalType:
                 TsMappedType(wrapped_type=TS_STRING, is_optional=True),
                 TsMappedType(wrapped_type=TS_STRING, is_optional=True),
             ),
+            (
+                TsGenericType("Page", (TS_STRING,), is_optional=True),
+                TsGenericType("Page", (TS_STRING,), is_optional=True),
+            ),
         ],
     )
     def test_already_optional_type_should_stay_optional(
@@ -88,6 +102,10 @@ class TestAsNonOptionalType:
                 TsMappedType(wrapped_type=TS_STRING, is_optional=True),
                 TsMappedType(wrapped_type=TS_STRING, is_optional=False),
             ),
+            (
+                TsGenericType("Page", (TS_STRING,), is_optional=True),
+                TsGenericType("Page", (TS_STRING,), is_optional=False),
+            ),
         ],
     )
     def test_optional_type_should_get_non_optional(self, ts_type_before, ts_type_after):
@@ -114,6 +132,10 @@ class TestAsNonOptionalType:
                 TsMappedType(wrapped_type=TS_STRING, is_optional=False),
                 TsMappedType(wrapped_type=TS_STRING, is_optional=False),
             ),
+            (
+                TsGenericType("Page", (TS_STRING,), is_optional=False),
+                TsGenericType("Page", (TS_STRING,), is_optional=False),
+            ),
         ],
     )
     def test_already_non_optional_type_should_stay_non_optional(
@@ -144,6 +166,10 @@ class TestWithIsOptional:
                 TsMappedType(wrapped_type=TS_STRING, is_optional=False),
                 TsMappedType(wrapped_type=TS_STRING, is_optional=True),
             ),
+            (
+                TsGenericType("Page", (TS_STRING,), is_optional=False),
+                TsGenericType("Page", (TS_STRING,), is_optional=True),
+            ),
         ],
     )
     def test_should_create_optional_type(self, ts_type_before, ts_type_after):
@@ -170,6 +196,10 @@ class TestWithIsOptional:
                 TsMappedType(wrapped_type=TS_STRING, is_optional=True),
                 TsMappedType(wrapped_type=TS_STRING, is_optional=True),
             ),
+            (
+                TsGenericType("Page", (TS_STRING,), is_optional=True),
+                TsGenericType("Page", (TS_STRING,), is_optional=True),
+            ),
         ],
     )
     def test_already_optional_type_should_stay_optional(
@@ -250,6 +280,10 @@ class TestEqualsAndHash:
                 TsMappedType(wrapped_type=TS_STRING, is_optional=False),
                 TsMappedType(wrapped_type=TS_STRING, is_optional=False),
             ),
+            (
+                TsGenericType("Page", (TS_STRING,), is_optional=False),
+                TsGenericType("Page", (TS_STRING,), is_optional=False),
+            ),
         ],
     )
     def test_equal_ts_types_should_have_same_hash(self, ts_type1, ts_type2):
@@ -292,6 +326,14 @@ class TestEqualsAndHash:
                 TsMappedType(wrapped_type=TS_STRING, is_optional=False),
                 TsMappedType(wrapped_type=TS_STRING, is_optional=True),
             ),
+            (
+                TsGenericType("Page", (TS_STRING,), is_optional=False),
+                TsGenericType("Page", (TS_STRING,), is_optional=True),
+            ),
+            (
+                TsGenericType("Page", (TS_STRING,), is_optional=False),
+                TsGenericType("Page", (TS_NUMBER,), is_optional=False),
+            ),
         ],
     )
     def test_ts_types_with_not_equal_name_should_have_same_hash(
@@ -319,6 +361,25 @@ class TestEqualsAndHash:
             TsMappedType(TsType("TheType"), is_optional=True),
             "({[index: string]: TheType} | undefined)",
         ),
+        (
+            TsGenericType("Page", (TsType("TheType"), TsArray(TS_NUMBER))),
+            "Page<TheType, number[]>",
+        ),
+        (
+            TsGenericType(
+                "Page", (TsType("TheType", is_optional=True),), is_optional=True
+            ),
+            "(Page<(TheType | undefined)> | undefined)",
+        ),
+        (TsUnionReference((TsType("Cat"), TsType("Dog"))), "Cat | Dog"),
+        (
+            TsUnionReference((TsType("Cat"), TsType("Dog")), is_optional=True),
+            "(Cat | Dog | undefined)",
+        ),
+        (
+            TsArray(TsUnionReference((TsType("Cat"), TsType("Dog")))),
+            "(Cat | Dog)[]",
+        ),
     ],
 )
 def test_format_as_type_reference(ts_type: TsType, the_str: str) -> None:
@@ -1,30 +1,54 @@
 from enum import Enum
-from typing import Dict
+from typing import (
+    Dict,
+    NamedTuple,
+    Optional,
+    Generic,
+    TypeVar,
+    List,
+    Literal,
+    Union,
+    Type,
+)
 
 import pytest
 from ordered_set import OrderedSet
 
 from py_typescript_generator.model.model import Model
-from py_typescript_generator.model.py_class import PyClass
+from py_typescript_generator.model.py_class import PyClass, TaggedUnionInformation
 from py_typescript_generator.model.py_enum import PyEnum, PyEnumValue
 from py_typescript_generator.model.py_field import PyField
+from py_typescript_generator.typescript_model_compiler.ts_array import TsArray
 from py_typescript_generator.typescript_model_compiler.ts_field import TsField
+from py_typescript_generator.typescript_model_compiler.ts_generic_type import (
+    TsGenericType,
+)
 from py_typescript_generator.typescript_model_compiler.ts_model import TsModel
 from py_typescript_generator.typescript_model_compiler.ts_object_type import (
     TsObjectType,
     TsDiscriminator,
     TsUnionType,
+    TsTupleType,
 )
 from py_typescript_generator.typescript_model_compiler.ts_type import TsType
+from py_typescript_generator.typescript_model_compiler.ts_union_reference import (
+    TsUnionReference,
+)
 from py_typescript_generator.typescript_model_compiler.typescript_model_compiler import (
     TypescriptModelCompiler,
     UnsupportedKeyTypeForMappedType,
     UnsupportedEnumValue,
+    UnsupportedLiteralValue,
     TypescriptModelCompilerSettings,
     CaseFormat,
 )
-from py_typescript_generator.typescript_model_compiler.well_known_types import TS_STRING
-from tests.unittests.fixture_classes import ClassFixture, EnumFixture
+from py_typescript_generator.typescript_model_compiler.well_known_types import (
+    TS_STRING,
+    TS_ANY,
+    TS_NUMBER,
+)
+from py_typescript_generator.typing_utils.type_filter import TypeFilter, name_pattern
+from tests.unittests.fixture_classes import ClassFixture, EnumFixture, EmptyClass
 
 
 def _compile_py_class(py_class: PyClass) -> TsModel:
@@ -234,6 +258,204 @@ def test_should_convert_casing_to_camel_case(class_with_empty_class):
     )
 
 
+def test_should_use_field_alias_as_name():
+    class MyClass:
+        pass
+
+    model_compiler = TypescriptModelCompiler(
+        TypescriptModelCompilerSettings(field_case_format=CaseFormat.CAMEL_CASE)
+    )
+
+    ts_type = model_compiler.compile_class(
+        PyClass(
+            name="MyClass",
+            type=MyClass,
+            fields=(PyField(name="some_value", type=int, alias="SOME_VALUE"),),
+        )
+    )
+
+    assert ts_type == TsObjectType(
+        name="MyClass", fields=(TsField(name="SOME_VALUE", type=TsType("number")),)
+    )
+
+
+def test_should_share_equal_fields_of_different_classes():
+    class FirstClass:
+        pass
+
+    class SecondClass:
+        pass
+
+    model_compiler = TypescriptModelCompiler(TypescriptModelCompilerSettings())
+
+    first_type = model_compiler.compile_class(
+        PyClass(
+            name="FirstClass",
+            type=FirstClass,
+            fields=(PyField(name="value", type=int),),
+        )
+    )
+    second_type = model_compiler.compile_class(
+        PyClass(
+            name="SecondClass",
+            type=SecondClass,
+            fields=(PyField(name="value", type=int),),
+        )
+    )
+
+    assert first_type.fields[0] is second_type.fields[0]  # type: ignore
+    assert model_compiler.ts_field_dedup_ratio == 0.5
+
+
+def test_should_compile_named_tuple_to_tuple_type():
+    class Point(NamedTuple):
+        x: int
+        label: Optional[str]
+
+    model_compiler = TypescriptModelCompiler(TypescriptModelCompilerSettings())
+
+    ts_type = model_compiler.compile_class(
+        PyClass(
+            name="Point",
+            type=Point,
+            fields=(
+                PyField(name="x", type=int),
+                PyField(name="label", type=Optional[str]),
+            ),
+        )
+    )
+
+    assert ts_type == TsTupleType(
+        name="Point",
+        elements=(
+            TsField(name="x", type=TS_NUMBER),
+            TsField(name="label", type=TS_STRING.as_optional_type()),
+        ),
+    )
+
+
+def test_should_compile_generic_class_with_type_parameters():
+    T = TypeVar("T")
+
+    class Page(Generic[T]):
+        pass
+
+    model_compiler = TypescriptModelCompiler(TypescriptModelCompilerSettings())
+
+    ts_type = model_compiler.compile_class(
+        PyClass(
+            name="Page",
+            type=Page,
+            fields=(PyField(name="items", type=List[T]),),  # type: ignore
+            type_parameters=("T",),
+        )
+    )
+
+    assert ts_type == TsObjectType(
+        name="Page",
+        fields=(TsField(name="items", type=TsArray(TsType("T"))),),
+        type_parameters=("T",),
+    )
+
+
+def test_should_compile_instantiations_of_generic_classes_to_references():
+    T = TypeVar("T")
+
+    class Page(Generic[T]):
+        pass
+
+    class Item:
+        pass
+
+    class FirstClass:
+        pass
+
+    class SecondClass:
+        pass
+
+    model_compiler = TypescriptModelCompiler(TypescriptModelCompilerSettings())
+
+    first_type = model_compiler.compile_class(
+        PyClass(
+            name="FirstClass",
+            type=FirstClass,
+            fields=(
+                PyField(name="items", type=Page[Item]),
+                PyField(name="numbers", type=Optional[Page[int]]),
+            ),
+        )
+    )
+    second_type = model_compiler.compile_class(
+        PyClass(
+            name="SecondClass",
+            type=SecondClass,
+            fields=(PyField(name="other_items", type=Page[Item]),),
+        )
+    )
+
+    assert first_type == TsObjectType(
+        name="FirstClass",
+        fields=(
+            TsField(name="items", type=TsGenericType("Page", (TsType("Item"),))),
+            TsField(
+                name="numbers",
+                type=TsGenericType("Page", (TS_NUMBER,), is_optional=True),
+            ),
+        ),
+    )
+    assert second_type.fields[0].type is first_type.fields[0].type  # type: ignore
+    assert model_compiler.compile_cache_hits == 1
+
+
+def test_should_count_compile_cache_hits_and_misses():
+    class FirstClass:
+        pass
+
+    class SecondClass:
+        pass
+
+    model_compiler = TypescriptModelCompiler(TypescriptModelCompilerSettings())
+
+    model_compiler.compile_class(
+        PyClass(
+            name="FirstClass",
+            type=FirstClass,
+            fields=(PyField(name="values", type=List[int]),),
+        )
+    )
+    ts_type = model_compiler.compile_class(
+        PyClass(
+            name="SecondClass",
+            type=SecondClass,
+            fields=(
+                PyField(name="other_values", type=List[int]),
+                PyField(name="value", type=int),
+            ),
+        )
+    )
+
+    assert ts_type.fields[0].type == TsArray(TS_NUMBER)  # type: ignore
+    assert model_compiler.compile_cache_misses == 2
+    assert model_compiler.compile_cache_hits == 2
+
+
+def test_should_compile_without_cache():
+    class MyClass:
+        pass
+
+    model_compiler = TypescriptModelCompiler(
+        TypescriptModelCompilerSettings(compile_cache_size=0)
+    )
+    py_class = PyClass(
+        name="MyClass", type=MyClass, fields=(PyField(name="values", type=List[int]),)
+    )
+
+    assert model_compiler.compile_class(py_class) == TsObjectType(
+        name="MyClass", fields=(TsField(name="values", type=TsArray(TS_NUMBER)),)
+    )
+    assert model_compiler.compile_cache_hits == 0
+
+
 def test_type_with_override_should_compile_to_overriden_type(
     class_with_empty_class: ClassFixture, empty_class: ClassFixture
 ) -> None:
@@ -253,6 +475,103 @@ def test_type_with_override_should_compile_to_overriden_type(
     )
 
 
+def test_excluded_type_should_compile_to_any(
+    class_with_optional_empty_class: ClassFixture,
+    class_with_str_list: ClassFixture,
+) -> None:
+    model = Model.of_classes(
+        [class_with_optional_empty_class.py_class, class_with_str_list.py_class]
+    )
+    model_compiler = TypescriptModelCompiler(
+        TypescriptModelCompilerSettings(
+            type_filter=TypeFilter(include=[name_pattern("*.ClassWith*")])
+        )
+    )
+    ts_model = model_compiler.compile(model)
+
+    assert ts_model == TsModel.of_types(
+        [
+            TsObjectType(
+                name="ClassWithOptionalEmptyClass",
+                fields=(TsField(name="value", type=TS_ANY.with_is_optional(True)),),
+            ),
+            class_with_str_list.ts_object_type,
+        ]
+    )
+
+
+@pytest.mark.parametrize(
+    "field_type,ts_type",
+    [
+        (Literal["active"], TsType('"active"')),
+        (Literal[1], TsType("1")),
+        (
+            Optional[Literal["on", "off"]],
+            TsUnionReference((TsType('"on"'), TsType('"off"')), is_optional=True),
+        ),
+        (Union[int, str], TsUnionReference((TS_NUMBER, TS_STRING))),
+        (
+            Optional[Union[int, str]],
+            TsUnionReference((TS_NUMBER, TS_STRING), is_optional=True),
+        ),
+        (int | str, TsUnionReference((TS_NUMBER, TS_STRING))),
+        (str | None, TS_STRING.with_is_optional(True)),
+        (
+            int | str | None,
+            TsUnionReference((TS_NUMBER, TS_STRING), is_optional=True),
+        ),
+    ],
+)
+def test_should_compile_literals_and_unions(field_type: Type, ts_type: TsType) -> None:
+    ts_model = _compile_py_class(
+        PyClass(
+            name="MyClass",
+            type=EmptyClass,
+            fields=(PyField(name="value", type=field_type),),
+        )
+    )
+
+    assert ts_model.types[0].fields[0].type == ts_type  # type: ignore
+
+
+def test_should_keep_member_order_of_equal_unions() -> None:
+    model = Model.of_classes(
+        [
+            PyClass(
+                name="First",
+                type=EmptyClass,
+                fields=(PyField(name="value", type=Union[int, str]),),  # type: ignore
+            ),
+            PyClass(
+                name="Second",
+                type=EmptyClass,
+                fields=(PyField(name="value", type=Union[str, int]),),  # type: ignore
+            ),
+        ]
+    )
+
+    ts_model = TypescriptModelCompiler(TypescriptModelCompilerSettings()).compile(model)
+
+    first, second = ts_model.types
+    assert [ts_field.type for ts_field in first.fields] == [  # type: ignore
+        TsUnionReference((TS_NUMBER, TS_STRING))
+    ]
+    assert [ts_field.type for ts_field in second.fields] == [  # type: ignore
+        TsUnionReference((TS_STRING, TS_NUMBER))
+    ]
+
+
+def test_should_raise_exception_for_unsupported_literal_value() -> None:
+    with pytest.raises(UnsupportedLiteralValue):
+        _compile_py_class(
+            PyClass(
+                name="MyClass",
+                type=EmptyClass,
+                fields=(PyField(name="value", type=Literal[1.5]),),  # type: ignore
+            )
+        )
+
+
 class TestCompileTaggedUnion:
     def test_compile_tagged_union_child(
         self, class_with_tagged_union_discriminant_single_child_child
@@ -273,6 +592,39 @@ class TestCompileTaggedUnion:
             ]
         )
 
+    def test_should_not_convert_casing_of_discriminant_alias(self) -> None:
+        class Pet:
+            pass
+
+        model = Model.of_classes(
+            [
+                PyClass(
+                    name="Pet",
+                    type=Pet,
+                    fields=(),
+                    tagged_union_information=TaggedUnionInformation(
+                        discriminant_attribute="pet_kind",
+                        discriminant_literal="cat",
+                        discriminant_attribute_is_alias=True,
+                    ),
+                )
+            ]
+        )
+        model_compiler = TypescriptModelCompiler(
+            TypescriptModelCompilerSettings(field_case_format=CaseFormat.CAMEL_CASE)
+        )
+        ts_model = model_compiler.compile(model)
+
+        assert ts_model == TsModel.of_types(
+            [
+                TsObjectType(
+                    name="Pet",
+                    fields=(),
+                    discriminator=TsDiscriminator(name="pet_kind", value="cat"),
+                )
+            ]
+        )
+
     def test_compile_tagged_union_parent(
         self, class_with_tagged_union_discriminant_single_child
     ):
@@ -0,0 +1,42 @@
+from py_typescript_generator.typing_utils.hash_consing_table import HashConsingTable
+
+
+def test_should_return_added_values():
+    table: HashConsingTable[str, str] = HashConsingTable()
+
+    assert table.get("a") is None
+    value = table.add("a", "value")
+
+    assert table.get("a") is value
+    assert len(table) == 1
+
+
+def test_should_count_hits():
+    table: HashConsingTable[str, str] = HashConsingTable()
+    assert table.dedup_ratio == 0.0
+
+    table.get("a")
+    table.add("a", "value")
+    table.get("a")
+
+    assert table.lookups == 2
+    assert table.hits == 1
+    assert table.dedup_ratio == 0.5
+
+
+def test_should_not_store_unhashable_keys():
+    table: HashConsingTable[object, str] = HashConsingTable()
+
+    assert table.add([1], "value") == "value"  # type: ignore
+
+    assert table.get([1]) is None  # type: ignore
+    assert len(table) == 0
+
+
+def test_should_clear_values():
+    table: HashConsingTable[str, str] = HashConsingTable()
+    table.add("a", "value")
+
+    table.clear()
+
+    assert table.get("a") is None
@@ -0,0 +1,54 @@
+from py_typescript_generator.typing_utils.lru_cache import LruCache
+
+
+def test_should_return_added_values():
+    cache: LruCache[str, str] = LruCache(2)
+
+    assert cache.get("a") is None
+    value = cache.add("a", "value")
+
+    assert cache.get("a") is value
+    assert len(cache) == 1
+
+
+def test_should_count_hits_and_misses():
+    cache: LruCache[str, str] = LruCache(2)
+
+    cache.get("a")
+    cache.add("a", "value")
+    cache.get("a")
+
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_should_evict_least_recently_used_value():
+    cache: LruCache[str, str] = LruCache(2)
+    cache.add("a", "first")
+    cache.add("b", "second")
+    cache.get("a")
+
+    cache.add("c", "third")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "first"
+    assert cache.get("c") == "third"
+    assert len(cache) == 2
+
+
+def test_should_not_store_values_if_disabled():
+    cache: LruCache[str, str] = LruCache(0)
+
+    assert cache.add("a", "value") == "value"
+
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_should_not_store_unhashable_keys():
+    cache: LruCache[object, str] = LruCache(2)
+
+    assert cache.add([1], "value") == "value"  # type: ignore
+
+    assert cache.get([1]) is None  # type: ignore
+    assert len(cache) == 0
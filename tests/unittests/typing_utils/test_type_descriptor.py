@@ -0,0 +1,150 @@
+from enum import Enum
+from typing import List, Optional, Dict, TypeVar, Union, Generic, Literal
+from unittest import mock
+
+from py_typescript_generator.typing_utils import type_descriptor
+from py_typescript_generator.typing_utils.type_descriptor import (
+    TypeDescriptor,
+    TypeDescriptorCache,
+    TypeKind,
+)
+from tests.unittests.fixture_classes import EmptyClass
+
+T = TypeVar("T")
+
+
+def test_should_describe_scalar_type():
+    assert TypeDescriptor.of(int) == TypeDescriptor(
+        origin=None,
+        args=(),
+        is_optional=False,
+        is_terminal=True,
+        is_scalar=True,
+        kind=TypeKind.SCALAR,
+    )
+
+
+def test_should_describe_class():
+    assert TypeDescriptor.of(EmptyClass) == TypeDescriptor(
+        origin=None,
+        args=(),
+        is_optional=False,
+        is_terminal=False,
+        is_scalar=False,
+        kind=TypeKind.CLASS,
+    )
+
+
+def test_should_describe_generic_container():
+    assert TypeDescriptor.of(Dict[str, EmptyClass]) == TypeDescriptor(
+        origin=dict,
+        args=(str, EmptyClass),
+        is_optional=False,
+        is_terminal=True,
+        is_scalar=False,
+        kind=TypeKind.TERMINAL,
+    )
+
+
+def test_should_describe_optional():
+    descriptor = TypeDescriptor.of(Optional[List[int]])
+
+    assert descriptor.is_optional
+    assert descriptor.kind == TypeKind.OPTIONAL
+    assert descriptor.origin == Union
+    assert descriptor.wrapped_type == List[int]
+
+
+def test_should_wrap_all_members_of_optional_union() -> None:
+    descriptor = TypeDescriptor.of(Optional[Union[int, str]])  # type: ignore
+
+    assert descriptor.kind == TypeKind.OPTIONAL
+    assert descriptor.wrapped_type == Union[int, str]
+
+
+def test_should_describe_union_type_like_union() -> None:
+    descriptor = TypeDescriptor.of(int | str)  # type: ignore
+
+    assert descriptor.origin == Union
+    assert descriptor.args == (int, str)
+    assert descriptor.kind == TypeKind.TERMINAL
+
+
+def test_should_describe_optional_union_type() -> None:
+    descriptor = TypeDescriptor.of(EmptyClass | None)  # type: ignore
+
+    assert descriptor.is_optional
+    assert descriptor.kind == TypeKind.OPTIONAL
+    assert descriptor.wrapped_type == EmptyClass
+
+
+def test_should_classify_literal() -> None:
+    assert TypeDescriptor.of(Literal["active"]).kind == TypeKind.LITERAL  # type: ignore
+
+
+def test_should_describe_type_var_as_terminal():
+    assert TypeDescriptor.of(T).is_terminal
+    assert TypeDescriptor.of(T).kind == TypeKind.TERMINAL
+
+
+def test_should_classify_enum():
+    class Color(Enum):
+        RED = "RED"
+
+    assert TypeDescriptor.of(Color).kind == TypeKind.ENUM
+
+
+def test_should_classify_generic_class():
+    class Box(Generic[T]):
+        pass
+
+    assert TypeDescriptor.of(Box[int]).kind == TypeKind.GENERIC
+
+
+def test_should_classify_non_class_as_invalid():
+    assert TypeDescriptor.of(1).kind == TypeKind.INVALID
+
+
+def test_cache_should_build_descriptor_once_per_type():
+    cache = TypeDescriptorCache()
+
+    with mock.patch.object(
+        type_descriptor, "get_args", wraps=type_descriptor.get_args
+    ) as get_args:
+        first = cache.get(List[int])
+        second = cache.get(List[int])
+
+    assert first is second
+    assert get_args.call_count == 1
+    assert len(cache) == 1
+
+
+def test_cache_should_describe_union_types_without_caching() -> None:
+    cache = TypeDescriptorCache()
+
+    first = cache.get(int | None)  # type: ignore
+    second = cache.get(int | None)  # type: ignore
+
+    assert first == second
+    assert first.is_optional
+    assert len(cache) == 0
+
+
+def test_cache_should_keep_member_order_of_equal_unions() -> None:
+    cache = TypeDescriptorCache()
+
+    first = cache.get(Union[int, str])  # type: ignore
+    second = cache.get(Union[str, int])  # type: ignore
+
+    assert first.args == (int, str)
+    assert second.args == (str, int)
+
+
+def test_cache_should_describe_unhashable_types_without_caching():
+    cache = TypeDescriptorCache()
+    unhashable = [int]
+
+    descriptor = cache.get(unhashable)  # type: ignore
+
+    assert descriptor.args == ()
+    assert len(cache) == 0
@@ -0,0 +1,82 @@
+import pickle
+
+from py_typescript_generator.typing_utils.type_filter import (
+    TypeFilter,
+    module_prefix,
+    name_pattern,
+    has_marker,
+)
+from tests.unittests.fixture_classes import EmptyClass, ClassWithEmptyClass
+
+
+class MarkedClass:
+    __internal__ = True
+
+
+def test_module_prefix_should_match_module_and_sub_modules():
+    assert module_prefix("tests.unittests")(EmptyClass)
+    assert module_prefix("tests.unittests.fixture_classes")(EmptyClass)
+    assert not module_prefix("tests.unit")(EmptyClass)
+    assert not module_prefix("tests.unittests")(int)
+
+
+def test_name_pattern_should_match_qualified_name():
+    assert name_pattern("*.EmptyClass")(EmptyClass)
+    assert name_pattern("tests.unittests.fixture_classes.Class*")(ClassWithEmptyClass)
+    assert not name_pattern("*.Class*")(EmptyClass)
+
+
+def test_has_marker_should_match_classes_with_truthy_marker():
+    assert has_marker("__internal__")(MarkedClass)
+    assert not has_marker("__internal__")(EmptyClass)
+
+
+def test_empty_filter_should_exclude_nothing():
+    type_filter = TypeFilter()
+
+    assert not type_filter
+    assert not type_filter.is_excluded(EmptyClass)
+
+
+def test_should_exclude_types_matching_exclude_rule():
+    type_filter = TypeFilter(exclude=[has_marker("__internal__")])
+
+    assert type_filter.is_excluded(MarkedClass)
+    assert not type_filter.is_excluded(EmptyClass)
+
+
+def test_should_exclude_types_matching_no_include_rule():
+    type_filter = TypeFilter(include=[name_pattern("*.EmptyClass")])
+
+    assert not type_filter.is_excluded(EmptyClass)
+    assert type_filter.is_excluded(ClassWithEmptyClass)
+
+
+def test_exclude_rules_should_win_over_include_rules():
+    type_filter = TypeFilter(
+        include=[module_prefix("tests")], exclude=[name_pattern("*.EmptyClass")]
+    )
+
+    assert type_filter.is_excluded(EmptyClass)
+    assert not type_filter.is_excluded(ClassWithEmptyClass)
+
+
+def test_should_evaluate_unhashable_types():
+    type_filter = TypeFilter(exclude=[lambda cls: True])
+    unhashable = [int]
+
+    assert type_filter.is_excluded(unhashable)  # type: ignore
+
+
+def test_should_pickle_type_filter():
+    type_filter = TypeFilter(
+        include=[module_prefix("tests")],
+        exclude=[name_pattern("*.EmptyClass"), has_marker("__internal__")],
+    )
+    type_filter.is_excluded(EmptyClass)
+
+    unpickled_type_filter = pickle.loads(pickle.dumps(type_filter))
+
+    assert unpickled_type_filter.is_excluded(EmptyClass)
+    assert unpickled_type_filter.is_excluded(MarkedClass)
+    assert not unpickled_type_filter.is_excluded(ClassWithEmptyClass)
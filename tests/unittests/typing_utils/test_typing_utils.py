@@ -1,9 +1,53 @@
-from typing import Optional
+from typing import Optional, Generic, TypeVar, List, Dict
 
 from py_typescript_generator.typing_utils.typing_utils import (
     get_wrapped_type_from_optional,
+    get_type_parameters,
+    get_base_type_arguments,
+    bind_type_arguments,
 )
 
+K = TypeVar("K")
+V = TypeVar("V")
+
 
 def test_get_wrapped_type_from_optional():
     assert get_wrapped_type_from_optional(Optional[int]) == int
+
+
+def test_get_type_parameters():
+    class Base(Generic[K, V]):
+        pass
+
+    class Child(Base[str, V]):
+        pass
+
+    assert get_type_parameters(Base) == ("K", "V")
+    assert get_type_parameters(Child) == ("V",)
+    assert get_type_parameters(int) == ()
+
+
+def test_get_base_type_arguments():
+    class Base(Generic[K, V]):
+        pass
+
+    class Child(Base[str, V]):
+        pass
+
+    class GrandChild(Child[int]):
+        pass
+
+    assert get_base_type_arguments(GrandChild) == {
+        Child: {V: int},
+        Base: {K: str, V: int},
+    }
+    assert get_base_type_arguments(Base) == {}
+
+
+def test_bind_type_arguments():
+    assert bind_type_arguments(V, {V: int}) is int
+    assert bind_type_arguments(List[V], {V: int}) == List[int]
+    assert bind_type_arguments(Dict[K, V], {V: int}) == Dict[K, int]
+    assert bind_type_arguments(V | None, {V: int}) == Optional[int]
+    assert bind_type_arguments(List[V], {}) == List[V]
+    assert bind_type_arguments(str, {V: int}) is str
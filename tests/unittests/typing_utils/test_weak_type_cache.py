@@ -0,0 +1,59 @@
+import gc
+from typing import List
+
+from py_typescript_generator.typing_utils.weak_type_cache import WeakTypeCache
+
+
+def test_should_return_stored_values():
+    cache: WeakTypeCache[str] = WeakTypeCache()
+
+    cache.set(int, "int")
+    cache.set(List[int], "list")
+
+    assert cache.get(int) == "int"
+    assert cache.get(List[int]) == "list"
+    assert cache.get(str) is None
+    assert int in cache
+    assert len(cache) == 2
+
+
+def test_should_remove_values():
+    cache: WeakTypeCache[str] = WeakTypeCache()
+    cache.set(int, "int")
+
+    assert cache.pop(int) == "int"
+    assert cache.pop(int) is None
+    assert int not in cache
+
+
+def test_should_not_cache_types_which_can_not_be_weakly_referenced():
+    cache: WeakTypeCache[str] = WeakTypeCache()
+    union = int | None
+
+    cache.set(union, "union")
+
+    assert cache.get(union) is None
+    assert cache.pop(union) is None
+    assert union not in cache
+    assert len(cache) == 0
+
+
+def test_should_not_cache_unhashable_types():
+    cache: WeakTypeCache[str] = WeakTypeCache()
+
+    cache.set([int], "list")  # type: ignore
+
+    assert cache.get([int]) is None  # type: ignore
+    assert [int] not in cache
+    assert len(cache) == 0
+
+
+def test_should_drop_values_of_collected_types():
+    cache: WeakTypeCache[str] = WeakTypeCache()
+    cls = type("Temporary", (), {})
+    cache.set(cls, "temporary")
+
+    del cls
+    gc.collect()
+
+    assert len(cache) == 0